@@ -1,5 +1,5 @@
 from collections import OrderedDict, Iterable
-from copy import deepcopy
+from copy import copy
 from math import cos, sin, pi
 from numbers import Real, Integral
 from xml.etree import ElementTree as ET
@@ -13,10 +13,11 @@ import openmc
 import openmc.checkvalue as cv
 from openmc.surface import Halfspace
 from openmc.region import Region, Intersection, Complement
-from .mixin import IDManagerMixin
+from .mixin import (IDManagerMixin, ChangeNotifierMixin, _Dependent,
+                    _notifying_view, _unwrap)
 
 
-class Cell(IDManagerMixin):
+class Cell(IDManagerMixin, ChangeNotifierMixin):
     r"""A region of space defined as the intersection of half-space created by
     quadric surfaces.
 
@@ -45,7 +46,9 @@ class Cell(IDManagerMixin):
     fill_type : {'material', 'universe', 'lattice', 'distribmat', 'void'}
         Indicates what the cell is filled with.
     region : openmc.Region or None
-        Region of space that is assigned to the cell.
+        Region of space that is assigned to the cell. Points are tested against
+        a compiled form of the region (see :meth:`Region.compile`) which is
+        created when first needed and after the region is modified.
     rotation : Iterable of float
         If the cell is filled with a universe, this array specifies the angles
         in degrees about the x, y, and z axes that the filled universe should be
@@ -71,10 +74,12 @@ class Cell(IDManagerMixin):
     translation : Iterable of float
         If the cell is filled with a universe, this array specifies a vector
         that is used to translate (shift) the universe.
-    paths : list of str
+    paths : Sequence of str
         The paths traversed through the CSG tree to reach each cell
         instance. This property is initialized by calling the
-        :meth:`Geometry.determine_paths` method.
+        :meth:`Geometry.determine_paths` method. Each path is generated when
+        it is accessed, so the method must be called again after what fills
+        the cells, universes, or lattices of the geometry is modified.
     num_instances : int
         The number of instances of this cell throughout the geometry.
     volume : float
@@ -106,7 +111,22 @@ class Cell(IDManagerMixin):
         if self.region is None:
             return True
         else:
-            return point in self.region
+            return point in self._compiled_region()
+
+    def _contains_many(self, points, values):
+        if self.region is None:
+            return np.ones(len(points), dtype=bool)
+        else:
+            return self._compiled_region().contains(points, values)
+
+    def _compiled_region(self):
+        # The region is compiled the first time it is needed after it is set
+        # or any region it is composed of is modified
+        if self._compiled is None or not self._compiled[0].valid:
+            dependent = _Dependent(('region',))
+            self.region._add_dependent_to_nodes(dependent)
+            self._compiled = (dependent, self.region.compile())
+        return self._compiled[1]
 
     def __eq__(self, other):
         if not isinstance(other, Cell):
@@ -164,17 +184,19 @@ class Cell(IDManagerMixin):
 
     @property
     def fill(self):
-        return self._fill
+        # Materials of a distributed fill modified in place are seen by data
+        # derived from the cell
+        return _notifying_view(self._fill, self, 'content')
 
     @property
     def fill_type(self):
-        if isinstance(self.fill, openmc.Material):
+        if isinstance(self._fill, openmc.Material):
             return 'material'
-        elif isinstance(self.fill, openmc.Universe):
+        elif isinstance(self._fill, openmc.Universe):
             return 'universe'
-        elif isinstance(self.fill, openmc.Lattice):
+        elif isinstance(self._fill, openmc.Lattice):
             return 'lattice'
-        elif isinstance(self.fill, Iterable):
+        elif isinstance(self._fill, Iterable):
             return 'distribmat'
         else:
             return 'void'
@@ -233,9 +255,11 @@ class Cell(IDManagerMixin):
             self._name = name
         else:
             self._name = ''
+        self._changed('name')
 
     @fill.setter
     def fill(self, fill):
+        fill = _unwrap(fill)
         if fill is not None:
             if isinstance(fill, string_types):
                 if fill.strip().lower() != 'void':
@@ -256,6 +280,7 @@ class Cell(IDManagerMixin):
                 raise ValueError(msg)
 
         self._fill = fill
+        self._changed('content')
 
     @rotation.setter
     def rotation(self, rotation):
@@ -310,6 +335,8 @@ class Cell(IDManagerMixin):
         if region is not None:
             cv.check_type('cell region', region, Region)
         self._region = region
+        self._compiled = None
+        self._changed('region')
 
     @volume.setter
     def volume(self, volume):
@@ -489,12 +516,22 @@ class Cell(IDManagerMixin):
 
         return universes
 
-    def clone(self, memo=None):
+    def clone(self, clone_materials=True, clone_regions=True, memo=None):
         """Create a copy of this cell with a new unique ID, and clones
         the cell's region and fill.
 
         Parameters
         ----------
+        clone_materials : bool
+            Whether to create separate copies of the materials filling cells
+            contained in this cell, or the material filling this cell. If
+            False, the clone shares the materials of this cell.
+        clone_regions : bool
+            Whether to create separate copies of the regions bounding cells
+            contained in this cell, and the region bounding this cell. If
+            False, the clone shares the regions and their surfaces with this
+            cell. Assigning a new region to a shared cell only affects that
+            cell, but modifying a shared surface affects both.
         memo : dict or None
             A nested dictionary of previously cloned objects. This parameter
             is used internally and should not be specified by the user.
@@ -510,33 +547,82 @@ class Cell(IDManagerMixin):
             memo = {}
 
         # If no nemoize'd clone exists, instantiate one
-        if self not in memo:
-            # Temporarily remove paths
-            paths = self._paths
-            self._paths = None
-
-            clone = deepcopy(self)
+        if id(self) not in memo:
+            # Copy the attributes which are specific to this cell rather than
+            # everything it refers to, since the region and fill are replaced
+            clone = copy(self)
             clone.id = None
+            clone._paths = None
             clone._num_instances = None
-
-            # Restore paths on original instance
-            self._paths = paths
+            clone._rotation = copy(self._rotation)
+            clone._rotation_matrix = copy(self._rotation_matrix)
+            clone._temperature = copy(self._temperature)
+            clone._translation = copy(self._translation)
+            clone._atoms = copy(self._atoms)
 
             if self.region is not None:
-                clone.region = self.region.clone(memo)
+                if clone_regions:
+                    clone.region = self.region.clone(memo)
+                else:
+                    clone.region = self.region
             if self.fill is not None:
                 if self.fill_type == 'distribmat':
-                    clone.fill = [fill.clone(memo) if fill is not None else None
-                                  for fill in self.fill]
+                    if clone_materials:
+                        clone.fill = [fill.clone(memo) if fill is not None
+                                      else None for fill in self.fill]
+                    else:
+                        clone.fill = list(self.fill)
+                elif self.fill_type == 'material':
+                    if clone_materials:
+                        clone.fill = self.fill.clone(memo)
                 else:
-                    clone.fill = self.fill.clone(memo)
+                    clone.fill = self.fill.clone(clone_materials,
+                                                 clone_regions, memo)
 
             # Memoize the clone
-            memo[self] = clone
+            memo[id(self)] = clone
 
-        return memo[self]
+        return memo[id(self)]
 
     def create_xml_subelement(self, xml_element):
+        element = self._create_xml_element()
+
+        if self.fill_type in ('universe', 'lattice'):
+            self.fill.create_xml_subelement(xml_element)
+
+        if self.region is not None:
+            # Only surfaces that appear in a region are added to the geometry
+            # file, so the appropriate check is performed here. First we create
+            # a function which is called recursively to navigate through the CSG
+            # tree. When it reaches a leaf (a Halfspace), it creates a <surface>
+            # element for the corresponding surface if none has been created
+            # thus far.
+            def create_surface_elements(node, element):
+                if isinstance(node, Halfspace):
+                    path = "./surface[@id='{}']".format(node.surface.id)
+                    if xml_element.find(path) is None:
+                        xml_element.append(node.surface.to_xml_element())
+                elif isinstance(node, Complement):
+                    create_surface_elements(node.node, element)
+                else:
+                    for subnode in node:
+                        create_surface_elements(subnode, element)
+
+            # Call the recursive function from the top node
+            create_surface_elements(self.region, xml_element)
+
+        return element
+
+    def _create_xml_element(self):
+        """Return XML representation of the cell without the elements for its
+        fill or surfaces
+
+        Returns
+        -------
+        element : xml.etree.ElementTree.Element
+            XML element containing cell data
+
+        """
         element = ET.Element("cell")
         element.set("id", str(self.id))
 
@@ -555,7 +641,6 @@ class Cell(IDManagerMixin):
 
         elif self.fill_type in ('universe', 'lattice'):
             element.set("fill", str(self.fill.id))
-            self.fill.create_xml_subelement(xml_element)
 
         if self.region is not None:
             # Set the region attribute with the region specification
@@ -565,26 +650,6 @@ class Cell(IDManagerMixin):
             if len(region) > 0:
                 element.set("region", region)
 
-            # Only surfaces that appear in a region are added to the geometry
-            # file, so the appropriate check is performed here. First we create
-            # a function which is called recursively to navigate through the CSG
-            # tree. When it reaches a leaf (a Halfspace), it creates a <surface>
-            # element for the corresponding surface if none has been created
-            # thus far.
-            def create_surface_elements(node, element):
-                if isinstance(node, Halfspace):
-                    path = "./surface[@id='{}']".format(node.surface.id)
-                    if xml_element.find(path) is None:
-                        xml_element.append(node.surface.to_xml_element())
-                elif isinstance(node, Complement):
-                    create_surface_elements(node.node, element)
-                else:
-                    for subnode in node:
-                        create_surface_elements(subnode, element)
-
-            # Call the recursive function from the top node
-            create_surface_elements(self.region, xml_element)
-
         if self.temperature is not None:
             if isinstance(self.temperature, Iterable):
                 element.set("temperature", ' '.join(
@@ -10,6 +10,17 @@ import openmc.checkvalue as cv
 from openmc.data import NATURAL_ABUNDANCE, atomic_mass
 
 
+# Expanded abundances of elements, keyed by element name, percent type,
+# enrichment, and cross section library
+_ABUNDANCES = {}
+
+# Nuclides in cross_sections.xml files, keyed by path and modification time
+_LIBRARY_NUCLIDES = {}
+
+# Naturally-occurring nuclides of each element
+_NATURAL_NUCLIDES = {}
+
+
 class Element(object):
     """A natural element that auto-expands to add the isotopes of an element to
     a material in their natural abundance. Internally, the OpenMC Python API
@@ -126,133 +137,206 @@ class Element(object):
 
         """
 
-        # Get the nuclides present in nature
-        natural_nuclides = set()
-        for nuclide in sorted(NATURAL_ABUNDANCE.keys()):
-            if re.match(r'{}\d+'.format(self.name), nuclide):
-                natural_nuclides.add(nuclide)
-
-        # Create dict to store the expanded nuclides and abundances
-        abundances = OrderedDict()
-
         # If cross_sections is None, get the cross sections from the
         # OPENMC_CROSS_SECTIONS environment variable
         if cross_sections is None:
             cross_sections = os.environ.get('OPENMC_CROSS_SECTIONS')
 
-        # If a cross_sections library is present, check natural nuclides
-        # against the nuclides in the library
+        # Expand the element or look up a previous expansion with the same
+        # arguments and cross section library
+        library = None
         if cross_sections is not None:
+            library = (os.path.abspath(cross_sections),
+                       os.path.getmtime(cross_sections))
+        key = (self.name, percent_type, enrichment, library)
+        if key not in _ABUNDANCES:
+            _ABUNDANCES[key] = _expand_abundances(self.name, percent_type,
+                                                  enrichment, library)
+        abundances = _ABUNDANCES[key]
 
-            library_nuclides = set()
-            tree = ET.parse(cross_sections)
-            root = tree.getroot()
-            for child in root:
-                nuclide = child.attrib['materials']
-                if re.match(r'{}\d+'.format(self.name), nuclide) and \
-                   '_m' not in nuclide:
-                    library_nuclides.add(nuclide)
-
-            # Get a set of the mutual and absent nuclides. Convert to lists
-            # and sort to avoid different ordering between Python 2 and 3.
-            mutual_nuclides = natural_nuclides.intersection(library_nuclides)
-            absent_nuclides = natural_nuclides.difference(mutual_nuclides)
-            mutual_nuclides = sorted(list(mutual_nuclides))
-            absent_nuclides = sorted(list(absent_nuclides))
-
-            # If all natural nuclides are present in the library, expand element
-            # using all natural nuclides
-            if len(absent_nuclides) == 0:
-                for nuclide in mutual_nuclides:
-                    abundances[nuclide] = NATURAL_ABUNDANCE[nuclide]
-
-            # If no natural elements are present in the library, check if the
-            # 0 nuclide is present. If so, set the abundance to 1 for this
-            # nuclide. Else, raise an error.
-            elif len(mutual_nuclides) == 0:
-                nuclide_0 = self.name + '0'
-                if nuclide_0 in library_nuclides:
-                    abundances[nuclide_0] = 1.0
-                else:
-                    msg = 'Unable to expand element {0} because the cross '\
-                          'section library provided does not contain any of '\
-                          'the natural isotopes for that element.'\
-                          .format(self.name)
-                    raise ValueError(msg)
+        # Create a list of the isotopes in this element
+        isotopes = []
+        for nuclide, abundance in abundances:
+            nuc = openmc.Nuclide(nuclide)
+            nuc.scattering = self.scattering
+            isotopes.append((nuc, percent * abundance, percent_type))
 
-            # If some, but not all, natural nuclides are in the library, add
-            # the mutual nuclides. For the absent nuclides, add them based on
-            # our knowledge of the common cross section libraries
-            # (ENDF, JEFF, and JENDL)
-            else:
+        return isotopes
+
+
+def _natural_nuclides(name):
+    """Return the naturally-occurring nuclides of an element
+
+    Parameters
+    ----------
+    name : str
+        Chemical symbol of the element
+
+    Returns
+    -------
+    list of str
+        Sorted names of the naturally-occurring nuclides
+
+    """
+    if not _NATURAL_NUCLIDES:
+        for nuclide in sorted(NATURAL_ABUNDANCE.keys()):
+            element = re.match(r'[A-Za-z]+', nuclide).group()
+            _NATURAL_NUCLIDES.setdefault(element, []).append(nuclide)
+    return _NATURAL_NUCLIDES.get(name, [])
+
+
+def _library_nuclides(library):
+    """Return the nuclides in a cross_sections.xml file, parsing each file only
+    once until it is modified
 
-                # Add the mutual isotopes
-                for nuclide in mutual_nuclides:
-                    abundances[nuclide] = NATURAL_ABUNDANCE[nuclide]
-
-                # Adjust the abundances for the absent nuclides
-                for nuclide in absent_nuclides:
-
-                    if nuclide in ['O17', 'O18'] and 'O16' in mutual_nuclides:
-                        abundances['O16'] += NATURAL_ABUNDANCE[nuclide]
-                    elif nuclide == 'Ta180' and 'Ta181' in mutual_nuclides:
-                        abundances['Ta181'] += NATURAL_ABUNDANCE[nuclide]
-                    elif nuclide == 'W180' and 'W182' in mutual_nuclides:
-                        abundances['W182'] += NATURAL_ABUNDANCE[nuclide]
-                    else:
-                        msg = 'Unsure how to partition natural abundance of ' \
-                              'isotope {0} into other natural isotopes of ' \
-                              'this element that are present in the cross ' \
-                              'section library provided. Consider adding ' \
-                              'the isotopes of this element individually.'
-                        raise ValueError(msg)
-
-        # If a cross_section library is not present, expand the element into
-        # its natural nuclides
+    Parameters
+    ----------
+    library : tuple
+        Absolute path and modification time of the cross_sections.xml file
+
+    Returns
+    -------
+    list of str
+        Names of the nuclides in the cross section library
+
+    """
+    if library not in _LIBRARY_NUCLIDES:
+        root = ET.parse(library[0]).getroot()
+        _LIBRARY_NUCLIDES[library] = [child.attrib['materials']
+                                      for child in root]
+    return _LIBRARY_NUCLIDES[library]
+
+
+def _expand_abundances(name, percent_type, enrichment, library):
+    """Determine the nuclides and abundances a natural element expands into
+
+    Parameters
+    ----------
+    name : str
+        Chemical symbol of the element
+    percent_type : {'ao', 'wo'}
+        'ao' for atom fractions and 'wo' for weight fractions
+    enrichment : float or None
+        Enrichment for U235 in weight percent
+    library : tuple or None
+        Absolute path and modification time of the cross_sections.xml file
+
+    Returns
+    -------
+    tuple of tuple
+        Pairs of nuclide name and atom or weight fraction
+
+    """
+
+    # Get the nuclides present in nature
+    natural_nuclides = set(_natural_nuclides(name))
+
+    # Create dict to store the expanded nuclides and abundances
+    abundances = OrderedDict()
+
+    # If a cross_sections library is present, check natural nuclides
+    # against the nuclides in the library
+    if library is not None:
+
+        library_nuclides = set()
+        for nuclide in _library_nuclides(library):
+            if re.match(r'{}\d+'.format(name), nuclide) and \
+               '_m' not in nuclide:
+                library_nuclides.add(nuclide)
+
+        # Get a set of the mutual and absent nuclides. Convert to lists
+        # and sort to avoid different ordering between Python 2 and 3.
+        mutual_nuclides = natural_nuclides.intersection(library_nuclides)
+        absent_nuclides = natural_nuclides.difference(mutual_nuclides)
+        mutual_nuclides = sorted(list(mutual_nuclides))
+        absent_nuclides = sorted(list(absent_nuclides))
+
+        # If all natural nuclides are present in the library, expand element
+        # using all natural nuclides
+        if len(absent_nuclides) == 0:
+            for nuclide in mutual_nuclides:
+                abundances[nuclide] = NATURAL_ABUNDANCE[nuclide]
+
+        # If no natural elements are present in the library, check if the
+        # 0 nuclide is present. If so, set the abundance to 1 for this
+        # nuclide. Else, raise an error.
+        elif len(mutual_nuclides) == 0:
+            nuclide_0 = name + '0'
+            if nuclide_0 in library_nuclides:
+                abundances[nuclide_0] = 1.0
+            else:
+                msg = 'Unable to expand element {0} because the cross '\
+                      'section library provided does not contain any of '\
+                      'the natural isotopes for that element.'\
+                      .format(name)
+                raise ValueError(msg)
+
+        # If some, but not all, natural nuclides are in the library, add
+        # the mutual nuclides. For the absent nuclides, add them based on
+        # our knowledge of the common cross section libraries
+        # (ENDF, JEFF, and JENDL)
         else:
-            for nuclide in natural_nuclides:
+
+            # Add the mutual isotopes
+            for nuclide in mutual_nuclides:
                 abundances[nuclide] = NATURAL_ABUNDANCE[nuclide]
 
-        # Modify mole fractions if enrichment provided
-        if enrichment is not None:
+            # Adjust the abundances for the absent nuclides
+            for nuclide in absent_nuclides:
 
-            # Calculate the mass fractions of isotopes
-            abundances['U234'] = 0.008 * enrichment
-            abundances['U235'] = enrichment
-            abundances['U238'] = 100.0 - 1.008 * enrichment
+                if nuclide in ['O17', 'O18'] and 'O16' in mutual_nuclides:
+                    abundances['O16'] += NATURAL_ABUNDANCE[nuclide]
+                elif nuclide == 'Ta180' and 'Ta181' in mutual_nuclides:
+                    abundances['Ta181'] += NATURAL_ABUNDANCE[nuclide]
+                elif nuclide == 'W180' and 'W182' in mutual_nuclides:
+                    abundances['W182'] += NATURAL_ABUNDANCE[nuclide]
+                else:
+                    msg = 'Unsure how to partition natural abundance of ' \
+                          'isotope {0} into other natural isotopes of ' \
+                          'this element that are present in the cross ' \
+                          'section library provided. Consider adding ' \
+                          'the isotopes of this element individually.'
+                    raise ValueError(msg)
 
-            # Convert the mass fractions to mole fractions
-            for nuclide in abundances.keys():
-                abundances[nuclide] /= atomic_mass(nuclide)
+    # If a cross_section library is not present, expand the element into
+    # its natural nuclides
+    else:
+        for nuclide in sorted(natural_nuclides):
+            abundances[nuclide] = NATURAL_ABUNDANCE[nuclide]
 
-            # Normalize the mole fractions to one
-            sum_abundances = sum(abundances.values())
-            for nuclide in abundances.keys():
-                abundances[nuclide] /= sum_abundances
+    # Modify mole fractions if enrichment provided
+    if enrichment is not None:
 
-        # Compute the ratio of the nuclide atomic masses to the element
-        # atomic mass
-        if percent_type == 'wo':
+        # Calculate the mass fractions of isotopes
+        abundances['U234'] = 0.008 * enrichment
+        abundances['U235'] = enrichment
+        abundances['U238'] = 100.0 - 1.008 * enrichment
 
-            # Compute the element atomic mass
-            element_am = 0.
-            for nuclide in abundances.keys():
-                element_am += atomic_mass(nuclide) * abundances[nuclide]
+        # Convert the mass fractions to mole fractions
+        for nuclide in abundances.keys():
+            abundances[nuclide] /= atomic_mass(nuclide)
 
-            # Convert the molar fractions to mass fractions
-            for nuclide in abundances.keys():
-                abundances[nuclide] *= atomic_mass(nuclide) / element_am
+        # Normalize the mole fractions to one
+        sum_abundances = sum(abundances.values())
+        for nuclide in abundances.keys():
+            abundances[nuclide] /= sum_abundances
 
-            # Normalize the mass fractions to one
-            sum_abundances = sum(abundances.values())
-            for nuclide in abundances.keys():
-                abundances[nuclide] /= sum_abundances
+    # Compute the ratio of the nuclide atomic masses to the element
+    # atomic mass
+    if percent_type == 'wo':
 
-        # Create a list of the isotopes in this element
-        isotopes = []
-        for nuclide, abundance in abundances.items():
-            nuc = openmc.Nuclide(nuclide)
-            nuc.scattering = self.scattering
-            isotopes.append((nuc, percent * abundance, percent_type))
+        # Compute the element atomic mass
+        element_am = 0.
+        for nuclide in abundances.keys():
+            element_am += atomic_mass(nuclide) * abundances[nuclide]
 
-        return isotopes
+        # Convert the molar fractions to mass fractions
+        for nuclide in abundances.keys():
+            abundances[nuclide] *= atomic_mass(nuclide) / element_am
+
+        # Normalize the mass fractions to one
+        sum_abundances = sum(abundances.values())
+        for nuclide in abundances.keys():
+            abundances[nuclide] /= sum_abundances
+
+    return tuple(abundances.items())
@@ -27,6 +27,36 @@ _CURRENT_NAMES = {1:  'x-min out', 2:  'x-min in',
                   11: 'z-max out', 12: 'z-max in'}
 
 
+def _repeat_tile(values, repeat, size):
+    """Repeat each value and tile the result to a given size.
+
+    This is equivalent to ``np.tile(np.repeat(values, repeat), n)`` with ``n``
+    chosen to give ``size`` entries, but only allocates the final array. It is
+    used to map filter, nuclide and score bins onto the flattened tally data.
+
+    Parameters
+    ----------
+    values : Iterable
+        Values for each bin
+    repeat : Integral
+        Number of consecutive entries for each value
+    size : Integral
+        Total number of entries
+
+    Returns
+    -------
+    numpy.ndarray
+        Repeated and tiled values
+
+    """
+
+    values = np.asarray(values)
+    tile_factor = int(size) // (len(values) * int(repeat))
+    shape = (tile_factor, len(values), int(repeat)) + values.shape[1:]
+    values = np.reshape(values, (1, len(values), 1) + values.shape[1:])
+    return np.broadcast_to(values, shape).reshape((-1,) + shape[3:])
+
+
 class FilterMeta(ABCMeta):
     def __new__(cls, name, bases, namespace, **kwargs):
         # Check the class name.
@@ -362,6 +392,53 @@ class Filter(IDManagerMixin):
 
         return np.where(self.bins == filter_bin)[0][0]
 
+    def get_bin_indices(self, filter_bins):
+        """Returns the indices in the Filter for a sequence of bins.
+
+        This is a vectorized version of :meth:`Filter.get_bin_index` which
+        resolves all of the bins at once rather than one at a time.
+
+        Parameters
+        ----------
+        filter_bins : Iterable or numpy.ndarray
+            The bins to find the indices of, each in the format accepted by
+            :meth:`Filter.get_bin_index`. Mesh cell bins may be given as an
+            array with one (x,y) or (x,y,z) row per bin and energy bins as an
+            array with one (lower, upper) row per bin.
+
+        Returns
+        -------
+        numpy.ndarray
+             The indices in the Tally data array for the filter bins
+
+        Raises
+        ------
+        ValueError
+            If any of the bins is not one of the filter's bins
+
+        See also
+        --------
+        Filter.get_bin_index()
+
+        """
+
+        filter_bins = np.asarray(filter_bins)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        # Look up the first occurrence of each bin among the sorted unique bins
+        bins, first = np.unique(self.bins, return_index=True)
+        indices = np.searchsorted(bins, filter_bins)
+        indices = np.minimum(indices, len(bins) - 1)
+
+        missing = bins[indices] != filter_bins
+        if np.any(missing):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(filter_bins[missing][0])
+            raise ValueError(msg)
+
+        return first[indices]
+
     def get_bin(self, bin_index):
         """Returns the filter bin for some filter bin index.
 
@@ -444,9 +521,7 @@ class Filter(IDManagerMixin):
         # Initialize Pandas DataFrame
         df = pd.DataFrame()
 
-        filter_bins = np.repeat(self.bins, self.stride)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(self.bins, self.stride, data_size)
         df = pd.concat([df, pd.DataFrame(
             {self.short_name.lower(): filter_bins})])
 
@@ -697,9 +772,7 @@ class SurfaceFilter(Filter):
         # Initialize Pandas DataFrame
         df = pd.DataFrame()
 
-        filter_bins = np.repeat(self.bins, self.stride)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(self.bins, self.stride, data_size)
         filter_bins = [_CURRENT_NAMES[x] for x in filter_bins]
         df = pd.concat([df, pd.DataFrame(
             {self.short_name.lower(): filter_bins})])
@@ -801,6 +874,26 @@ class MeshFilter(Filter):
 
         return val
 
+    def get_bin_indices(self, filter_bins):
+        # Filter bins for a mesh are (x,y,z) rows with one-based cell indices.
+        # Convert all of them at once to flattened bins in the same C-order
+        # used by get_bin_index().
+        filter_bins = np.asarray(filter_bins, dtype=int)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        ndim = len(self.mesh.dimension)
+        filter_bins = np.reshape(filter_bins, (-1, filter_bins.shape[-1]))
+        filter_bins = filter_bins[:, :ndim]
+        try:
+            return np.ravel_multi_index(tuple((filter_bins - 1).T),
+                                        tuple(self.mesh.dimension))
+        except ValueError:
+            msg = 'Unable to get the bin indices for MeshFilter since some ' \
+                  'of the bins are outside of the mesh with dimension ' \
+                  '{0}'.format(self.mesh.dimension)
+            raise ValueError(msg)
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -809,17 +902,17 @@ class MeshFilter(Filter):
         # Construct 3-tuple of x,y,z cell indices for a 3D mesh
         if len(self.mesh.dimension) == 3:
             nx, ny, nz = self.mesh.dimension
-            x = bin_index / (ny * nz)
-            y = (bin_index - (x * ny * nz)) / nz
+            x = bin_index // (ny * nz)
+            y = (bin_index - (x * ny * nz)) // nz
             z = bin_index - (x * ny * nz) - (y * nz)
-            return (x, y, z)
+            return (x + 1, y + 1, z + 1)
 
         # Construct 2-tuple of x,y cell indices for a 2D mesh
         else:
             nx, ny = self.mesh.dimension
-            x = bin_index / ny
+            x = bin_index // ny
             y = bin_index - (x * ny)
-            return (x, y)
+            return (x + 1, y + 1)
 
     def get_pandas_dataframe(self, data_size, **kwargs):
         """Builds a Pandas DataFrame for the Filter's bins.
@@ -874,25 +967,19 @@ class MeshFilter(Filter):
         # Generate multi-index sub-column for x-axis
         filter_bins = np.arange(1, nx + 1)
         repeat_factor = ny * nz * self.stride
-        filter_bins = np.repeat(filter_bins, repeat_factor)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(filter_bins, repeat_factor, data_size)
         filter_dict[(mesh_key, 'x')] = filter_bins
 
         # Generate multi-index sub-column for y-axis
         filter_bins = np.arange(1, ny + 1)
         repeat_factor = nz * self.stride
-        filter_bins = np.repeat(filter_bins, repeat_factor)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(filter_bins, repeat_factor, data_size)
         filter_dict[(mesh_key, 'y')] = filter_bins
 
         # Generate multi-index sub-column for z-axis
         filter_bins = np.arange(1, nz + 1)
         repeat_factor = self.stride
-        filter_bins = np.repeat(filter_bins, repeat_factor)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(filter_bins, repeat_factor, data_size)
         filter_dict[(mesh_key, 'z')] = filter_bins
 
         # Initialize a Pandas DataFrame from the mesh dictionary
@@ -1003,6 +1090,15 @@ class RealFilter(Filter):
         else:
             return i[0] - 1
 
+    def get_bin_indices(self, filter_bins):
+        # Use the upper bound of each bin to find the bin indices
+        filter_bins = np.asarray(filter_bins)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        upper = np.reshape(filter_bins, (-1, 2))[:, 1]
+        return super(RealFilter, self).get_bin_indices(upper) - 1
+
     def get_bin(self, bin_index):
         cv.check_type('bin_index', bin_index, Integral)
         cv.check_greater_than('bin_index', bin_index, 0, equality=True)
@@ -1047,6 +1143,33 @@ class EnergyFilter(RealFilter):
                   'is not one of the bins'.format(filter_bin)
             raise ValueError(msg)
 
+    def get_bin_indices(self, filter_bins):
+        # Use lower energy bound to find index for RealFilters
+        filter_bins = np.asarray(filter_bins, dtype=float)
+        if filter_bins.size == 0:
+            return np.zeros(0, dtype=int)
+
+        upper = np.reshape(filter_bins, (-1, 2))[:, 1]
+
+        # Find the nearest bin edge to each upper energy among the two edges
+        # surrounding it in the sorted energy grid
+        edges = np.asarray(self.bins, dtype=float)
+        right = np.clip(np.searchsorted(edges, upper), 1, len(edges) - 1)
+        left = right - 1
+        left_deltas = np.abs(edges[left] - upper) / upper
+        right_deltas = np.abs(edges[right] - upper) / upper
+        nearest = np.where(left_deltas <= right_deltas, left, right)
+        deltas = np.minimum(left_deltas, right_deltas)
+
+        missing = ~(deltas < 1E-3)
+        if np.any(missing):
+            msg = 'Unable to get the bin index for Filter since "{0}" ' \
+                  'is not one of the bins'.format(
+                      tuple(np.reshape(filter_bins, (-1, 2))[missing][0]))
+            raise ValueError(msg)
+
+        return nearest - 1
+
     def check_bins(self, bins):
         for edge in bins:
             if not isinstance(edge, Real):
@@ -1103,11 +1226,8 @@ class EnergyFilter(RealFilter):
 
         # Extract the lower and upper energy bounds, then repeat and tile
         # them as necessary to account for other filters.
-        lo_bins = np.repeat(self.bins[:-1], self.stride)
-        hi_bins = np.repeat(self.bins[1:], self.stride)
-        tile_factor = data_size // len(lo_bins)
-        lo_bins = np.tile(lo_bins, tile_factor)
-        hi_bins = np.tile(hi_bins, tile_factor)
+        lo_bins = _repeat_tile(self.bins[:-1], self.stride, data_size)
+        hi_bins = _repeat_tile(self.bins[1:], self.stride, data_size)
 
         # Add the new energy columns to the DataFrame.
         df.loc[:, self.short_name.lower() + ' low [eV]'] = lo_bins
@@ -1207,6 +1327,7 @@ class DistribcellFilter(Filter):
 
     def __init__(self, cell, filter_id=None):
         self._paths = None
+        self._path_levels = None
         super(DistribcellFilter, self).__init__(cell, filter_id)
 
     @classmethod
@@ -1251,8 +1372,61 @@ class DistribcellFilter(Filter):
 
     @paths.setter
     def paths(self, paths):
+        # Generate the paths once rather than accessing each one by index
+        paths = list(paths)
         cv.check_iterable_type('paths', paths, str)
         self._paths = paths
+        self._path_levels = None
+
+    def _get_path_levels(self):
+        """Decompose the distribcell paths into columns for each CSG level.
+
+        The decomposition is computed once and cached since it requires
+        parsing the path to every distribcell instance.
+
+        Returns
+        -------
+        collections.OrderedDict
+            Arrays with one entry per distribcell instance for the universe
+            and cell IDs or lattice ID and x,y,z indices at each level. The
+            keys are the Multi-index column keys for
+            :meth:`DistribcellFilter.get_pandas_dataframe`.
+
+        """
+
+        if getattr(self, '_path_levels', None) is not None:
+            return self._path_levels
+
+        paths = [_path_to_levels(p) for p in self.paths]
+
+        # Use the first distribcell path to determine the Multi-index column
+        # keys for each level and flatten every path into a row of IDs
+        keys = []
+        for i_level, level in enumerate(paths[0]):
+            level_key = 'level {}'.format(i_level + 1)
+            if level[0] == 'lattice':
+                keys.extend([(level_key, 'lat', 'id'), (level_key, 'lat', 'x'),
+                             (level_key, 'lat', 'y')])
+                if len(level[2]) == 3:
+                    keys.append((level_key, 'lat', 'z'))
+            else:
+                keys.extend([(level_key, 'univ', 'id'),
+                             (level_key, 'cell', 'id')])
+
+        rows = np.empty((len(paths), len(keys)))
+        for i, path in enumerate(paths):
+            row = []
+            for level in path:
+                if level[0] == 'lattice':
+                    row.append(level[1])
+                    row.extend(level[2])
+                else:
+                    row.extend(level[1:])
+            rows[i] = row
+
+        self._path_levels = OrderedDict(
+            (key, rows[:, j]) for j, key in enumerate(keys))
+        return self._path_levels
 
     def can_merge(self, other):
         # Distribcell filters cannot have more than one bin
@@ -1263,6 +1437,9 @@ class DistribcellFilter(Filter):
         # the Cell in the Geometry (consecutive integers starting at 0).
         return filter_bin
 
+    def get_bin_indices(self, filter_bins):
+        return np.asarray(filter_bins, dtype=int)
+
     def get_pandas_dataframe(self, data_size, **kwargs):
         """Builds a Pandas DataFrame for the Filter's bins.
 
@@ -1324,86 +1501,20 @@ class DistribcellFilter(Filter):
                       'the Summary is not linked to the StatePoint'
                 raise ValueError(msg)
 
-            # Make copy of array of distribcell paths to use in
-            # Pandas Multi-index column construction
-            num_offsets = len(self.paths)
-            paths = [_path_to_levels(p) for p in self.paths]
-
-            # Loop over CSG levels in the distribcell paths
-            num_levels = len(paths[0])
-            for i_level in range(num_levels):
-                # Use level key as first index in Pandas Multi-index column
-                level_key = 'level {}'.format(i_level + 1)
-
-                # Create a dictionary for this level for Pandas Multi-index
-                level_dict = OrderedDict()
-
-                # Use the first distribcell path to determine if level
-                # is a universe/cell or lattice level
-                path = paths[0]
-                if path[i_level][0] == 'lattice':
-                    # Initialize prefix Multi-index keys
-                    lat_id_key = (level_key, 'lat', 'id')
-                    lat_x_key = (level_key, 'lat', 'x')
-                    lat_y_key = (level_key, 'lat', 'y')
-                    lat_z_key = (level_key, 'lat', 'z')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[lat_id_key] = np.empty(num_offsets)
-                    level_dict[lat_x_key] = np.empty(num_offsets)
-                    level_dict[lat_y_key] = np.empty(num_offsets)
-                    if len(path[i_level][2]) == 3:
-                        level_dict[lat_z_key] = np.empty(num_offsets)
+            # Tile the cached Multi-index columns for each CSG level
+            level_dict = OrderedDict()
+            for level_key, level_bins in self._get_path_levels().items():
+                level_dict[level_key] = \
+                    _repeat_tile(level_bins, self.stride, data_size)
 
-                else:
-                    # Initialize prefix Multi-index keys
-                    univ_key = (level_key, 'univ', 'id')
-                    cell_key = (level_key, 'cell', 'id')
-
-                    # Allocate NumPy arrays for each CSG level and
-                    # each Multi-index column in the DataFrame
-                    level_dict[univ_key] = np.empty(num_offsets)
-                    level_dict[cell_key] = np.empty(num_offsets)
-
-                # Populate Multi-index arrays with all distribcell paths
-                for i, path in enumerate(paths):
-
-                    level = path[i_level]
-                    if level[0] == 'lattice':
-                        # Assign entry to Lattice Multi-index column
-                        level_dict[lat_id_key][i] = level[1]
-                        level_dict[lat_x_key][i] = level[2][0]
-                        level_dict[lat_y_key][i] = level[2][1]
-                        if len(level[2]) == 3:
-                            level_dict[lat_z_key][i] = level[2][2]
-
-                    else:
-                        # Assign entry to Universe, Cell Multi-index columns
-                        level_dict[univ_key][i] = level[1]
-                        level_dict[cell_key][i] = level[2]
-
-                # Tile the Multi-index columns
-                for level_key, level_bins in level_dict.items():
-                    level_bins = np.repeat(level_bins, self.stride)
-                    tile_factor = data_size // len(level_bins)
-                    level_bins = np.tile(level_bins, tile_factor)
-                    level_dict[level_key] = level_bins
-
-                # Initialize a Pandas DataFrame from the level dictionary
-                if level_df is None:
-                    level_df = pd.DataFrame(level_dict)
-                else:
-                    level_df = pd.concat([level_df, pd.DataFrame(level_dict)],
-                                         axis=1)
+            # Initialize a Pandas DataFrame from the level dictionary
+            level_df = pd.DataFrame(level_dict)
 
         # Create DataFrame column for distribcell instance IDs
         # NOTE: This is performed regardless of whether the user
         # requests Summary geometric information
         filter_bins = np.arange(self.num_bins)
-        filter_bins = np.repeat(filter_bins, self.stride)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile(filter_bins, self.stride, data_size)
         df = pd.DataFrame({self.short_name.lower() : filter_bins})
 
         # Concatenate with DataFrame of distribcell instance IDs
@@ -1507,11 +1618,8 @@ class MuFilter(RealFilter):
 
         # Extract the lower and upper energy bounds, then repeat and tile
         # them as necessary to account for other filters.
-        lo_bins = np.repeat(self.bins[:-1], self.stride)
-        hi_bins = np.repeat(self.bins[1:], self.stride)
-        tile_factor = data_size // len(lo_bins)
-        lo_bins = np.tile(lo_bins, tile_factor)
-        hi_bins = np.tile(hi_bins, tile_factor)
+        lo_bins = _repeat_tile(self.bins[:-1], self.stride, data_size)
+        hi_bins = _repeat_tile(self.bins[1:], self.stride, data_size)
 
         # Add the new energy columns to the DataFrame.
         df.loc[:, self.short_name.lower() + ' low'] = lo_bins
@@ -1612,11 +1720,8 @@ class PolarFilter(RealFilter):
 
         # Extract the lower and upper angle bounds, then repeat and tile
         # them as necessary to account for other filters.
-        lo_bins = np.repeat(self.bins[:-1], self.stride)
-        hi_bins = np.repeat(self.bins[1:], self.stride)
-        tile_factor = data_size // len(lo_bins)
-        lo_bins = np.tile(lo_bins, tile_factor)
-        hi_bins = np.tile(hi_bins, tile_factor)
+        lo_bins = _repeat_tile(self.bins[:-1], self.stride, data_size)
+        hi_bins = _repeat_tile(self.bins[1:], self.stride, data_size)
 
         # Add the new angle columns to the DataFrame.
         df.loc[:, 'polar low'] = lo_bins
@@ -1717,11 +1822,8 @@ class AzimuthalFilter(RealFilter):
 
         # Extract the lower and upper angle bounds, then repeat and tile
         # them as necessary to account for other filters.
-        lo_bins = np.repeat(self.bins[:-1], self.stride)
-        hi_bins = np.repeat(self.bins[1:], self.stride)
-        tile_factor = data_size // len(lo_bins)
-        lo_bins = np.tile(lo_bins, tile_factor)
-        hi_bins = np.tile(hi_bins, tile_factor)
+        lo_bins = _repeat_tile(self.bins[:-1], self.stride, data_size)
+        hi_bins = _repeat_tile(self.bins[1:], self.stride, data_size)
 
         # Add the new angle columns to the DataFrame.
         df.loc[:, 'azimuthal low'] = lo_bins
@@ -1969,6 +2071,9 @@ class EnergyFunctionFilter(Filter):
         # This filter only has one bin.  Always return 0.
         return 0
 
+    def get_bin_indices(self, filter_bins):
+        return np.zeros(len(filter_bins), dtype=int)
+
     def get_bin(self, bin_index):
         """This function is invalid for EnergyFunctionFilters."""
         raise RuntimeError('EnergyFunctionFilters have no get_bin() method')
@@ -2019,9 +2124,7 @@ class EnergyFunctionFilter(Filter):
         # hex characters) of the digest are probably sufficient.
         out = out[:14]
 
-        filter_bins = np.repeat(out, self.stride)
-        tile_factor = data_size // len(filter_bins)
-        filter_bins = np.tile(filter_bins, tile_factor)
+        filter_bins = _repeat_tile([out], self.stride, data_size)
         df = pd.concat([df, pd.DataFrame(
             {self.short_name.lower(): filter_bins})])
 
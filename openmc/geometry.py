@@ -1,12 +1,301 @@
-from collections import OrderedDict, Iterable
-from copy import deepcopy
+from bisect import bisect_left
+from collections import OrderedDict, Iterable, Sequence
+from copy import copy
+from io import BytesIO
+from itertools import chain
+import re
 from xml.etree import ElementTree as ET
 
 from six import string_types
+import numpy as np
 
 import openmc
-from openmc.clean_xml import sort_xml_elements, clean_xml_indentation
+from openmc.clean_xml import clean_xml_indentation
 from openmc.checkvalue import check_type
+from openmc.mixin import _Dependent
+
+
+def _weighted_count(instances, n):
+    # Number of the first n instances of a cell which are instances of a cell
+    # or material, as given by Geometry._instance_weights
+    return n if instances is None else int(np.searchsorted(instances, n))
+
+
+class _InstancePaths(Sequence):
+    """Paths through the CSG tree to each instance of a cell or material
+
+    Rather than storing a string for every instance, paths are generated from
+    the number of instances of the cell or material within each universe and
+    lattice element, and are only materialized as strings when accessed. The
+    paths can no longer be used once the contents of any universe, cell, or
+    lattice of the geometry change.
+
+    Parameters
+    ----------
+    geometry : openmc.Geometry
+        Geometry containing the cell or material
+    target : openmc.Cell or openmc.Material
+        Cell or material whose instances are reached by the paths
+    memo : dict
+        Instance counts shared by the paths of all cells and materials
+    dependent : openmc.mixin._Dependent
+        Token invalidated when the contents of the geometry change
+
+    """
+
+    def __init__(self, geometry, target, memo, dependent):
+        self._geometry = geometry
+        self._target = target
+        self._memo = memo
+        self._dependent = dependent
+        self._weights = geometry._instance_weights(target, memo)
+        self._length = target._num_instances
+        if isinstance(target, openmc.Material):
+            self._suffix = '->m{}'.format(target.id)
+        else:
+            self._suffix = ''
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, string_types):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __contains__(self, path):
+        try:
+            self.index(path)
+        except ValueError:
+            return False
+        return True
+
+    def _check_valid(self):
+        # The counts the paths are generated from are keyed by the identity
+        # of objects in the CSG tree, so they are only valid for the tree
+        # they were determined for
+        if not self._dependent.valid:
+            raise ValueError('The CSG tree has changed since instance paths '
+                             'were determined. Call the '
+                             'Geometry.determine_paths() method again.')
+
+    def _locate(self, cumulative, i, offsets):
+        # Position of the child of a universe or lattice containing the i-th
+        # instance of the target below it, found by bisecting the cumulative
+        # number of instances of each weighted cell preceding each child
+        def preceding(p):
+            return sum(_weighted_count(instances,
+                                       offsets[k] + cumulative[k][p])
+                       for k, (cell, instances) in self._weights.items())
+
+        start = preceding(0)
+        lo = 0
+        hi = len(next(iter(cumulative.values()))) - 2
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if preceding(mid) - start <= i:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        i -= preceding(lo) - start
+        for k in offsets:
+            offsets[k] += int(cumulative[k][lo])
+        return lo, i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Instance path index out of range')
+        self._check_valid()
+
+        # Descend the CSG tree, choosing the universe cell and lattice element
+        # containing the instance requested at each level
+        geometry = self._geometry
+        memo = self._memo
+        offsets = {k: 0 for k in self._weights}
+        universe = geometry.root_universe
+        path = ''
+        while True:
+            path += 'u{}'.format(universe.id)
+            key = ('cells', id(universe))
+            if key not in memo:
+                memo[key] = list(universe.cells.values())
+            cumulative = {k: geometry._universe_offsets(universe, c, memo)[0]
+                          for k, (c, _) in self._weights.items()}
+            position, i = self._locate(cumulative, i, offsets)
+            cell = memo[key][position]
+            path += '->c{}'.format(cell.id)
+
+            if id(cell) in self._weights:
+                return path + self._suffix
+            elif cell.fill_type == 'universe':
+                universe = cell.fill
+            else:
+                indices, universes, _ = geometry._lattice_elements(
+                    cell.fill, memo)
+                cumulative = {k: geometry._lattice_offsets(cell.fill, c, memo)
+                              for k, (c, _) in self._weights.items()}
+                position, i = self._locate(cumulative, i, offsets)
+                universe = universes[position]
+                path += '->l{}({})'.format(
+                    cell.fill.id, ','.join(str(x) for x in indices[position]))
+            path += '->'
+
+    def __iter__(self):
+        self._check_valid()
+        offsets = {k: 0 for k in self._weights}
+        return self._iter_universe(self._geometry.root_universe, '', offsets)
+
+    def _iter_universe(self, universe, prefix, offsets):
+        univ_path = prefix + 'u{}'.format(universe.id)
+        for cell in universe.cells.values():
+            # Skip cells which do not contain any weighted cell
+            counts = self._geometry._subtree_counts(cell, self._memo)
+            if not any(counts.get(k, 0) for k in offsets):
+                continue
+
+            cell_path = '{}->c{}'.format(univ_path, cell.id)
+            if id(cell) in self._weights:
+                instances = self._weights[id(cell)][1]
+                if instances is None or \
+                        cell.fill[offsets[id(cell)]] is self._target:
+                    yield cell_path + self._suffix
+                offsets[id(cell)] += 1
+
+            elif cell.fill_type == 'universe':
+                for path in self._iter_universe(cell.fill, cell_path + '->',
+                                                offsets):
+                    yield path
+
+            elif cell.fill_type == 'lattice':
+                latt = cell.fill
+                indices, universes, _ = self._geometry._lattice_elements(
+                    latt, self._memo)
+                for index, univ in zip(indices, universes):
+                    latt_path = '{}->l{}({})->'.format(
+                        cell_path, latt.id, ','.join(str(x) for x in index))
+                    for path in self._iter_universe(univ, latt_path, offsets):
+                        yield path
+
+    def index(self, path):
+        self._check_valid()
+        found = self._geometry._path_instance(path, self._memo)
+        if found is None or found[0] is not self._target:
+            raise ValueError('{} is not a path to an instance of {}'.format(
+                path, self._target.id))
+        return found[1]
+
+
+# Characters with a special meaning in regular expressions
+_REGEX_SPECIAL = set('.^$*+?{}[]\\|()')
+
+
+def _literal_prefix(pattern):
+    # Literal text which every string matching an anchored regular expression
+    # must start with
+    if not pattern.startswith('^') or '|' in pattern:
+        return ''
+    prefix = ''
+    for c in pattern[1:]:
+        if c in _REGEX_SPECIAL:
+            # A quantifier makes the preceding character optional
+            if c in '*?{':
+                prefix = prefix[:-1]
+            break
+        prefix += c
+    return prefix
+
+
+class _NameIndex(object):
+    """Index of objects in a geometry by name
+
+    Parameters
+    ----------
+    objects : Iterable of object
+        Objects with a name attribute, or tuples of a name and an object
+
+    """
+
+    def __init__(self, objects):
+        self._by_name = {}
+        for obj in objects:
+            name, obj = obj if isinstance(obj, tuple) else (obj.name, obj)
+            self._by_name.setdefault(name, []).append(obj)
+
+        # Names and lowercase names in sorted order, for searches by prefix
+        self._names = sorted(self._by_name)
+        self._lower_names = sorted((name.lower(), name) for name in self._names)
+        self._lower_keys = [lower for lower, _ in self._lower_names]
+
+    def find(self, name, case_sensitive=False, matching=False, regex=False):
+        """Return the objects whose names match a query
+
+        Parameters
+        ----------
+        name : str
+            The name or regular expression to match
+        case_sensitive : bool
+            Whether to distinguish upper and lower case letters
+        matching : bool
+            Whether the names must match completely
+        regex : bool
+            Whether the name is a regular expression
+
+        Returns
+        -------
+        list
+            Matching objects sorted by ID
+
+        """
+        if regex:
+            pattern = '(?:{})\\Z'.format(name) if matching else name
+            expr = re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+            search = expr.match if matching else expr.search
+            names = [n for n in self._with_prefix(_literal_prefix(name),
+                                                  case_sensitive)
+                     if search(n)]
+        elif matching:
+            if case_sensitive:
+                names = [name] if name in self._by_name else []
+            else:
+                names = self._with_prefix(name, False, exact=True)
+        elif case_sensitive:
+            names = [n for n in self._names if name in n]
+        else:
+            name = name.lower()
+            names = [n for lower, n in self._lower_names if name in lower]
+
+        objects = {}
+        for n in names:
+            for obj in self._by_name[n]:
+                objects[id(obj)] = obj
+        return sorted(objects.values(), key=lambda x: x.id)
+
+    def _with_prefix(self, prefix, case_sensitive, exact=False):
+        # Names starting with (or equal to) a prefix, found by bisecting the
+        # sorted names
+        if case_sensitive:
+            keys = self._names
+        else:
+            prefix = prefix.lower()
+            keys = self._lower_keys
+        names = []
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            if not keys[i].startswith(prefix) or (exact and keys[i] != prefix):
+                break
+            names.append(self._names[i] if case_sensitive
+                         else self._lower_names[i][1])
+        return names
 
 
 class Geometry(object):
@@ -30,6 +319,7 @@ class Geometry(object):
     def __init__(self, root_universe=None):
         self._root_universe = None
         self._offsets = {}
+        self._name_index = None
         if root_universe is not None:
             self.root_universe = root_universe
 
@@ -45,6 +335,7 @@ class Geometry(object):
     def root_universe(self, root_universe):
         check_type('root universe', root_universe, openmc.Universe)
         self._root_universe = root_universe
+        self._name_index = None
 
     def add_volume_information(self, volume_calc):
         """Add volume information from a stochastic volume calculation.
@@ -71,23 +362,104 @@ class Geometry(object):
     def export_to_xml(self, path='geometry.xml'):
         """Export geometry to an XML file.
 
+        Elements are written to the file one at a time, in the same order and
+        with the same indentation as if the whole XML tree had been built, so
+        that the memory needed does not grow with the size of the geometry.
+
         Parameters
         ----------
         path : str
             Path to file to write. Defaults to 'geometry.xml'.
 
         """
-        # Create XML representation
+        objects = self._get_xml_objects()
+
+        # Serialize an empty root element to obtain the XML declaration and
+        # the start and end tags of the root element
         root_element = ET.Element("geometry")
-        self.root_universe.create_xml_subelement(root_element)
+        if objects:
+            root_element.text = '\0'
+            root_element.tail = '\n'
+        stream = BytesIO()
+        ET.ElementTree(root_element).write(stream, xml_declaration=True,
+                                           encoding='utf-8', method="xml")
+        head, _, tail = stream.getvalue().partition(b'\0')
+
+        # Elements are sorted by tag and then by ID
+        elements = [(tag, uid) for tag in sorted(objects)
+                    for uid in sorted(objects[tag])]
+
+        with open(path, 'wb') as fh:
+            fh.write(head)
+            for i, (tag, uid) in enumerate(elements):
+                if tag == 'cell':
+                    cell, universe_id = objects[tag][uid]
+                    element = cell._create_xml_element()
+                    element.set("universe", str(universe_id))
+                elif tag == 'surface':
+                    element = objects[tag][uid].to_xml_element()
+                else:
+                    element = objects[tag][uid]._create_xml_element()
+
+                # Indent the element as a child of the root element
+                clean_xml_indentation(element, level=1)
+                element.tail = '\n' if i == len(elements) - 1 else '\n  '
+                if i == 0:
+                    fh.write(b'\n  ')
+                fh.write(ET.tostring(element, encoding='utf-8'))
+            fh.write(tail)
+
+    def _get_xml_objects(self):
+        """Find the cells, surfaces and lattices written to the geometry XML
+        file
+
+        Where several objects share an ID, the one that would have been
+        written first when building the XML tree is kept.
 
-        # Clean the indentation in the file to be user-readable
-        sort_xml_elements(root_element)
-        clean_xml_indentation(root_element)
+        Returns
+        -------
+        dict
+            Objects keyed by their XML tag and then by ID. Cells are given as
+            tuples of the cell and the ID of the universe containing it.
 
-        # Write the XML Tree to the geometry.xml file
-        tree = ET.ElementTree(root_element)
-        tree.write(path, xml_declaration=True, encoding='utf-8', method="xml")
+        """
+        objects = {'cell': {}, 'surface': {}, 'lattice': {}, 'hex_lattice': {}}
+        visited = set()
+
+        def add_universe(universe):
+            if id(universe) in visited:
+                return
+            visited.add(id(universe))
+
+            for cell in universe.cells.values():
+                if cell.id in objects['cell']:
+                    continue
+                if cell.fill_type == 'universe':
+                    add_universe(cell.fill)
+                elif cell.fill_type == 'lattice':
+                    add_lattice(cell.fill)
+                if cell.region is not None:
+                    for surface in cell.region.get_surfaces().values():
+                        objects['surface'].setdefault(surface.id, surface)
+                objects['cell'].setdefault(cell.id, (cell, universe.id))
+
+        def add_lattice(lattice):
+            if isinstance(lattice, openmc.HexLattice):
+                tag = 'hex_lattice'
+            else:
+                tag = 'lattice'
+            if lattice.id in objects[tag] or id(lattice) in visited:
+                return
+            visited.add(id(lattice))
+
+            if lattice.outer is not None:
+                add_universe(lattice.outer)
+            for universe in lattice.get_unique_universes().values():
+                add_universe(universe)
+            objects[tag].setdefault(lattice.id, lattice)
+
+        add_universe(self.root_universe)
+        return {tag: objs for tag, objs in objects.items() if objs}
 
     def find(self, point):
         """Find cells/universes/lattices which contain a given point
@@ -106,11 +478,381 @@ class Geometry(object):
         """
         return self.root_universe.find(point)
 
+    def find_many(self, points):
+        """Find the cells, materials and cell instances at many points
+
+        Rather than locating one point at a time, the points are partitioned
+        by the universes and lattices they pass through, and surface equations
+        are evaluated for all points in a universe at once.
+
+        Parameters
+        ----------
+        points : Iterable of Iterable of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        cells : numpy.ndarray
+            IDs of the cells containing each point, or -1 for points outside
+            of the geometry. As with :meth:`Geometry.find`, a point which is
+            not found within the universe or lattice filling a cell is given
+            that cell.
+        materials : numpy.ndarray
+            IDs of the materials at each point, or -1 for points in void cells
+            or outside of the geometry
+        instances : numpy.ndarray
+            Instance numbers of the cells containing each point, as used by
+            :meth:`Geometry.get_instances`, or -1 for points outside of the
+            geometry or in the outer universe of a lattice
+
+        """
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        n = len(points)
+        cells = np.full(n, -1, dtype=int)
+        materials = np.full(n, -1, dtype=int)
+        instances = np.full(n, -1, dtype=int)
+
+        # Partition the points through the universes and lattices
+        found = []
+        self.root_universe._find_many(points, np.arange(n), [], found)
+
+        memo = {}
+        for cell, indices, path in found:
+            cells[indices] = cell.id
+
+            # The instance number is the number of instances of the cell
+            # reached before this one when determining paths. Add up the
+            # instances in the cells and lattice elements preceding each level
+            # of the path.
+            offset = np.zeros(len(indices), dtype=int)
+            valid = np.ones(len(indices), dtype=bool)
+            for obj, element in path:
+                if isinstance(obj, openmc.Universe):
+                    counts, positions = self._universe_offsets(obj, cell, memo)
+                    offset += counts[positions[id(element)]]
+                else:
+                    counts = self._lattice_offsets(obj, cell, memo)
+                    valid &= (element >= 0)
+                    offset += counts[np.maximum(element, 0)]
+            offset[~valid] = -1
+            instances[indices] = offset
+
+            if cell.fill_type == 'material':
+                materials[indices] = cell.fill.id
+            elif cell.fill_type == 'distribmat':
+                fill_ids = np.array([-1 if m is None else m.id
+                                     for m in cell.fill] + [-1])
+                materials[indices] = fill_ids[offset]
+
+        return cells, materials, instances
+
+    def _subtree_counts(self, obj, memo):
+        """Count the instances of every cell within a universe or cell
+
+        Parameters
+        ----------
+        obj : openmc.Universe or openmc.Cell
+            Universe or cell to search
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        dict
+            Number of instances of each cell, keyed by the Python identity of
+            the cell
+
+        """
+        key = ('subtree', id(obj))
+        if key not in memo:
+            counts = {}
+            if isinstance(obj, openmc.Universe):
+                children = [(c, 1) for c in obj.cells.values()]
+            else:
+                counts[id(obj)] = 1
+                if obj.fill_type == 'universe':
+                    children = [(obj.fill, 1)]
+                elif obj.fill_type == 'lattice':
+                    # Count each distinct universe in the lattice only once
+                    multiplicity = OrderedDict()
+                    for univ in self._lattice_elements(obj.fill, memo)[1]:
+                        n = multiplicity.get(id(univ), (univ, 0))[1]
+                        multiplicity[id(univ)] = (univ, n + 1)
+                    children = list(multiplicity.values())
+                else:
+                    children = []
+
+            for child, n in children:
+                for k, count in self._subtree_counts(child, memo).items():
+                    counts[k] = counts.get(k, 0) + n*count
+            memo[key] = counts
+        return memo[key]
+
+    def _count_instances(self, obj, cell, memo):
+        """Count the instances of a cell within a universe or cell
+
+        Parameters
+        ----------
+        obj : openmc.Universe or openmc.Cell
+            Universe or cell to search
+        cell : openmc.Cell
+            Cell whose instances are counted
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        int
+            Number of instances of the cell
+
+        """
+        return self._subtree_counts(obj, memo).get(id(cell), 0)
+
+    def _lattice_elements(self, lattice, memo):
+        """Return the elements of a lattice in the order they are visited when
+        determining paths
+
+        Parameters
+        ----------
+        lattice : openmc.Lattice
+            Lattice whose elements are returned
+        memo : dict
+            Previously computed elements
+
+        Returns
+        -------
+        list of tuple
+            Index of each lattice element
+        list of openmc.Universe
+            Universe filling each lattice element
+        dict
+            Position of each lattice element keyed by its index
+
+        """
+        key = ('elements', id(lattice))
+        if key not in memo:
+            indices = [tuple(int(x) for x in idx)
+                       for idx in lattice._natural_indices]
+            universes = [lattice.get_universe(idx) for idx in indices]
+            positions = {idx: i for i, idx in enumerate(indices)}
+            memo[key] = (indices, universes, positions)
+        return memo[key]
+
+    def _universe_offsets(self, universe, cell, memo):
+        """Count the instances of a cell preceding each cell of a universe
+
+        Parameters
+        ----------
+        universe : openmc.Universe
+            Universe to search
+        cell : openmc.Cell
+            Cell whose instances are counted
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of instances of the cell in the cells of the universe
+            preceding each of its cells
+        dict
+            Position of each cell in the universe, keyed by the Python
+            identity of the cell
+
+        """
+        key = ('universe', id(universe), id(cell))
+        if key not in memo:
+            counts = [self._count_instances(c, cell, memo)
+                      for c in universe.cells.values()]
+            positions = {id(c): i for i, c in enumerate(universe.cells.values())}
+            memo[key] = (np.cumsum([0] + counts), positions)
+        return memo[key]
+
+    def _lattice_offsets(self, lattice, cell, memo):
+        """Count the instances of a cell preceding each lattice element
+
+        Parameters
+        ----------
+        lattice : openmc.Lattice
+            Lattice to search
+        cell : openmc.Cell
+            Cell whose instances are counted
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        numpy.ndarray
+            Number of instances of the cell in the lattice elements preceding
+            each element, in the order elements are visited when determining
+            paths. The last entry is the total number of instances.
+
+        """
+        key = (id(lattice), id(cell))
+        if key not in memo:
+            counts = [self._count_instances(univ, cell, memo)
+                      for univ in self._lattice_elements(lattice, memo)[1]]
+            memo[key] = np.cumsum([0] + counts)
+        return memo[key]
+
+    def _instance_weights(self, target, memo):
+        """Determine which cell instances are instances of a cell or material
+
+        Parameters
+        ----------
+        target : openmc.Cell or openmc.Material
+            Cell or material whose instances are counted
+        memo : dict
+            Previously computed weights
+
+        Returns
+        -------
+        dict
+            Tuples of a cell and the instances of the cell which are instances
+            of the target, keyed by the Python identity of the cell. The
+            instances are given as a sorted array, or None if every instance
+            of the cell is an instance of the target.
+
+        """
+        if isinstance(target, openmc.Cell):
+            return {id(target): (target, None)}
+
+        if 'weights' not in memo:
+            weights = {}
+            for cell in self.get_all_cells().values():
+                if cell.fill_type == 'material':
+                    weights.setdefault(id(cell.fill), {})[id(cell)] = \
+                        (cell, None)
+                elif cell.fill_type == 'distribmat':
+                    instances = OrderedDict()
+                    for i, mat in enumerate(cell.fill):
+                        if mat is not None:
+                            instances.setdefault(id(mat), []).append(i)
+                    for k, i in instances.items():
+                        weights.setdefault(k, {})[id(cell)] = (cell,
+                                                               np.array(i))
+            memo['weights'] = weights
+        return memo['weights'].get(id(target), {})
+
+    def _preceding_instances(self, levels, cell, memo):
+        """Count the instances of a cell preceding a position in the CSG tree
+
+        Parameters
+        ----------
+        levels : list of tuple
+            Universe and cell or lattice and element position at each level of
+            the path to the position
+        cell : openmc.Cell
+            Cell whose instances are counted
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        int
+            Number of instances of the cell visited before the position when
+            determining paths
+
+        """
+        offset = 0
+        for obj, element in levels:
+            if isinstance(obj, openmc.Universe):
+                counts, positions = self._universe_offsets(obj, cell, memo)
+                offset += counts[positions[id(element)]]
+            else:
+                offset += self._lattice_offsets(obj, cell, memo)[element]
+        return int(offset)
+
+    def _path_instance(self, path, memo):
+        """Determine the cell or material and instance reached by a path
+
+        Parameters
+        ----------
+        path : str
+            The path traversed through the CSG tree
+        memo : dict
+            Previously computed counts
+
+        Returns
+        -------
+        tuple or None
+            Cell or material and its instance number, or None if the path does
+            not exist in the geometry
+
+        """
+        tokens = path.split('->')
+        material_id = None
+        if tokens[-1].startswith('m'):
+            material_id = tokens.pop()[1:]
+
+        # Follow the path through the CSG tree, recording the position of the
+        # cell or lattice element at each level
+        levels = []
+        universe = self.root_universe
+        try:
+            if tokens[0] != 'u{}'.format(universe.id):
+                return None
+            i = 1
+            while True:
+                cell = universe.cells.get(int(tokens[i][1:]))
+                if not tokens[i].startswith('c') or cell is None:
+                    return None
+                levels.append((universe, cell))
+                i += 1
+                if i == len(tokens):
+                    break
+
+                if cell.fill_type == 'universe':
+                    universe = cell.fill
+                elif (cell.fill_type == 'lattice' and
+                      tokens[i].startswith('l{}('.format(cell.fill.id))):
+                    index = tokens[i][tokens[i].index('(') + 1:-1]
+                    index = tuple(int(x) for x in index.split(','))
+                    _, universes, positions = self._lattice_elements(
+                        cell.fill, memo)
+                    if index not in positions:
+                        return None
+                    levels.append((cell.fill, positions[index]))
+                    universe = universes[positions[index]]
+                    i += 1
+                else:
+                    return None
+
+                if tokens[i] != 'u{}'.format(universe.id):
+                    return None
+                i += 1
+        except (IndexError, ValueError):
+            return None
+
+        if material_id is None:
+            return cell, self._preceding_instances(levels, cell, memo)
+
+        # Determine the material at this instance of the cell
+        if cell.fill_type == 'material':
+            material = cell.fill
+        elif cell.fill_type == 'distribmat':
+            offset = self._preceding_instances(levels, cell, memo)
+            material = cell.fill[offset]
+        else:
+            return None
+        if material is None or material_id != str(material.id):
+            return None
+
+        # The material instance number is the number of instances of the
+        # material in every cell it fills visited before this one
+        instance = 0
+        for c, instances in self._instance_weights(material, memo).values():
+            offset = self._preceding_instances(levels, c, memo)
+            instance += _weighted_count(instances, offset)
+        return material, instance
+
     def get_instances(self, paths):
         """Return the instance number(s) for a cell/material in a geometry path.
 
         The instance numbers are used as indices into distributed
-        material/temperature arrays and tally distribcell filter arrays.
+        material/temperature arrays and tally distribcell filter arrays. They
+        are computed from the number of instances within the universes and
+        lattice elements preceding each level of the path.
 
         Parameters
         ----------
@@ -124,7 +866,8 @@ class Geometry(object):
         Returns
         -------
         int or list of int
-            Instance number(s) for the given path(s)
+            Instance number(s) for the given path(s), or None for paths which
+            do not exist in the geometry
 
         """
         # Make sure we are working with an iterable
@@ -132,24 +875,11 @@ class Geometry(object):
                        not isinstance(paths, string_types))
         path_list = paths if return_list else [paths]
 
+        memo = {}
         indices = []
         for p in path_list:
-            # Extract the cell id from the path
-            last_index = p.rfind('>')
-            last_path = p[last_index+1:]
-            uid = int(last_path[1:])
-
-            # Get corresponding cell/material
-            if last_path[0] == 'c':
-                obj = self.get_all_cells()[uid]
-            elif last_path[0] == 'm':
-                obj = self.get_all_materials()[uid]
-
-            # Determine index in paths array
-            try:
-                indices.append(obj.paths.index(p))
-            except ValueError:
-                indices.append(None)
+            found = self._path_instance(p, memo)
+            indices.append(None if found is None else found[1])
 
         return indices if return_list else indices[0]
 
@@ -267,7 +997,47 @@ class Geometry(object):
             surfaces = cell.region.get_surfaces(surfaces)
         return surfaces
 
-    def get_materials_by_name(self, name, case_sensitive=False, matching=False):
+    def _get_name_index(self, kind):
+        """Return the index of objects in the geometry by name
+
+        The index is built the first time it is needed and rebuilt after any
+        name or the structure of the CSG tree changes.
+
+        Parameters
+        ----------
+        kind : {'material', 'cell', 'fill', 'universe', 'lattice'}
+            Type of object indexed. Cells are indexed by the names of their
+            fills for 'fill'.
+
+        Returns
+        -------
+        _NameIndex
+            Index of the objects by name
+
+        """
+        if self._name_index is None or not self._name_index[0].valid:
+            dependent = _Dependent(('name', 'content'))
+            self.root_universe._add_dependent_to_tree(dependent)
+            cells = self.get_all_cells().values()
+            fills = []
+            for cell in cells:
+                if cell.fill_type in ('material', 'universe', 'lattice'):
+                    fills.append((cell.fill.name, cell))
+                elif cell.fill_type == 'distribmat':
+                    fills.extend((mat.name, cell) for mat in cell.fill
+                                 if mat is not None)
+
+            self._name_index = (dependent, {
+                'material': _NameIndex(self.get_all_materials().values()),
+                'cell': _NameIndex(cells),
+                'fill': _NameIndex(fills),
+                'universe': _NameIndex(self.get_all_universes().values()),
+                'lattice': _NameIndex(self.get_all_lattices().values())
+            })
+        return self._name_index[1][kind]
+
+    def get_materials_by_name(self, name, case_sensitive=False, matching=False,
+                              regex=False):
         """Return a list of materials with matching names.
 
         Parameters
@@ -279,6 +1049,9 @@ class Geometry(object):
             material's name (default is False)
         matching : bool
             Whether the names must match completely (default is False)
+        regex : bool
+            Whether the name is a regular expression to search for in each
+            material's name (default is False)
 
         Returns
         -------
@@ -286,28 +1059,11 @@ class Geometry(object):
             Materials matching the queried name
 
         """
+        index = self._get_name_index('material')
+        return index.find(name, case_sensitive, matching, regex)
 
-        if not case_sensitive:
-            name = name.lower()
-
-        all_materials = self.get_all_materials().values()
-        materials = set()
-
-        for material in all_materials:
-            material_name = material.name
-            if not case_sensitive:
-                material_name = material_name.lower()
-
-            if material_name == name:
-                materials.add(material)
-            elif not matching and name in material_name:
-                materials.add(material)
-
-        materials = list(materials)
-        materials.sort(key=lambda x: x.id)
-        return materials
-
-    def get_cells_by_name(self, name, case_sensitive=False, matching=False):
+    def get_cells_by_name(self, name, case_sensitive=False, matching=False,
+                          regex=False):
         """Return a list of cells with matching names.
 
         Parameters
@@ -319,6 +1075,9 @@ class Geometry(object):
             cell's name (default is False)
         matching : bool
             Whether the names must match completely (default is False)
+        regex : bool
+            Whether the name is a regular expression to search for in each
+            cell's name (default is False)
 
         Returns
         -------
@@ -326,28 +1085,11 @@ class Geometry(object):
             Cells matching the queried name
 
         """
+        index = self._get_name_index('cell')
+        return index.find(name, case_sensitive, matching, regex)
 
-        if not case_sensitive:
-            name = name.lower()
-
-        all_cells = self.get_all_cells().values()
-        cells = set()
-
-        for cell in all_cells:
-            cell_name = cell.name
-            if not case_sensitive:
-                cell_name = cell_name.lower()
-
-            if cell_name == name:
-                cells.add(cell)
-            elif not matching and name in cell_name:
-                cells.add(cell)
-
-        cells = list(cells)
-        cells.sort(key=lambda x: x.id)
-        return cells
-
-    def get_cells_by_fill_name(self, name, case_sensitive=False, matching=False):
+    def get_cells_by_fill_name(self, name, case_sensitive=False, matching=False,
+                               regex=False):
         """Return a list of cells with fills with matching names.
 
         Parameters
@@ -359,6 +1101,9 @@ class Geometry(object):
             cell's name (default is False)
         matching : bool
             Whether the names must match completely (default is False)
+        regex : bool
+            Whether the name is a regular expression to search for in each
+            cell's name (default is False)
 
         Returns
         -------
@@ -366,35 +1111,11 @@ class Geometry(object):
             Cells with fills matching the queried name
 
         """
+        index = self._get_name_index('fill')
+        return index.find(name, case_sensitive, matching, regex)
 
-        if not case_sensitive:
-            name = name.lower()
-
-        cells = set()
-
-        for cell in self.get_all_cells().values():
-            names = []
-            if cell.fill_type in ('material', 'universe', 'lattice'):
-                names.append(cell.fill.name)
-            elif cell.fill_type == 'distribmat':
-                for mat in cell.fill:
-                    if mat is not None:
-                        names.append(mat.name)
-
-            for fill_name in names:
-                if not case_sensitive:
-                    fill_name = fill_name.lower()
-
-                if fill_name == name:
-                    cells.add(cell)
-                elif not matching and name in fill_name:
-                    cells.add(cell)
-
-        cells = list(cells)
-        cells.sort(key=lambda x: x.id)
-        return cells
-
-    def get_universes_by_name(self, name, case_sensitive=False, matching=False):
+    def get_universes_by_name(self, name, case_sensitive=False, matching=False,
+                              regex=False):
         """Return a list of universes with matching names.
 
         Parameters
@@ -406,6 +1127,9 @@ class Geometry(object):
             universe's name (default is False)
         matching : bool
             Whether the names must match completely (default is False)
+        regex : bool
+            Whether the name is a regular expression to search for in each
+            universe's name (default is False)
 
         Returns
         -------
@@ -413,28 +1137,11 @@ class Geometry(object):
             Universes matching the queried name
 
         """
+        index = self._get_name_index('universe')
+        return index.find(name, case_sensitive, matching, regex)
 
-        if not case_sensitive:
-            name = name.lower()
-
-        all_universes = self.get_all_universes().values()
-        universes = set()
-
-        for universe in all_universes:
-            universe_name = universe.name
-            if not case_sensitive:
-                universe_name = universe_name.lower()
-
-            if universe_name == name:
-                universes.add(universe)
-            elif not matching and name in universe_name:
-                universes.add(universe)
-
-        universes = list(universes)
-        universes.sort(key=lambda x: x.id)
-        return universes
-
-    def get_lattices_by_name(self, name, case_sensitive=False, matching=False):
+    def get_lattices_by_name(self, name, case_sensitive=False, matching=False,
+                             regex=False):
         """Return a list of lattices with matching names.
 
         Parameters
@@ -446,6 +1153,9 @@ class Geometry(object):
             lattice's name (default is False)
         matching : bool
             Whether the names must match completely (default is False)
+        regex : bool
+            Whether the name is a regular expression to search for in each
+            lattice's name (default is False)
 
         Returns
         -------
@@ -453,33 +1163,17 @@ class Geometry(object):
             Lattices matching the queried name
 
         """
-
-        if not case_sensitive:
-            name = name.lower()
-
-        all_lattices = self.get_all_lattices().values()
-        lattices = set()
-
-        for lattice in all_lattices:
-            lattice_name = lattice.name
-            if not case_sensitive:
-                lattice_name = lattice_name.lower()
-
-            if lattice_name == name:
-                lattices.add(lattice)
-            elif not matching and name in lattice_name:
-                lattices.add(lattice)
-
-        lattices = list(lattices)
-        lattices.sort(key=lambda x: x.id)
-        return lattices
+        index = self._get_name_index('lattice')
+        return index.find(name, case_sensitive, matching, regex)
 
     def determine_paths(self, instances_only=False):
         """Determine paths through CSG tree for cells and materials.
 
-        This method recursively traverses the CSG tree to determine each unique
-        path that reaches every cell and material. The paths are stored in the
-        :attr:`Cell.paths` and :attr:`Material.paths` attributes.
+        This method counts the instances of every cell and material within each
+        universe and lattice of the CSG tree. The paths are stored in the
+        :attr:`Cell.paths` and :attr:`Material.paths` attributes as sequences
+        which generate the path to each instance from these counts when it is
+        accessed.
 
         Parameters
         ----------
@@ -488,21 +1182,64 @@ class Geometry(object):
             each cell and material.
 
         """
-        # (Re-)initialize all cell instances to 0
-        for cell in self.get_all_cells().values():
-            cell._paths = []
-            cell._num_instances = 0
-        for material in self.get_all_materials().values():
-            material._paths = []
-            material._num_instances = 0
+        memo = {}
+        cells = self.get_all_cells()
+        materials = self.get_all_materials()
 
-        # Recursively traverse the CSG tree to count all cell instances
-        self.root_universe._determine_paths(instances_only=instances_only)
+        # Count the instances of every cell in the CSG tree
+        counts = self._subtree_counts(self.root_universe, memo)
+        for cell in cells.values():
+            cell._num_instances = counts.get(id(cell), 0)
 
-    def clone(self):
+        # Count the material instances in the cells filled with materials
+        for material in materials.values():
+            material._num_instances = 0
+        for cell in cells.values():
+            if cell.fill_type == 'material':
+                cell.fill._num_instances += cell._num_instances
+            elif cell.fill_type == 'distribmat':
+                for material in cell.fill[:cell._num_instances]:
+                    if material is not None:
+                        material._num_instances += 1
+
+        # The paths are invalidated by any change to the contents of the tree
+        dependent = _Dependent(('content',))
+        self.root_universe._add_dependent_to_tree(dependent)
+        for obj in chain(cells.values(), materials.values()):
+            if instances_only:
+                obj._paths = []
+            else:
+                obj._paths = _InstancePaths(self, obj, memo, dependent)
+
+    def clone(self, clone_materials=True, clone_regions=True):
         """Create a copy of this geometry with new unique IDs for all of its
-        enclosed materials, surfaces, cells, universes and lattices."""
+        enclosed materials, surfaces, cells, universes and lattices.
+
+        Each universe, lattice, cell, surface and material is copied once, no
+        matter how many times it appears in the geometry. For parametric
+        studies which only modify part of a model, materials and regions can
+        be shared between the geometry and its clone rather than copied.
+
+        Parameters
+        ----------
+        clone_materials : bool
+            Whether to create separate copies of the materials. If False, the
+            clone shares the materials of this geometry.
+        clone_regions : bool
+            Whether to create separate copies of the cell regions and their
+            surfaces. If False, the clone shares the regions and surfaces of
+            this geometry.
+
+        Returns
+        -------
+        clone : openmc.Geometry
+            The clone of this geometry
+
+        """
 
-        clone = deepcopy(self)
-        clone.root_universe = self.root_universe.clone()
+        clone = copy(self)
+        clone._offsets = {}
+        clone._name_index = None
+        clone.root_universe = self.root_universe.clone(clone_materials,
+                                                       clone_regions)
         return clone
@@ -2,7 +2,7 @@ from __future__ import division
 
 from abc import ABCMeta
 from collections import OrderedDict, Iterable
-from copy import deepcopy
+from copy import copy
 from math import sqrt, floor
 from numbers import Real, Integral
 from xml.etree import ElementTree as ET
@@ -12,11 +12,12 @@ import numpy as np
 
 import openmc.checkvalue as cv
 import openmc
-from openmc.mixin import IDManagerMixin
+from openmc.mixin import (IDManagerMixin, ChangeNotifierMixin, _Dependent,
+                          _notifying_view, _unwrap)
 
 
 @add_metaclass(ABCMeta)
-class Lattice(IDManagerMixin):
+class Lattice(IDManagerMixin, ChangeNotifierMixin):
     """A repeating structure wherein each element is a universe.
 
     Parameters
@@ -87,7 +88,9 @@ class Lattice(IDManagerMixin):
 
     @property
     def universes(self):
-        return self._universes
+        # Modifying the universes in place notifies the objects which depend
+        # on the contents of the lattice
+        return _notifying_view(self._universes, self, 'content')
 
     @name.setter
     def name(self, name):
@@ -96,11 +99,13 @@ class Lattice(IDManagerMixin):
             self._name = name
         else:
             self._name = ''
+        self._changed('name')
 
     @outer.setter
     def outer(self, outer):
         cv.check_type('outer universe', outer, openmc.Universe)
         self._outer = outer
+        self._changed('content')
 
     @staticmethod
     def from_hdf5(group, universes):
@@ -406,12 +411,74 @@ class Lattice(IDManagerMixin):
                 return []
         return [(self, idx)] + u.find(p)
 
-    def clone(self, memo=None):
+    def _find_many(self, points, indices, path, found):
+        """Find the cells which contain many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+        indices : numpy.ndarray
+            Positions of the points in the array originally passed to
+            :meth:`Geometry.find_many`
+        path : list of tuple
+            Levels traversed to reach this lattice, as described in
+            :meth:`Universe._find_many`
+        found : list of tuple
+            Groups of points located as far as possible, given as (cell,
+            indices, path) tuples. New groups are appended to it.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point was found in a cell
+
+        """
+        located = np.zeros(len(points), dtype=bool)
+        if len(points) == 0:
+            return located
+
+        idx, local = self.find_elements(points)
+
+        # Determine the distinct lattice elements which contain points
+        shifted = idx - idx.min(axis=0)
+        codes = np.ravel_multi_index(tuple(shifted.T),
+                                     tuple(shifted.max(axis=0) + 1))
+        _, first, inverse = np.unique(codes, return_index=True,
+                                      return_inverse=True)
+
+        # Look up the universe and the position in the order used when
+        # determining paths for each distinct element
+        universes, positions = self._get_universes(idx[first])
+        for j in np.flatnonzero(positions < 0):
+            universes[j] = self.outer
+        universes = list(universes)
+        positions = positions[inverse]
+
+        # Partition the points by the universe filling their lattice element.
+        # Points outside of a lattice without an outer universe are not found.
+        for u in {id(u): u for u in universes if u is not None}.values():
+            mask = np.array([v is u for v in universes])[inverse]
+            element_path = openmc.universe._subset_path(path, mask) + \
+                [(self, positions[mask])]
+            located[mask] = u._find_many(local[mask], indices[mask],
+                                         element_path, found)
+        return located
+
+    def clone(self, clone_materials=True, clone_regions=True, memo=None):
         """Create a copy of this lattice with a new unique ID, and clones
         all universes within this lattice.
 
         Parameters
         ----------
+        clone_materials : bool
+            Whether to create separate copies of the materials filling cells
+            contained in this lattice. If False, the clone shares the
+            materials of this lattice.
+        clone_regions : bool
+            Whether to create separate copies of the regions bounding cells
+            contained in this lattice. If False, the clone shares the regions
+            and their surfaces with this lattice.
         memo : dict or None
             A nested dictionary of previously cloned objects. This parameter
             is used internally and should not be specified by the user.
@@ -427,29 +494,38 @@ class Lattice(IDManagerMixin):
             memo = {}
 
         # If no nemoize'd clone exists, instantiate one
-        if self not in memo:
-            clone = deepcopy(self)
+        if id(self) not in memo:
+            clone = copy(self)
             clone.id = None
 
             if self.outer is not None:
-                clone.outer = self.outer.clone(memo)
-
-            # Assign universe clones to the lattice clone
-            for i in self.indices:
-                if isinstance(self, RectLattice):
-                    clone.universes[i] = self.universes[i].clone(memo)
+                clone.outer = self.outer.clone(clone_materials, clone_regions,
+                                               memo)
+
+            # Assign universe clones to the lattice clone. Each distinct
+            # universe is only cloned once since clones are memoized.
+            def clone_universe(u):
+                return u.clone(clone_materials, clone_regions, memo)
+
+            if isinstance(self, RectLattice):
+                universes = np.empty(self._universes.shape, dtype=object)
+                for i, u in enumerate(self._universes.flat):
+                    universes.flat[i] = clone_universe(u)
+                clone._universes = universes
+            else:
+                if self.ndim == 2:
+                    clone._universes = [[clone_universe(u) for u in ring]
+                                        for ring in self._universes]
                 else:
-                    if self.ndim == 2:
-                        clone.universes[i[0]][i[1]] = \
-                            self.universes[i[0]][i[1]].clone(memo)
-                    else:
-                        clone.universes[i[0]][i[1]][i[2]] = \
-                            self.universes[i[0]][i[1]][i[2]].clone(memo)
+                    clone._universes = [[[clone_universe(u) for u in ring]
+                                         for ring in axial]
+                                        for axial in self._universes]
+                clone._universe_table = None
 
             # Memoize the clone
-            memo[self] = clone
+            memo[id(self)] = clone
 
-        return memo[self]
+        return memo[id(self)]
 
 
 class RectLattice(Lattice):
@@ -621,7 +697,8 @@ class RectLattice(Lattice):
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
-        self._universes = np.asarray(universes)
+        self._universes = np.asarray(_unwrap(universes))
+        self._changed('content')
 
     def find_element(self, point):
         """Determine index of lattice element and local coordinates for a point
@@ -649,6 +726,66 @@ class RectLattice(Lattice):
             idx = (ix, iy, iz)
         return idx, self.get_local_coordinates(point, idx)
 
+    def find_elements(self, points):
+        """Determine lattice element indices and local coordinates for many
+        points
+
+        Parameters
+        ----------
+        points : Iterable of Iterable of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer (x,y) or (x,y,z) lattice element indices with shape (N, 2)
+            or (N, 3)
+        numpy.ndarray
+            Cartesian coordinates of the points in the corresponding lattice
+            element coordinate systems with shape (N, 3)
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        n = self.ndim
+        lower_left = np.asarray(self.lower_left, dtype=float)
+        pitch = np.asarray(self.pitch, dtype=float)
+        idx = np.floor((points[:, :n] - lower_left)/pitch).astype(int)
+        local = np.array(points)
+        local[:, :n] -= lower_left + (idx + 0.5)*pitch
+        return idx, local
+
+    def _get_universes(self, idx):
+        """Return the universes filling many lattice elements
+
+        Parameters
+        ----------
+        idx : numpy.ndarray
+            Integer (x,y) or (x,y,z) lattice element indices with shape (N, 2)
+            or (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Universes filling each element, or None for invalid indices
+        numpy.ndarray
+            Position of each element in the order used when determining paths,
+            or -1 for invalid indices
+
+        """
+        shape = self.shape
+        valid = np.all((idx >= 0) & (idx < shape), axis=1)
+        universes = np.full(len(idx), None, dtype=object)
+        positions = np.full(len(idx), -1, dtype=int)
+
+        x = idx[valid, 0]
+        y = shape[1] - 1 - idx[valid, 1]
+        if self.ndim == 2:
+            universes[valid] = self._universes[y, x]
+        else:
+            universes[valid] = self._universes[idx[valid, 2], y, x]
+        positions[valid] = np.ravel_multi_index(tuple(idx[valid].T), shape)
+        return universes, positions
+
     def get_local_coordinates(self, point, idx):
         """Determine local coordinates of a point within a lattice element
 
@@ -729,6 +866,26 @@ class RectLattice(Lattice):
         if test is not None:
             return
 
+        # Create XML subelements for the outer Universe and for each Universe
+        # in the Lattice
+        if self._outer is not None:
+            self._outer.create_xml_subelement(xml_element)
+        for universe in np.ravel(self._universes):
+            universe.create_xml_subelement(xml_element)
+
+        # Append the XML subelement for this Lattice to the XML element
+        xml_element.append(self._create_xml_element())
+
+    def _create_xml_element(self):
+        """Return XML representation of the lattice without the elements for
+        the universes filling it
+
+        Returns
+        -------
+        element : xml.etree.ElementTree.Element
+            XML element containing lattice data
+
+        """
         lattice_subelement = ET.Element("lattice")
         lattice_subelement.set("id", str(self._id))
 
@@ -743,7 +900,6 @@ class RectLattice(Lattice):
         if self._outer is not None:
             outer = ET.SubElement(lattice_subelement, "outer")
             outer.text = '{0}'.format(self._outer._id)
-            self._outer.create_xml_subelement(xml_element)
 
         # Export Lattice cell dimensions
         dimension = ET.SubElement(lattice_subelement, "dimension")
@@ -766,9 +922,6 @@ class RectLattice(Lattice):
                         # Append Universe ID to the Lattice XML subelement
                         universe_ids += '{0} '.format(universe._id)
 
-                        # Create XML subelement for this Universe
-                        universe.create_xml_subelement(xml_element)
-
                     # Add newline character when we reach end of row of cells
                     universe_ids += '\n'
 
@@ -784,9 +937,6 @@ class RectLattice(Lattice):
                     # Append Universe ID to Lattice XML subelement
                     universe_ids += '{0} '.format(universe._id)
 
-                    # Create XML subelement for this Universe
-                    universe.create_xml_subelement(xml_element)
-
                 # Add newline character when we reach end of row of cells
                 universe_ids += '\n'
 
@@ -796,8 +946,7 @@ class RectLattice(Lattice):
         universes = ET.SubElement(lattice_subelement, "universes")
         universes.text = universe_ids
 
-        # Append the XML subelement for this Lattice to the XML element
-        xml_element.append(lattice_subelement)
+        return lattice_subelement
 
 
 class HexLattice(Lattice):
@@ -863,6 +1012,7 @@ class HexLattice(Lattice):
         self._num_rings = None
         self._num_axial = None
         self._center = None
+        self._universe_table = None
 
     def __eq__(self, other):
         if not isinstance(other, HexLattice):
@@ -961,7 +1111,7 @@ class HexLattice(Lattice):
 
     @property
     def ndim(self):
-        return 2 if isinstance(self.universes[0][0], openmc.Universe) else 3
+        return 2 if isinstance(self._universes[0][0], openmc.Universe) else 3
 
     @center.setter
     def center(self, center):
@@ -981,7 +1131,9 @@ class HexLattice(Lattice):
     def universes(self, universes):
         cv.check_iterable_type('lattice universes', universes, openmc.Universe,
                                min_depth=2, max_depth=3)
-        self._universes = universes
+        self._universes = _unwrap(universes)
+        self._universe_table = None
+        self._changed('content')
 
         # NOTE: This routine assumes that the user creates a "ragged" list of
         # lists, where each sub-list corresponds to one ring of Universes.
@@ -1091,6 +1243,158 @@ class HexLattice(Lattice):
 
         return idx_min, p_min
 
+    def find_elements(self, points):
+        r"""Determine lattice element indices and local coordinates for many
+        points
+
+        Parameters
+        ----------
+        points : Iterable of Iterable of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer lattice element indices in the :math:`(x,\alpha,z)` bases
+            with shape (N, 3). As in :meth:`HexLattice.find_element`, the z
+            index of a 2-D lattice is 1.
+        numpy.ndarray
+            Cartesian coordinates of the points in the corresponding lattice
+            element coordinate systems with shape (N, 3)
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+
+        # Convert coordinates to skewed bases
+        x = points[:, 0] - self.center[0]
+        y = points[:, 1] - self.center[1]
+        alpha = y - x/sqrt(3.)
+        ix = np.floor(x/(sqrt(0.75) * self.pitch[0])).astype(int)
+        ia = np.floor(alpha/self.pitch[0]).astype(int)
+
+        # Check four lattice elements to see which one is closest based on
+        # local coordinates
+        local = np.array(points, dtype=float)
+        d_min = np.full(len(points), np.inf)
+        ix_min = ix.copy()
+        ia_min = ia.copy()
+        for dx, da in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+            x_local = points[:, 0] - (self.center[0] +
+                                      sqrt(0.75)*self.pitch[0]*(ix + dx))
+            y_local = points[:, 1] - (self.center[1] +
+                                      (0.5*(ix + dx) + ia + da)*self.pitch[0])
+            d = x_local**2 + y_local**2
+            closer = d < d_min
+            d_min[closer] = d[closer]
+            ix_min[closer] = ix[closer] + dx
+            ia_min[closer] = ia[closer] + da
+            local[closer, 0] = x_local[closer]
+            local[closer, 1] = y_local[closer]
+
+        if self._num_axial is None:
+            iz = np.ones(len(points), dtype=int)
+        else:
+            z = points[:, 2] - self.center[2]
+            iz = np.floor(z/self.pitch[1] + 0.5*self.num_axial).astype(int)
+            local[:, 2] -= (self.center[2] +
+                            (iz + 0.5 - 0.5*self.num_axial)*self.pitch[1])
+
+        return np.column_stack((ix_min, ia_min, iz)), local
+
+    def _get_universe_table(self):
+        r"""Return the universes and path positions of the lattice elements in
+        arrays indexed by the :math:`(z,x,\alpha)` indices of the elements
+
+        The ragged lists of rings assigned to :attr:`HexLattice.universes` are
+        flattened into arrays the first time they are needed, so that finding
+        the universe filling an element does not require traversing them.
+
+        Returns
+        -------
+        numpy.ndarray
+            Universe filling each element, or None for positions outside of
+            the lattice, with shape (num_axial, 2*num_rings - 1,
+            2*num_rings - 1)
+        numpy.ndarray
+            Position of each element in the order used when determining paths,
+            or -1 for positions outside of the lattice
+
+        """
+        if self._universe_table is None or not self._universe_table[0].valid:
+            dependent = _Dependent(('content',))
+            self._add_dependent(dependent)
+            r = self._num_rings
+            nz = 1 if self._num_axial is None else self._num_axial
+            universes = np.full((nz, 2*r - 1, 2*r - 1), None, dtype=object)
+            positions = np.full((nz, 2*r - 1, 2*r - 1), -1, dtype=int)
+            for pos, idx in enumerate(self._natural_indices):
+                i_u = self.get_universe_index(idx)
+                if self._num_axial is None:
+                    z = 0
+                    u = self._universes[i_u[0]][i_u[1]]
+                else:
+                    z = idx[2]
+                    u = self._universes[i_u[0]][i_u[1]][i_u[2]]
+                universes[z, idx[0] + r - 1, idx[1] + r - 1] = u
+                positions[z, idx[0] + r - 1, idx[1] + r - 1] = pos
+            self._universe_table = (dependent, universes, positions)
+        return self._universe_table[1:]
+
+    def get_universe(self, idx):
+        r"""Return universe corresponding to a lattice element index
+
+        Parameters
+        ----------
+        idx : Iterable of int
+            Lattice element indices in the :math:`(x,\alpha)` or
+            :math:`(x,\alpha,z)` coordinate systems
+
+        Returns
+        -------
+        openmc.Universe
+            Universe with given indices
+
+        """
+        r = self._num_rings
+        z = 0 if self._num_axial is None else idx[2]
+        return self._get_universe_table()[0][z, idx[0] + r - 1, idx[1] + r - 1]
+
+    def _get_universes(self, idx):
+        r"""Return the universes filling many lattice elements
+
+        Parameters
+        ----------
+        idx : numpy.ndarray
+            Integer lattice element indices in the :math:`(x,\alpha,z)` bases
+            with shape (N, 3). The z index is ignored for a 2-D lattice.
+
+        Returns
+        -------
+        numpy.ndarray
+            Universes filling each element, or None for invalid indices
+        numpy.ndarray
+            Position of each element in the order used when determining paths,
+            or -1 for invalid indices
+
+        """
+        r = self._num_rings
+        x = idx[:, 0]
+        a = idx[:, 1]
+        valid = np.maximum(np.maximum(abs(x), abs(a)), abs(x + a)) < r
+        if self._num_axial is None:
+            z = np.zeros(len(idx), dtype=int)
+        else:
+            z = idx[:, 2]
+            valid &= (z >= 0) & (z < self._num_axial)
+
+        table, table_positions = self._get_universe_table()
+        universes = np.full(len(idx), None, dtype=object)
+        positions = np.full(len(idx), -1, dtype=int)
+        element = (z[valid], x[valid] + r - 1, a[valid] + r - 1)
+        universes[valid] = table[element]
+        positions[valid] = table_positions[element]
+        return universes, positions
+
     def get_local_coordinates(self, point, idx):
         r"""Determine local coordinates of a point within a lattice element
 
@@ -1190,6 +1494,34 @@ class HexLattice(Lattice):
         if test is not None:
             return
 
+        # Create XML subelements for the outer Universe and for each Universe
+        # in the Lattice, starting from the center of each axial slice
+        if self._outer is not None:
+            self._outer.create_xml_subelement(xml_element)
+
+        if self._num_axial is not None:
+            slices = self._universes
+        else:
+            slices = [self._universes]
+        for universes in slices:
+            universes[-1][0].create_xml_subelement(xml_element)
+            for r in range(self._num_rings - 1):
+                for theta in range(6*(self._num_rings - 1 - r)):
+                    universes[r][theta].create_xml_subelement(xml_element)
+
+        # Append the XML subelement for this Lattice to the XML element
+        xml_element.append(self._create_xml_element())
+
+    def _create_xml_element(self):
+        """Return XML representation of the lattice without the elements for
+        the universes filling it
+
+        Returns
+        -------
+        element : xml.etree.ElementTree.Element
+            XML element containing lattice data
+
+        """
         lattice_subelement = ET.Element("hex_lattice")
         lattice_subelement.set("id", str(self._id))
 
@@ -1204,7 +1536,6 @@ class HexLattice(Lattice):
         if self._outer is not None:
             outer = ET.SubElement(lattice_subelement, "outer")
             outer.text = '{0}'.format(self._outer._id)
-            self._outer.create_xml_subelement(xml_element)
 
         lattice_subelement.set("n_rings", str(self._num_rings))
 
@@ -1219,44 +1550,19 @@ class HexLattice(Lattice):
 
         # 3D Lattices
         if self._num_axial is not None:
-            slices = []
-            for z in range(self._num_axial):
-                # Initialize the center universe.
-                universe = self._universes[z][-1][0]
-                universe.create_xml_subelement(xml_element)
-
-                # Initialize the remaining universes.
-                for r in range(self._num_rings-1):
-                    for theta in range(6*(self._num_rings - 1 - r)):
-                        universe = self._universes[z][r][theta]
-                        universe.create_xml_subelement(xml_element)
-
-                # Get a string representation of the universe IDs.
-                slices.append(self._repr_axial_slice(self._universes[z]))
-
-            # Collapse the list of axial slices into a single string.
-            universe_ids = '\n'.join(slices)
+            # Collapse the axial slices into a single string.
+            universe_ids = '\n'.join(self._repr_axial_slice(x)
+                                     for x in self._universes)
 
         # 2D Lattices
         else:
-            # Initialize the center universe.
-            universe = self._universes[-1][0]
-            universe.create_xml_subelement(xml_element)
-
-            # Initialize the remaining universes.
-            for r in range(self._num_rings - 1):
-                for theta in range(6*(self._num_rings - 1 - r)):
-                    universe = self._universes[r][theta]
-                    universe.create_xml_subelement(xml_element)
-
             # Get a string representation of the universe IDs.
             universe_ids = self._repr_axial_slice(self._universes)
 
         universes = ET.SubElement(lattice_subelement, "universes")
         universes.text = '\n' + universe_ids
 
-        # Append the XML subelement for this Lattice to the XML element
-        xml_element.append(lattice_subelement)
+        return lattice_subelement
 
     def _repr_axial_slice(self, universes):
         """Return string representation for the given 2D group of universes.
@@ -11,7 +11,7 @@ import openmc
 import openmc.data
 import openmc.checkvalue as cv
 from openmc.clean_xml import sort_xml_elements, clean_xml_indentation
-from .mixin import IDManagerMixin
+from .mixin import IDManagerMixin, ChangeNotifierMixin
 
 
 # Units for density supported by OpenMC
@@ -19,7 +19,35 @@ DENSITY_UNITS = ['g/cm3', 'g/cc', 'kg/cm3', 'atom/b-cm', 'atom/cm3', 'sum',
                  'macro']
 
 
-class Material(IDManagerMixin):
+def _average_molar_mass(percents, atom_percent, masses):
+    """Compute the average molar mass of a mixture of nuclides
+
+    Parameters
+    ----------
+    percents : numpy.ndarray
+        Atom or weight percent of each nuclide
+    atom_percent : numpy.ndarray
+        Whether each percent is an atom percent rather than a weight percent
+    masses : numpy.ndarray
+        Atomic mass of each nuclide
+
+    Returns
+    -------
+    float
+        Average molar mass
+
+    """
+
+    # Using the sum of specified atomic or weight amounts as a basis, sum
+    # the mass and moles of the material
+    mass = np.sum(np.where(atom_percent, percents*masses, percents))
+    moles = np.sum(np.where(atom_percent, percents, percents/masses))
+
+    # Compute and return the molar mass
+    return mass / moles
+
+
+class Material(IDManagerMixin, ChangeNotifierMixin):
     """A material composed of a collection of nuclides/elements.
 
     To create a material, one should create an instance of this class, add
@@ -71,10 +99,12 @@ class Material(IDManagerMixin):
         Volume of the material in cm^3. This can either be set manually or
         calculated in a stochastic volume calculation and added via the
         :meth:`Material.add_volume_information` method.
-    paths : list of str
+    paths : Sequence of str
         The paths traversed through the CSG tree to reach each material
         instance. This property is initialized by calling the
-        :meth:`Geometry.determine_paths` method.
+        :meth:`Geometry.determine_paths` method. Each path is generated when
+        it is accessed, so the method must be called again after the CSG tree
+        is modified.
     num_instances : int
         The number of instances of this material throughout the geometry.
 
@@ -96,6 +126,10 @@ class Material(IDManagerMixin):
         self._volume = None
         self._atoms = {}
 
+        # Nuclides with elements expanded and their atom densities, computed
+        # when first needed
+        self._atom_densities = None
+
         # A list of tuples (nuclide, percent, percent type)
         self._nuclides = []
 
@@ -234,21 +268,13 @@ class Material(IDManagerMixin):
 
         # Get a list of all the nuclides, with elements expanded
         nuclide_densities = self.get_nuclide_densities()
+        percents = np.array([v[1] for v in nuclide_densities.values()])
+        atom_percent = np.array([v[2] == 'ao'
+                                 for v in nuclide_densities.values()])
+        masses = np.array([openmc.data.atomic_mass(nuc)
+                           for nuc in nuclide_densities])
 
-        # Using the sum of specified atomic or weight amounts as a basis, sum
-        # the mass and moles of the material
-        mass = 0.
-        moles = 0.
-        for nuc, vals in nuclide_densities.items():
-            if vals[2] == 'ao':
-                mass += vals[1] * openmc.data.atomic_mass(nuc)
-                moles += vals[1]
-            else:
-                moles += vals[1] / openmc.data.atomic_mass(nuc)
-                mass += vals[1]
-
-        # Compute and return the molar mass
-        return mass / moles
+        return _average_molar_mass(percents, atom_percent, masses)
 
     @property
     def volume(self):
@@ -262,6 +288,7 @@ class Material(IDManagerMixin):
             self._name = name
         else:
             self._name = ''
+        self._changed('name')
 
     @temperature.setter
     def temperature(self, temperature):
@@ -357,6 +384,7 @@ class Material(IDManagerMixin):
 
         cv.check_value('density units', units, DENSITY_UNITS)
         self._density_units = units
+        self._atom_densities = None
 
         if units == 'sum':
             if density is not None:
@@ -437,6 +465,7 @@ class Material(IDManagerMixin):
             nuclide = openmc.Nuclide(nuclide)
 
         self._nuclides.append((nuclide, percent, percent_type))
+        self._atom_densities = None
 
     def remove_nuclide(self, nuclide):
         """Remove a nuclide from the material
@@ -456,6 +485,7 @@ class Material(IDManagerMixin):
         for nuc in self._nuclides:
             if nuclide == nuc[0]:
                 self._nuclides.remove(nuc)
+                self._atom_densities = None
                 break
 
     def add_macroscopic(self, macroscopic):
@@ -598,6 +628,7 @@ class Material(IDManagerMixin):
                 warnings.warn(msg)
 
         self._elements.append((element, percent, percent_type, enrichment))
+        self._atom_densities = None
 
     def remove_element(self, element):
         """Remove a natural element from the material
@@ -617,6 +648,7 @@ class Material(IDManagerMixin):
         for elm in self._elements:
             if element == elm[0]:
                 self._elements.remove(elm)
+                self._atom_densities = None
 
     def add_s_alpha_beta(self, name, fraction=1.0):
         r"""Add an :math:`S(\alpha,\beta)` table to the material
@@ -660,6 +692,7 @@ class Material(IDManagerMixin):
             nuclide.scattering = 'iso-in-lab'
         for element, percent, percent_type, enrichment in self._elements:
             element.scattering = 'iso-in-lab'
+        self._atom_densities = None
 
     def get_nuclides(self):
         """Returns all nuclides in the material
@@ -722,6 +755,28 @@ class Material(IDManagerMixin):
 
         """
 
+        if self._atom_densities is None:
+            self._atom_densities = self._compute_atom_densities()
+        nucs, densities = self._atom_densities
+
+        nuclides = OrderedDict()
+        for nuc, density in zip(nucs, densities):
+            nuclides[nuc] = (nuc, density)
+
+        return nuclides
+
+    def _compute_atom_densities(self):
+        """Compute the atomic densities of all nuclides in the material
+
+        Returns
+        -------
+        nucs : list of openmc.Nuclide
+            Nuclides in the material with elements expanded
+        densities : numpy.ndarray
+            Atomic density of each nuclide in units of atom/b-cm
+
+        """
+
         # Expand elements in to nuclides
         nuclides = self.get_nuclide_densities()
 
@@ -742,49 +797,37 @@ class Material(IDManagerMixin):
 
         # For ease of processing split out nuc, nuc_density,
         # and nuc_density_type in to separate arrays
-        nucs = []
-        nuc_densities = []
-        nuc_density_types = []
-
-        for nuclide in nuclides.items():
-            nuc, nuc_density, nuc_density_type = nuclide[1]
-            nucs.append(nuc)
-            nuc_densities.append(nuc_density)
-            nuc_density_types.append(nuc_density_type)
-
-        nucs = np.array(nucs)
-        nuc_densities = np.array(nuc_densities)
-        nuc_density_types = np.array(nuc_density_types)
+        nucs = [v[0] for v in nuclides.values()]
+        nuc_densities = np.array([v[1] for v in nuclides.values()],
+                                 dtype=float)
+        atom_percent = np.array([v[2] == 'ao' for v in nuclides.values()],
+                                dtype=bool)
 
         if sum_density:
             density = np.sum(nuc_densities)
 
-        percent_in_atom = np.all(nuc_density_types == 'ao')
+        percent_in_atom = np.all(atom_percent)
         density_in_atom = density > 0.
-        sum_percent = 0.
+
+        # The atomic masses are only needed when converting weight amounts
+        if not percent_in_atom or not density_in_atom:
+            masses = np.array([openmc.data.atomic_mass(nuc.name)
+                               for nuc in nucs], dtype=float)
+            molar_mass = _average_molar_mass(nuc_densities, atom_percent,
+                                             masses)
 
         # Convert the weight amounts to atomic amounts
         if not percent_in_atom:
-            for n, nuc in enumerate(nucs):
-                nuc_densities[n] *= self.average_molar_mass / \
-                                    openmc.data.atomic_mass(nuc.name)
+            nuc_densities *= molar_mass / masses
 
         # Now that we have the atomic amounts, lets finish calculating densities
-        sum_percent = np.sum(nuc_densities)
-        nuc_densities = nuc_densities / sum_percent
+        nuc_densities /= np.sum(nuc_densities)
 
         # Convert the mass density to an atom density
         if not density_in_atom:
-            density = -density / self.average_molar_mass * 1.E-24 \
-                      * openmc.data.AVOGADRO
-
-        nuc_densities = density * nuc_densities
+            density = -density / molar_mass * 1.E-24 * openmc.data.AVOGADRO
 
-        nuclides = OrderedDict()
-        for n, nuc in enumerate(nucs):
-            nuclides[nuc] = (nuc, nuc_densities[n])
-
-        return nuclides
+        return nucs, density * nuc_densities
 
     def clone(self, memo=None):
         """Create a copy of this material with a new unique ID.
@@ -806,7 +849,7 @@ class Material(IDManagerMixin):
             memo = {}
 
         # If no nemoize'd clone exists, instantiate one
-        if self not in memo:
+        if id(self) not in memo:
             # Temporarily remove paths -- this is done so that when the clone is
             # made, it doesn't create a copy of the paths (which are specific to
             # an instance)
@@ -821,9 +864,9 @@ class Material(IDManagerMixin):
             self._paths = paths
 
             # Memoize the clone
-            memo[self] = clone
+            memo[id(self)] = clone
 
-        return memo[self]
+        return memo[id(self)]
 
     def _get_nuclide_xml(self, nuclide, distrib=False):
         xml_element = ET.Element("nuclide")
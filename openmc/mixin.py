@@ -1,5 +1,7 @@
+from collections import MutableSequence
 from numbers import Integral
 from warnings import warn
+import weakref
 
 import numpy as np
 
@@ -25,6 +27,180 @@ class EqualityMixin(object):
         return not self.__eq__(other)
 
 
+class ChangeNotifierMixin(object):
+    """A Class which tells data derived from its instances when they change.
+
+    Data derived from an instance, e.g. a compiled region or an index of a CSG
+    tree, is guarded by a :class:`_Dependent` flag which is added to the
+    instance with :meth:`_add_dependent`. Whenever a property of the instance
+    changes, the subclass calls :meth:`_changed` with the kind of change made,
+    and the flags of the dependents interested in that kind of change are
+    cleared so that the data is rebuilt the next time it is needed.
+
+    The kinds of change are 'name' for names, 'content' for what fills cells,
+    universes and lattices and for the IDs, estimators, filters, nuclides and
+    scores of tallies, 'region' for the structure of regions, and 'position'
+    for the coefficients of surfaces.
+
+    """
+
+    def __getstate__(self):
+        # Data derived from an instance does not depend on its copies
+        state = self.__dict__.copy()
+        state.pop('_dependents', None)
+        return state
+
+    def _add_dependent(self, dependent):
+        try:
+            self._dependents.add(dependent)
+        except AttributeError:
+            self._dependents = weakref.WeakSet((dependent,))
+
+    def _changed(self, kind):
+        dependents = self.__dict__.get('_dependents')
+        if dependents:
+            for dependent in list(dependents):
+                if kind in dependent.kinds:
+                    dependent.valid = False
+                    dependents.discard(dependent)
+
+
+class _Dependent(object):
+    """Flag telling whether data derived from instances of
+    :class:`ChangeNotifierMixin` is still valid
+
+    Parameters
+    ----------
+    kinds : Iterable of str
+        Kinds of change which invalidate the data
+
+    Attributes
+    ----------
+    kinds : frozenset of str
+        Kinds of change which invalidate the data
+    valid : bool
+        Whether none of the instances the data depends on has changed
+
+    """
+
+    __slots__ = ('kinds', 'valid', '__weakref__')
+
+    def __init__(self, kinds):
+        self.kinds = frozenset(kinds)
+        self.valid = True
+
+    def __getstate__(self):
+        # Copies of the data are not added to the instances it depends on
+        return (self.kinds, False)
+
+    def __setstate__(self, state):
+        self.kinds, self.valid = state
+
+
+class _NotifyingArray(np.ndarray):
+    """View of an array held by an instance of :class:`ChangeNotifierMixin`
+    which notifies the instance when elements are assigned"""
+
+    def __array_finalize__(self, obj):
+        self._owner = getattr(obj, '_owner', None)
+        self._kind = getattr(obj, '_kind', None)
+
+    def __array_wrap__(self, array, *args, **kwargs):
+        # Results of arithmetic are new arrays rather than views of the data
+        return array.view(np.ndarray)
+
+    def __setitem__(self, key, value):
+        super(_NotifyingArray, self).__setitem__(key, value)
+        if self._owner is not None:
+            self._owner._changed(self._kind)
+
+
+class _NotifyingList(MutableSequence):
+    """View of a list held by an instance of :class:`ChangeNotifierMixin`
+    which notifies the instance when the list or a nested list is modified"""
+
+    def __init__(self, data, owner, kind):
+        self._data = data
+        self._owner = owner
+        self._kind = kind
+
+    def __getitem__(self, key):
+        return _notifying_view(self._data[key], self._owner, self._kind)
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._owner._changed(self._kind)
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._owner._changed(self._kind)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for item in self._data:
+            yield _notifying_view(item, self._owner, self._kind)
+
+    def __eq__(self, other):
+        if isinstance(other, _NotifyingList):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def insert(self, index, value):
+        self._data.insert(index, value)
+        self._owner._changed(self._kind)
+
+
+def _notifying_view(data, owner, kind):
+    """Return a view of a list or array held by an instance of
+    :class:`ChangeNotifierMixin` which notifies the instance of changes made
+    through it
+
+    Parameters
+    ----------
+    data : object
+        Data held by the instance. Lists and arrays are wrapped, and other
+        objects are returned unchanged.
+    owner : ChangeNotifierMixin
+        Instance holding the data
+    kind : str
+        Kind of change the instance is notified of
+
+    Returns
+    -------
+    object
+        View of the data
+
+    """
+    if isinstance(data, list):
+        return _NotifyingList(data, owner, kind)
+    elif isinstance(data, np.ndarray):
+        view = data.view(_NotifyingArray)
+        view._owner = owner
+        view._kind = kind
+        return view
+    return data
+
+
+def _unwrap(data):
+    """Return the list or array underlying a view made by
+    :func:`_notifying_view`"""
+    if isinstance(data, _NotifyingList):
+        return data._data
+    elif isinstance(data, _NotifyingArray):
+        return data.view(np.ndarray)
+    return data
+
+
 class IDWarning(UserWarning):
     pass
 
@@ -1,12 +1,12 @@
 from __future__ import division
-import copy
 import warnings
 import itertools
+import multiprocessing
 import random
 from collections import Iterable, defaultdict
-from numbers import Real
+from numbers import Integral, Real
 from random import uniform, gauss
-from heapq import heappush, heappop
+from heapq import heappush, heappop, heapify
 from math import pi, sin, cos, floor, log10, sqrt
 from abc import ABCMeta, abstractproperty, abstractmethod
 
@@ -217,6 +217,33 @@ class _Domain(object):
         """
         pass
 
+    def random_points(self, n, rng=None):
+        """Generate Cartesian coordinates of the centers of many particles that
+        are contained entirely within the domain with uniform probability.
+
+        Parameters
+        ----------
+        n : int
+            Number of points to generate.
+        rng : numpy.random.RandomState, optional
+            Random number generator used to sample all points at once. If not
+            given, the points are sampled one at a time with
+            :meth:`random_point`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Cartesian coordinates of particle centers with shape (n, 3).
+
+        """
+        if rng is None:
+            return np.array([self.random_point() for i in range(n)])
+        return self._sample_points(n, rng)
+
+    @abstractmethod
+    def _sample_points(self, n, rng):
+        pass
+
 
 class _CubicDomain(_Domain):
     """Cubic container in which to pack particles.
@@ -294,6 +321,9 @@ class _CubicDomain(_Domain):
                 uniform(self.limits[0][1], self.limits[1][1]),
                 uniform(self.limits[0][2], self.limits[1][2])]
 
+    def _sample_points(self, n, rng):
+        return rng.uniform(self.limits[0], self.limits[1], (n, 3))
+
 
 class _CylindricalDomain(_Domain):
     """Cylindrical container in which to pack particles.
@@ -388,6 +418,13 @@ class _CylindricalDomain(_Domain):
         return [r*cos(t) + self.center[0], r*sin(t) + self.center[1],
                 uniform(self.limits[0][2], self.limits[1][2])]
 
+    def _sample_points(self, n, rng):
+        r = np.sqrt(rng.uniform(0, (self.radius - self.particle_radius)**2, n))
+        t = rng.uniform(0, 2*pi, n)
+        z = rng.uniform(self.limits[0][2], self.limits[1][2], n)
+        return np.column_stack((r*np.cos(t) + self.center[0],
+                                r*np.sin(t) + self.center[1], z))
+
 
 class _SphericalDomain(_Domain):
     """Spherical container in which to pack particles.
@@ -464,6 +501,12 @@ class _SphericalDomain(_Domain):
              sqrt(x[0]**2 + x[1]**2 + x[2]**2))
         return [r*x[i] + self.center[i] for i in range(3)]
 
+    def _sample_points(self, n, rng):
+        x = rng.normal(0, 1, (n, 3))
+        u = rng.uniform(0, (self.radius - self.particle_radius)**3, n)
+        r = u**(1/3) / np.sqrt(np.sum(x**2, axis=1))
+        return r[:, None]*x + self.center
+
 
 def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     """Create a lattice containing TRISO particles for optimized tracking.
@@ -492,26 +535,57 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     lattice = openmc.RectLattice()
     lattice.lower_left = lower_left
     lattice.pitch = pitch
-
-    indices = list(np.broadcast(*np.ogrid[:shape[2], :shape[1], :shape[0]]))
-    triso_locations = {idx: [] for idx in indices}
-    for t in trisos:
-        for idx in t.classify(lattice):
-            if idx in sorted(triso_locations):
-                # Create copy of TRISO particle with materials preserved and
-                # different cell/surface IDs
-                t_copy = copy.deepcopy(t)
-                t_copy.id = None
-                t_copy.fill = t.fill
-                t_copy._surface.id = None
-                triso_locations[idx].append(t_copy)
-            else:
-                warnings.warn('TRISO particle is partially or completely '
-                              'outside of the lattice.')
+    n = lattice.ndim
+
+    # Determine the range of lattice element indices overlapping the bounding
+    # box of each TRISO particle
+    centers = np.array([t.center for t in trisos], dtype=float).reshape(-1, 3)
+    radii = np.array([t._surface.r for t in trisos], dtype=float)[:, None]
+    idx_min = lattice.find_elements(centers - radii)[0]
+    idx_max = lattice.find_elements(centers + radii)[0]
+    extent = idx_max - idx_min + 1
+
+    # Pair each particle with every element in its range, ordering the pairs
+    # by particle and then by (z,y,x) element indices
+    max_extent = extent.max(axis=0) if len(trisos) > 0 else np.ones(n, int)
+    offsets = np.array(list(itertools.product(
+        *[range(m) for m in max_extent[::-1]])))[:, ::-1]
+    particle, k = np.nonzero(np.all(offsets < extent[:, None, :], axis=2))
+    elements = idx_min[particle] + offsets[k]
+
+    inside = np.all((elements >= 0) & (elements < shape), axis=1)
+    if not inside.all():
+        warnings.warn('TRISO particle is partially or completely '
+                      'outside of the lattice.')
+    particle = particle[inside]
+    elements = elements[inside]
+
+    # Create copies of TRISO particles with materials preserved and different
+    # cell/surface IDs
+    triso_copies = []
+    for i in particle:
+        t = trisos[i]
+        t_copy = t.clone(memo={id(t.fill): t.fill})
+        t_copy._surface = t_copy.region.surface
+        triso_copies.append(t_copy)
+
+    # Coordinates of the particle centers within their lattice elements
+    local_centers = centers[particle]
+    local_centers[:, :n] -= (np.asarray(lattice.lower_left) +
+                             (elements + 0.5)*np.asarray(lattice.pitch))
+
+    # Bucket the copies by lattice element
+    universes = np.empty(shape[::-1], dtype=openmc.Universe)
+    positions = np.ravel_multi_index(tuple(elements[:, ::-1].T),
+                                     universes.shape)
+    order = np.argsort(positions, kind='mergesort')
+    keys, starts = np.unique(positions[order], return_index=True)
+    buckets = dict(zip(keys, np.split(order, starts[1:])))
 
     # Create universes
-    universes = np.empty(shape[::-1], dtype=openmc.Universe)
-    for idx, triso_list in sorted(triso_locations.items()):
+    for position in range(universes.size):
+        bucket = buckets.get(position, [])
+        triso_list = [triso_copies[j] for j in bucket]
         if len(triso_list) > 0:
             outside_trisos = openmc.Intersection(~t.region for t in triso_list)
             background_cell = openmc.Cell(fill=background, region=outside_trisos)
@@ -520,12 +594,12 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
 
         u = openmc.Universe()
         u.add_cell(background_cell)
-        for t in triso_list:
+        for j, t in zip(bucket, triso_list):
             u.add_cell(t)
-            iz, iy, ix = idx
-            t.center = lattice.get_local_coordinates(t.center, (ix, iy, iz))
+            t.center = local_centers[j].copy()
 
-        if len(shape) == 2:
+        idx = np.unravel_index(position, universes.shape)
+        if n == 2:
             universes[-1 - idx[0], idx[1]] = u
         else:
             universes[idx[0], -1 - idx[1], idx[2]] = u
@@ -538,15 +612,28 @@ def create_triso_lattice(trisos, lower_left, pitch, shape, background):
     return lattice
 
 
-def _random_sequential_pack(domain, n_particles):
+# Offsets of a mesh cell and the mesh cells adjacent to it
+_ADJACENT_OFFSETS = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+
+
+def _random_sequential_pack(domain, n_particles, rng=None):
     """Random sequential packing of particles within a container.
 
+    Trial points are sampled in batches. The trial points overlapping particles
+    placed in earlier batches are rejected at once using a cell list, and the
+    rest are placed in order unless they overlap a particle placed earlier in
+    the same batch. This yields the same configuration as sampling and placing
+    trial points one at a time.
+
     Parameters
     ----------
     domain : openmc.model._Domain
         Container in which to pack particles.
     n_particles : int
         Number of particles to pack.
+    rng : numpy.random.RandomState, optional
+        Random number generator used to sample trial points. If not given,
+        trial points are sampled with the random module.
 
     Returns
     ------
@@ -556,25 +643,68 @@ def _random_sequential_pack(domain, n_particles):
     """
 
     sqd = (2*domain.particle_radius)**2
-    particles = []
-    mesh = defaultdict(list)
-
-    for i in range(n_particles):
-        # Randomly sample new center coordinates while there are any overlaps
-        while True:
-            p = domain.random_point()
-            idx = domain.mesh_cell(p)
-            if any((p[0]-q[0])**2 + (p[1]-q[1])**2 + (p[2]-q[2])**2 < sqd
-                   for q in mesh[idx]):
+    lower_left = np.asarray(domain.limits[0], dtype=float)
+    cell_length = np.asarray(domain.cell_length, dtype=float)
+    shape = np.maximum(np.ceil(
+        (np.asarray(domain.limits[1]) - lower_left)/cell_length
+    ).astype(int), 1)
+
+    # Each mesh cell holds a linked list of the particles whose centers are in
+    # it: 'head' is the first particle in each mesh cell and 'next_particle'
+    # the particle after each particle in its mesh cell, or -1 at the end
+    particles = np.empty((n_particles, 3))
+    head = np.full(int(np.prod(shape)), -1, dtype=int)
+    next_particle = np.full(n_particles, -1, dtype=int)
+
+    n = 0
+    n_trials = 0
+    while n < n_particles:
+        # Sample about as many trial points as needed to place the remaining
+        # particles at the acceptance rate so far. The batch size is limited
+        # since trial points are checked against each other one at a time.
+        size = (n_particles - n)*(n_trials + 1)//(n + 1)
+        size = min(max(size, 1), 1000)
+        n_trials += size
+        points = domain.random_points(size, rng)
+
+        idx = np.floor((points - lower_left)/cell_length)
+        idx = np.clip(idx, 0, shape - 1).astype(int)
+        cells = np.ravel_multi_index(tuple(idx.T), shape)
+
+        # Walk the linked lists of the mesh cells adjacent to each trial point
+        # in lockstep, rejecting trial points that overlap a particle
+        adjacent = idx[:, None, :] + _ADJACENT_OFFSETS
+        valid = np.all((adjacent >= 0) & (adjacent < shape), axis=2)
+        adjacent = np.clip(adjacent, 0, shape - 1)
+        adjacent = np.ravel_multi_index(tuple(np.moveaxis(adjacent, 2, 0)),
+                                        shape)
+        current = np.where(valid, head[adjacent], -1).ravel()
+        owner = np.repeat(np.arange(size), len(_ADJACENT_OFFSETS))
+        accepted = np.ones(size, dtype=bool)
+        active = current >= 0
+        while active.any():
+            current = current[active]
+            owner = owner[active]
+            dx = points[owner] - particles[current]
+            overlap = dx[:, 0]**2 + dx[:, 1]**2 + dx[:, 2]**2 < sqd
+            accepted[owner[overlap]] = False
+            current = next_particle[current]
+            active = (current >= 0) & accepted[owner]
+
+        # Place the remaining trial points in order
+        start = n
+        for i in np.flatnonzero(accepted):
+            dx = points[i] - particles[start:n]
+            if np.any(dx[:, 0]**2 + dx[:, 1]**2 + dx[:, 2]**2 < sqd):
                 continue
-            else:
+            particles[n] = points[i]
+            next_particle[n] = head[cells[i]]
+            head[cells[i]] = n
+            n += 1
+            if n == n_particles:
                 break
-        particles.append(p)
 
-        for idx in domain.nearby_mesh_cells(p):
-            mesh[idx].append(p)
-
-    return np.array(particles)
+    return particles
 
 
 def _close_random_pack(domain, particles, contraction_rate):
@@ -877,84 +1007,418 @@ def _close_random_pack(domain, particles, contraction_rate):
                 break
 
 
-def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
-                domain_radius=None, domain_center=[0., 0., 0.],
-                n_particles=None, packing_fraction=None,
-                initial_packing_fraction=0.3, contraction_rate=1/400, seed=1):
-    """Generate a random, non-overlapping configuration of TRISO particles
-    within a container.
+class _CellList(object):
+    """Particles binned into the cells of a uniform mesh over a domain
+
+    Each mesh cell has a fixed number of slots holding the indices of the
+    particles whose centers are in the cell, so that the particles near many
+    points can be gathered with array indexing. Slots vacated by particles
+    which move to another cell are left empty, and the slots are rebuilt when
+    a cell overflows.
 
     Parameters
     ----------
-    radius : float
-        Outer radius of TRISO particles.
-    fill : openmc.Universe
-        Universe which contains all layers of the TRISO particle.
-    domain_shape : {'cube', 'cylinder', or 'sphere'}
-        Geometry of the container in which the TRISO particles are packed.
-    domain_length : float
-        Length of the container (if cube or cylinder).
-    domain_radius : float
-        Radius of the container (if cylinder or sphere).
-    domain_center : Iterable of float
-        Cartesian coordinates of the center of the container.
-    n_particles : int
-        Number of TRISO particles to pack in the domain. Exactly one of
-        'n_particles' and 'packing_fraction' should be specified -- the other
-        will be calculated.
-    packing_fraction : float
-        Packing fraction of particles. Exactly one of 'n_particles' and
-        'packing_fraction' should be specified -- the other will be calculated.
-    initial_packing_fraction : float, optional
-        Packing fraction used to initialize the configuration of particles in
-        the domain. Default value is 0.3. It is not recommended to set the
-        initial packing fraction much higher than 0.3 as the random sequential
-        packing algorithm becomes prohibitively slow as it approaches its limit
-        (~0.38).
-    contraction_rate : float, optional
-        Contraction rate of outer diameter. This can affect the speed of the
-        close random packing algorithm. Default value is 1/400.
-    seed : int, optional
-        RNG seed.
+    lower_left : Iterable of float
+        Lower-left coordinates of the mesh
+    upper_right : Iterable of float
+        Upper-right coordinates of the mesh
+    cell_length : Iterable of float
+        Length in x-, y-, and z- directions of each mesh cell
+    points : numpy.ndarray
+        Cartesian coordinates of the particle centers with shape (N, 3)
 
-    Returns
-    -------
-    trisos : list of openmc.model.TRISO
-        List of TRISO particles in the domain.
+    """
 
-    Notes
-    -----
-    The particle configuration is generated using a combination of random
-    sequential packing (RSP) and close random packing (CRP). RSP performs
-    better than CRP for lower packing fractions (pf), but it becomes
-    prohibitively slow as it approaches its packing limit (~0.38). CRP can
-    achieve higher pf of up to ~0.64 and scales better with increasing pf.
+    def __init__(self, lower_left, upper_right, cell_length, points):
+        self._lower_left = np.asarray(lower_left, dtype=float)
+        self._cell_length = np.asarray(cell_length, dtype=float)
+        self._shape = np.maximum(np.ceil(
+            (np.asarray(upper_right) - self._lower_left)/self._cell_length
+        ).astype(int), 1)
+        self._cells = self.mesh_cells(points)
+        self._build_table()
+
+    def _build_table(self):
+        """Place each particle in the next free slot of its mesh cell"""
+        n_cells = int(np.prod(self._shape))
+        self._counts = np.bincount(self._cells, minlength=n_cells)
+        order = np.argsort(self._cells, kind='mergesort')
+        start = np.cumsum(self._counts) - self._counts
+        self._slots = np.empty_like(order)
+        self._slots[order] = np.arange(len(order)) - start[self._cells[order]]
+
+        # Leave room for a few more particles in each cell
+        self._table = np.full((n_cells, self._counts.max() + 2), -1,
+                              dtype=int)
+        self._table[self._cells, self._slots] = np.arange(len(order))
+
+    def mesh_cells(self, points):
+        """Return the mesh cells containing points
 
-    If the desired pf is below some threshold for which RSP will be faster than
-    CRP ('initial_packing_fraction'), only RSP is used. If a higher pf is
-    required, particles with a radius smaller than the desired final radius
-    (and therefore with a smaller pf) are initialized within the domain using
-    RSP. This initial configuration of particles is then used as a starting
-    point for CRP using Jodrey and Tory's algorithm [1]_.
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
 
-    In RSP, particle centers are placed one by one at random, and placement
-    attempts for a particle are made until the particle is not overlapping any
-    others. This implementation of the algorithm uses a mesh over the domain
-    to speed up the nearest neighbor search by only searching for a particle's
-    neighbors within that mesh cell.
+        Returns
+        -------
+        numpy.ndarray
+            Index of the mesh cell containing each point
 
-    In CRP, each particle is assigned two diameters, and inner and an outer,
-    which approach each other during the simulation. The inner diameter,
-    defined as the minimum center-to-center distance, is the true diameter of
-    the particles and defines the pf. At each iteration the worst overlap
-    between particles based on outer diameter is eliminated by moving the
-    particles apart along the line joining their centers. Iterations continue
-    until the two diameters converge or until the desired pf is reached.
+        """
+        idx = np.floor((points - self._lower_left)/self._cell_length)
+        idx = np.clip(idx, 0, self._shape - 1).astype(int)
+        return np.ravel_multi_index(tuple(idx.T), self._shape)
 
-    References
+    def move(self, indices, points):
+        """Update the mesh cells of particles which have moved
+
+        Parameters
+        ----------
+        indices : numpy.ndarray
+            Indices of distinct particles
+        points : numpy.ndarray
+            New Cartesian coordinates of the particle centers with shape
+            (N, 3)
+
+        """
+        cells = self.mesh_cells(points)
+        changed = cells != self._cells[indices]
+        indices = indices[changed]
+        cells = cells[changed]
+        self._table[self._cells[indices], self._slots[indices]] = -1
+        self._cells[indices] = cells
+
+        # Append the particles after the slots used in their new cells,
+        # ranking the particles moving into the same cell
+        order = np.argsort(cells, kind='mergesort')
+        indices = indices[order]
+        cells = cells[order]
+        rank = np.arange(len(cells)) - np.searchsorted(cells, cells)
+        slots = self._counts[cells] + rank
+        if len(slots) > 0 and slots.max() >= self._table.shape[1]:
+            self._build_table()
+        else:
+            self._table[cells, slots] = indices
+            self._slots[indices] = slots
+            self._counts += np.bincount(cells, minlength=len(self._counts))
+
+    def nearest(self, points, indices):
+        """Find the nearest neighbor of particles
+
+        The particles in the mesh cells adjacent to the cell of each particle
+        are searched first. A neighbor closer than the length of a mesh cell is
+        the nearest one, since all particles within that distance are in the
+        adjacent cells. Otherwise, the search is repeated over larger blocks of
+        mesh cells.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of all particle centers with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the particles whose nearest neighbors are found
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the nearest neighbor of each particle, or -1 if there are
+            no other particles
+        numpy.ndarray
+            Distance between the centers of each particle and its nearest
+            neighbor
+
+        """
+        neighbors = np.full(len(indices), -1, dtype=int)
+        distances = np.full(len(indices), np.inf)
+        remaining = np.arange(len(indices))
+        reach = 1
+        while len(remaining) > 0:
+            k, d = self._search(points, indices[remaining], reach)
+            neighbors[remaining] = k
+            distances[remaining] = d
+            if reach >= self._shape.max() - 1:
+                break
+            remaining = remaining[d > reach*self._cell_length.min()]
+            reach += 1
+
+        return neighbors, distances
+
+    def _search(self, points, indices, reach):
+        """Find the nearest neighbor of particles within a block of mesh cells
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of all particle centers with shape (N, 3)
+        indices : numpy.ndarray
+            Indices of the particles whose nearest neighbors are found
+        reach : int
+            Number of mesh cells searched on each side of the cell containing
+            each particle
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the nearest neighbor of each particle, or -1 if there are
+            no other particles in the block of mesh cells
+        numpy.ndarray
+            Distance between the centers of each particle and its nearest
+            neighbor
+
+        """
+        if reach == 1:
+            offsets = _ADJACENT_OFFSETS
+        else:
+            offsets = np.array(list(itertools.product(
+                range(-reach, reach + 1), repeat=3)))
+
+        neighbors = np.full(len(indices), -1, dtype=int)
+        distances = np.full(len(indices), np.inf)
+
+        # Limit the size of the arrays of candidate neighbors
+        n_candidates = len(offsets)*self._table.shape[1]
+        chunk = max(1, 2**20 // n_candidates)
+        for start in range(0, len(indices), chunk):
+            i = indices[start:start + chunk]
+            p = points[i]
+
+            # Gather the particles in the block of mesh cells
+            idx = np.floor((p - self._lower_left)/self._cell_length)
+            idx = np.clip(idx, 0, self._shape - 1).astype(int)
+            adjacent = idx[:, None, :] + offsets
+            valid = np.all((adjacent >= 0) & (adjacent < self._shape), axis=2)
+            adjacent = np.clip(adjacent, 0, self._shape - 1)
+            cells = np.ravel_multi_index(tuple(np.moveaxis(adjacent, 2, 0)),
+                                         self._shape)
+            candidates = self._table[cells]
+            candidates[~valid] = -1
+            candidates = candidates.reshape(len(i), -1)
+
+            # Accumulate squared distances one coordinate at a time to avoid
+            # gathering an array of candidate coordinates
+            d2 = np.zeros(candidates.shape)
+            for axis in range(3):
+                d2 += (points[candidates, axis] - p[:, axis, None])**2
+            d2[(candidates < 0) | (candidates == i[:, None])] = np.inf
+            j = np.argmin(d2, axis=1)
+            rows = np.arange(len(i))
+            found = np.isfinite(d2[rows, j])
+            neighbors[start:start + chunk][found] = candidates[rows, j][found]
+            distances[start:start + chunk][found] = np.sqrt(d2[rows, j][found])
+
+        return neighbors, distances
+
+
+def _close_random_pack_fast(domain, particles, contraction_rate):
+    """Close random packing of particles using a batched variant of the
+    Jodrey-Tory algorithm.
+
+    The shortest rods are removed from the rod list in batches of up to 5% of
+    the particles. Since each particle is in at most one rod, the rods of a
+    batch are disjoint, and their overlaps are eliminated at once with array
+    operations. The nearest neighbors of all particles are kept in arrays,
+    and after each batch they are found with a single search of a cell list
+    for the moved particles and the particles whose nearest neighbor moved.
+    The outer diameter is still reduced once per rod, in the order the rods
+    are removed.
+
+    Parameters
     ----------
-    .. [1] W. S. Jodrey and E. M. Tory, "Computer simulation of close random
-       packing of equal spheres", Phys. Rev. A 32 (1985) 2347-2351.
+    domain : openmc.model._Domain
+        Container in which to pack particles.
+    particles : numpy.ndarray
+        Initial Cartesian coordinates of centers of particles.
+    contraction_rate : float
+        Contraction rate of outer diameter.
+
+    """
+
+    def add_rod(d, i, j):
+        rod = [d, i, j]
+        rods_map[i] = (j, rod)
+        rods_map[j] = (i, rod)
+        heappush(rods, rod)
+
+    def remove_rod(i):
+        if i in rods_map:
+            j, rod = rods_map.pop(i)
+            del rods_map[j]
+            rod[1] = removed
+            rod[2] = removed
+
+    def pop_rod():
+        while rods:
+            d, i, j = heappop(rods)
+            if i != removed and j != removed:
+                del rods_map[i]
+                del rods_map[j]
+                return d, i, j
+
+    def create_rod_list():
+        """Find the nearest neighbor of every particle and generate the heap
+        of rods between particles which are each other's nearest neighbors.
+
+        """
+
+        indices = np.arange(n_particles)
+        neighbor[:], distance[:] = cells.nearest(particles, indices)
+        mutual = ((neighbor > indices) &
+                  (neighbor[np.maximum(neighbor, 0)] == indices))
+
+        del rods[:]
+        rods_map.clear()
+        for d, i, k in zip(distance[mutual].tolist(),
+                           indices[mutual].tolist(),
+                           neighbor[mutual].tolist()):
+            rod = [d, i, k]
+            rods_map[i] = (k, rod)
+            rods_map[k] = (i, rod)
+            rods.append(rod)
+        heapify(rods)
+
+    def update_rod_list(moved):
+        """Update the nearest neighbors after a batch of particles moved and
+        add rods between particles which have become each other's nearest
+        neighbors.
+
+        Parameters
+        ----------
+        moved : numpy.ndarray
+            Indices of the moved particles.
+
+        """
+
+        # Find the nearest neighbors of the moved particles and of the
+        # particles whose nearest neighbor moved
+        queried = np.union1d(moved, np.flatnonzero(np.in1d(neighbor, moved)))
+        k, d = cells.nearest(particles, queried)
+        neighbor[queried] = k
+        distance[queried] = d
+
+        # A particle may have become the nearest neighbor of its own nearest
+        # neighbor. Writing the closest particles last keeps the nearest one
+        # when several particles share a neighbor.
+        closer = k >= 0
+        closer[closer] = d[closer] < distance[k[closer]]
+        order = np.argsort(-d[closer], kind='mergesort')
+        neighbor[k[closer][order]] = queried[closer][order]
+        distance[k[closer][order]] = d[closer][order]
+
+        # Add rods between particles which are each other's nearest neighbors
+        mutual = k >= 0
+        mutual[mutual] = neighbor[k[mutual]] == queried[mutual]
+        first = np.minimum(queried[mutual], k[mutual])
+        second = np.maximum(queried[mutual], k[mutual])
+        _, unique = np.unique(first*n_particles + second, return_index=True)
+        for d_ik, i, k_i in zip(d[mutual][unique].tolist(),
+                                first[unique].tolist(),
+                                second[unique].tolist()):
+            remove_rod(i)
+            remove_rod(k_i)
+            add_rod(d_ik, i, k_i)
+
+    def reduce_outer_diameter():
+        inner_pf = (4/3 * pi * (inner_diameter/2)**3 * n_particles /
+                    domain.volume)
+        outer_pf = (4/3 * pi * (outer_diameter/2)**3 * n_particles /
+                    domain.volume)
+
+        j = floor(-log10(outer_pf - inner_pf))
+        return (outer_diameter - 0.5**j * contraction_rate *
+                initial_outer_diameter / n_particles)
+
+    n_particles = len(particles)
+    diameter = 2*domain.particle_radius
+    lower_left = np.asarray(domain.limits[0])
+    upper_right = np.asarray(domain.limits[1])
+    batch_size = max(1, n_particles // 20)
+
+    # Flag for marking rods that have been removed from priority queue
+    removed = -1
+
+    # Outer diameter initially set to arbitrary value that yields pf of 1
+    initial_outer_diameter = 2*(domain.volume/(n_particles*4/3*pi))**(1/3)
+
+    # Inner and outer diameter of particles will change during packing
+    outer_diameter = initial_outer_diameter
+    inner_diameter = 0
+
+    rods = []
+    rods_map = {}
+    neighbor = np.empty(n_particles, dtype=int)
+    distance = np.empty(n_particles)
+
+    # Mesh cells slightly larger than the particles hold few particles, while
+    # the nearest neighbor of most particles is still in an adjacent cell
+    cells = _CellList(lower_left, upper_right, [1.25*diameter]*3, particles)
+
+    while True:
+        create_rod_list()
+        if rods:
+            inner_diameter = rods[0][0]
+        if inner_diameter >= diameter or not rods:
+            break
+
+        while True:
+            # Remove the shortest overlapping rods and the outer diameter used
+            # to eliminate the overlap of each. The shortest rod remaining is
+            # the inner diameter when the outer diameter is reduced.
+            batch = []
+            outer = []
+            while len(batch) < batch_size:
+                rod = pop_rod()
+                if rod is None:
+                    break
+                if rod[0] >= diameter:
+                    add_rod(*rod)
+                    break
+                batch.append(rod)
+                inner_diameter = rod[0]
+                outer_diameter = reduce_outer_diameter()
+                outer.append(outer_diameter)
+            if not batch:
+                break
+            d, i, j = (np.array(x) for x in zip(*batch))
+            i = i.astype(int)
+            j = j.astype(int)
+
+            # Move each pair of particles apart along the line joining their
+            # centers so that their distance is equal to the outer diameter,
+            # and apply reflective boundary conditions
+            r = (np.array(outer) - d)/2
+            v = (particles[i] - particles[j])/d[:, None]
+            particles[i] = np.clip(particles[i] + r[:, None]*v, lower_left,
+                                   upper_right)
+            particles[j] = np.clip(particles[j] - r[:, None]*v, lower_left,
+                                   upper_right)
+
+            moved = np.concatenate((i, j))
+            cells.move(moved, particles[moved])
+            update_rod_list(moved)
+
+            # Set inner diameter to the shortest distance between two particle
+            # centers
+            if rods:
+                inner_diameter = rods[0][0]
+            if inner_diameter >= diameter or not rods:
+                break
+
+
+def _pack_particles(radius, domain_shape='cylinder', domain_length=None,
+                    domain_radius=None, domain_center=[0., 0., 0.],
+                    n_particles=None, packing_fraction=None,
+                    initial_packing_fraction=0.3, contraction_rate=1/400,
+                    seed=1, method='standard'):
+    """Generate a random, non-overlapping configuration of particle centers
+    within a container.
+
+    The parameters are the same as for :func:`pack_trisos` except for 'fill'.
+
+    Returns
+    -------
+    numpy.ndarray
+        Cartesian coordinates of centers of particles.
 
     """
 
@@ -963,6 +1427,7 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
         raise ValueError('Unable to set domain_shape to "{}". Only "cube", '
                          '"cylinder", and "sphere" are '
                          'supported."'.format(domain_shape))
+    cv.check_value('method', method, ('standard', 'fast'))
     if not domain_length and domain_shape in ['cube', 'cylinder']:
         raise ValueError('"domain_length" must be specified for {} domain '
                          'geometry '.format(domain_shape))
@@ -1023,16 +1488,245 @@ def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
 
     # Generate non-overlapping particles for an initial inner radius using
     # random sequential packing algorithm
-    particles = _random_sequential_pack(domain, n_particles)
+    rng = np.random.RandomState(seed) if method == 'fast' else None
+    particles = _random_sequential_pack(domain, n_particles, rng)
 
     # Use the particle configuration produced in random sequential packing as a
     # starting point for close random pack with the desired final particle
     # radius
     if initial_packing_fraction != packing_fraction:
         domain.particle_radius = radius
-        _close_random_pack(domain, particles, contraction_rate)
+        if method == 'fast':
+            _close_random_pack_fast(domain, particles, contraction_rate)
+        else:
+            _close_random_pack(domain, particles, contraction_rate)
+
+    return particles
+
+
+def _pack_task(kwargs):
+    """Generate particle centers in one container of :func:`pack_trisos_many`
+    in a worker process.
+
+    """
+    return _pack_particles(**kwargs)
+
+
+def pack_trisos(radius, fill, domain_shape='cylinder', domain_length=None,
+                domain_radius=None, domain_center=[0., 0., 0.],
+                n_particles=None, packing_fraction=None,
+                initial_packing_fraction=0.3, contraction_rate=1/400, seed=1,
+                method='standard'):
+    """Generate a random, non-overlapping configuration of TRISO particles
+    within a container.
+
+    Parameters
+    ----------
+    radius : float
+        Outer radius of TRISO particles.
+    fill : openmc.Universe
+        Universe which contains all layers of the TRISO particle.
+    domain_shape : {'cube', 'cylinder', or 'sphere'}
+        Geometry of the container in which the TRISO particles are packed.
+    domain_length : float
+        Length of the container (if cube or cylinder).
+    domain_radius : float
+        Radius of the container (if cylinder or sphere).
+    domain_center : Iterable of float
+        Cartesian coordinates of the center of the container.
+    n_particles : int
+        Number of TRISO particles to pack in the domain. Exactly one of
+        'n_particles' and 'packing_fraction' should be specified -- the other
+        will be calculated.
+    packing_fraction : float
+        Packing fraction of particles. Exactly one of 'n_particles' and
+        'packing_fraction' should be specified -- the other will be calculated.
+    initial_packing_fraction : float, optional
+        Packing fraction used to initialize the configuration of particles in
+        the domain. Default value is 0.3. It is not recommended to set the
+        initial packing fraction much higher than 0.3 as the random sequential
+        packing algorithm becomes prohibitively slow as it approaches its limit
+        (~0.38).
+    contraction_rate : float, optional
+        Contraction rate of outer diameter. This can affect the speed of the
+        close random packing algorithm. Default value is 1/400.
+    seed : int, optional
+        RNG seed.
+    method : {'standard', 'fast'}, optional
+        Implementation of the packing algorithms. The 'fast' method samples
+        trial points with NumPy and eliminates overlaps in batches using array
+        operations, and it does not require SciPy; it does not reproduce the
+        configurations generated by the 'standard' method. Default value is
+        'standard'.
+
+    Returns
+    -------
+    trisos : list of openmc.model.TRISO
+        List of TRISO particles in the domain.
+
+    Notes
+    -----
+    The particle configuration is generated using a combination of random
+    sequential packing (RSP) and close random packing (CRP). RSP performs
+    better than CRP for lower packing fractions (pf), but it becomes
+    prohibitively slow as it approaches its packing limit (~0.38). CRP can
+    achieve higher pf of up to ~0.64 and scales better with increasing pf.
+
+    If the desired pf is below some threshold for which RSP will be faster than
+    CRP ('initial_packing_fraction'), only RSP is used. If a higher pf is
+    required, particles with a radius smaller than the desired final radius
+    (and therefore with a smaller pf) are initialized within the domain using
+    RSP. This initial configuration of particles is then used as a starting
+    point for CRP using Jodrey and Tory's algorithm [1]_.
+
+    In RSP, particle centers are placed one by one at random, and placement
+    attempts for a particle are made until the particle is not overlapping any
+    others. This implementation of the algorithm samples trial points in
+    batches and uses a cell list over the domain to speed up the overlap
+    search by only checking particles in the adjacent mesh cells.
+
+    In CRP, each particle is assigned two diameters, and inner and an outer,
+    which approach each other during the simulation. The inner diameter,
+    defined as the minimum center-to-center distance, is the true diameter of
+    the particles and defines the pf. At each iteration the worst overlap
+    between particles based on outer diameter is eliminated by moving the
+    particles apart along the line joining their centers. Iterations continue
+    until the two diameters converge or until the desired pf is reached.
+
+    With method='fast', trial points for RSP are sampled with NumPy rather than
+    the random module. In CRP, the shortest rods are removed from the rod list
+    in batches of about one per thousand particles, and the overlaps within
+    each batch are eliminated at once. Nearest neighbors are found with a cell
+    list and only the rods of the moved particles are updated after each batch.
+    This scales better to large numbers of particles at the cost of a small
+    departure from the strictly sequential ordering of the original algorithm.
+
+    References
+    ----------
+    .. [1] W. S. Jodrey and E. M. Tory, "Computer simulation of close random
+       packing of equal spheres", Phys. Rev. A 32 (1985) 2347-2351.
+
+    """
+
+    particles = _pack_particles(
+        radius, domain_shape, domain_length, domain_radius, domain_center,
+        n_particles, packing_fraction, initial_packing_fraction,
+        contraction_rate, seed, method)
 
     trisos = []
     for p in particles:
         trisos.append(TRISO(radius, fill, p))
     return trisos
+
+
+def pack_trisos_many(domains, seeds, processes=None, path=None, **kwargs):
+    """Generate random, non-overlapping configurations of TRISO particles
+    within many independent containers in parallel.
+
+    Parameters
+    ----------
+    domains : Iterable of dict
+        Keyword arguments of :func:`pack_trisos` describing each container,
+        e.g. 'domain_shape', 'domain_length', 'domain_radius', and
+        'domain_center'. These take precedence over the keyword arguments
+        common to all containers.
+    seeds : Iterable of int
+        RNG seed for each container. The configuration of particles in a
+        container depends only on its arguments and seed, not on the process
+        which packs it or on the number of processes.
+    processes : int or None, optional
+        Number of processes to use. If None, the number of CPUs is used.
+    path : str, optional
+        Path of an HDF5 file to write the particle centers to as they are
+        generated. The centers in the i-th container are written to the
+        dataset 'domains/<i>' with its seed as the 'seed' attribute, and they
+        can be read back with :func:`read_triso_centers`.
+    **kwargs
+        Keyword arguments of :func:`pack_trisos` common to all containers,
+        except 'fill' and 'seed'.
+
+    Returns
+    -------
+    list of numpy.ndarray or None
+        Cartesian coordinates of the centers of the particles in each
+        container with shape (N, 3). TRISO particles can be created from the
+        centers ``p`` of a container with
+        ``[TRISO(radius, fill, x) for x in p]``. If a path is given, the
+        centers are only written to the file and None is returned.
+
+    """
+
+    domains = list(domains)
+    seeds = list(seeds)
+    cv.check_iterable_type('seeds', seeds, Integral)
+    if len(seeds) != len(domains):
+        raise ValueError('Unable to pack TRISO particles in {} domains with '
+                         '{} seeds'.format(len(domains), len(seeds)))
+    if processes is not None:
+        cv.check_type('processes', processes, Integral)
+        cv.check_greater_than('processes', processes, 0)
+
+    tasks = []
+    for domain, seed in zip(domains, seeds):
+        task = dict(kwargs)
+        task.update(domain)
+        task['seed'] = seed
+        tasks.append(task)
+
+    if processes == 1 or len(tasks) <= 1:
+        pool = None
+        results = (_pack_task(task) for task in tasks)
+    else:
+        pool = multiprocessing.Pool(processes)
+        results = pool.imap(_pack_task, tasks)
+
+    if path is not None:
+        import h5py
+        f = h5py.File(path, 'w')
+
+    # Keep the centers in memory only if they are not written to a file
+    centers = None if path is not None else []
+    try:
+        for i, particles in enumerate(results):
+            if path is not None:
+                dset = f.create_dataset('domains/{}'.format(i), data=particles)
+                dset.attrs['seed'] = seeds[i]
+            else:
+                centers.append(particles)
+    finally:
+        if path is not None:
+            f.close()
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return centers
+
+
+def read_triso_centers(path, index=None):
+    """Read the centers of TRISO particles written by
+    :func:`pack_trisos_many`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the HDF5 file the particle centers were written to
+    index : int or None, optional
+        Index of the container to read the centers in. If None, the centers
+        in every container are read.
+
+    Returns
+    -------
+    numpy.ndarray or list of numpy.ndarray
+        Cartesian coordinates of the centers of the particles with shape
+        (N, 3), either in the requested container or in each container
+
+    """
+
+    import h5py
+    with h5py.File(path, 'r') as f:
+        group = f['domains']
+        if index is not None:
+            cv.check_type('index', index, Integral)
+            return group[str(index)].value
+        return [group[str(i)].value for i in range(len(group))]
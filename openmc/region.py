@@ -1,15 +1,16 @@
 from abc import ABCMeta, abstractmethod
 from collections import Iterable, OrderedDict, MutableSequence
-from copy import deepcopy
+from copy import copy
 
 from six import add_metaclass
 import numpy as np
 
 from openmc.checkvalue import check_type
+from openmc.mixin import ChangeNotifierMixin
 
 
 @add_metaclass(ABCMeta)
-class Region(object):
+class Region(ChangeNotifierMixin):
     """Region of space that can be assigned to a cell.
 
     Region is an abstract base class that is inherited by
@@ -68,6 +69,38 @@ class Region(object):
             surfaces = region.get_surfaces(surfaces)
         return surfaces
 
+    def compile(self):
+        """Flatten the region into a postfix program of half-spaces and
+        operators.
+
+        The compiled region tests whether points are in the region without
+        walking the region tree, and can test many points at once.
+
+        Returns
+        -------
+        openmc.CompiledRegion
+            Postfix program equivalent to the region
+
+        """
+        surfaces = []
+        program = []
+        self._compile(surfaces, {}, program)
+        return CompiledRegion(surfaces, program)
+
+    def _add_dependent_to_nodes(self, dependent):
+        """Subscribe a dependent to the changes of this region, of every
+        region it is composed of, and of their surfaces
+
+        Parameters
+        ----------
+        dependent : openmc.mixin._Dependent
+            Token invalidated by the first change of a kind it depends on
+
+        """
+        self._add_dependent(dependent)
+        for region in self:
+            region._add_dependent_to_nodes(dependent)
+
     @staticmethod
     def from_expression(expression, surfaces):
         """Generate a region given an infix expression.
@@ -292,15 +325,18 @@ class Intersection(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._changed('region')
 
     def __delitem__(self, key):
         del self._nodes[key]
+        self._changed('region')
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        self._changed('region')
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -321,6 +357,20 @@ class Intersection(Region, MutableSequence):
     def __str__(self):
         return '(' + ' '.join(map(str, self)) + ')'
 
+    def _compile(self, surfaces, index, program):
+        program.append(('&', self._compile_operands(surfaces, index, program)))
+
+    def _compile_operands(self, surfaces, index, program):
+        # Operands of nested intersections are intersected directly
+        n = 0
+        for node in self:
+            if isinstance(node, Intersection):
+                n += node._compile_operands(surfaces, index, program)
+            else:
+                node._compile(surfaces, index, program)
+                n += 1
+        return n
+
     @property
     def bounding_box(self):
         lower_left = np.array([-np.inf, -np.inf, -np.inf])
@@ -351,8 +401,8 @@ class Intersection(Region, MutableSequence):
         if memo is None:
             memo = {}
 
-        clone = deepcopy(self)
-        clone[:] = [n.clone(memo) for n in self]
+        clone = copy(self)
+        clone._nodes = [n.clone(memo) for n in self]
         return clone
 
 
@@ -404,15 +454,18 @@ class Union(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._changed('region')
 
     def __delitem__(self, key):
         del self._nodes[key]
+        self._changed('region')
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        self._changed('region')
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -433,6 +486,20 @@ class Union(Region, MutableSequence):
     def __str__(self):
         return '(' + ' | '.join(map(str, self)) + ')'
 
+    def _compile(self, surfaces, index, program):
+        program.append(('|', self._compile_operands(surfaces, index, program)))
+
+    def _compile_operands(self, surfaces, index, program):
+        # Operands of nested unions are joined directly
+        n = 0
+        for node in self:
+            if isinstance(node, Union):
+                n += node._compile_operands(surfaces, index, program)
+            else:
+                node._compile(surfaces, index, program)
+                n += 1
+        return n
+
     @property
     def bounding_box(self):
         lower_left = np.array([np.inf, np.inf, np.inf])
@@ -463,8 +530,8 @@ class Union(Region, MutableSequence):
         if memo is None:
             memo = {}
 
-        clone = copy.deepcopy(self)
-        clone[:] = [n.clone(memo) for n in self]
+        clone = copy(self)
+        clone._nodes = [n.clone(memo) for n in self]
         return clone
 
 
@@ -519,6 +586,10 @@ class Complement(Region):
     def __str__(self):
         return '~' + str(self.node)
 
+    def _compile(self, surfaces, index, program):
+        self.node._compile(surfaces, index, program)
+        program.append(('~', 1))
+
     @property
     def node(self):
         return self._node
@@ -527,6 +598,7 @@ class Complement(Region):
     def node(self, node):
         check_type('node', node, Region)
         self._node = node
+        self._changed('region')
 
     @property
     def bounding_box(self):
@@ -564,6 +636,10 @@ class Complement(Region):
             surfaces = region.get_surfaces(surfaces)
         return surfaces
 
+    def _add_dependent_to_nodes(self, dependent):
+        self._add_dependent(dependent)
+        self.node._add_dependent_to_nodes(dependent)
+
     def clone(self, memo=None):
         """Create a copy of this region - each of the surfaces in the
         complement's node will be cloned and will have new unique IDs.
@@ -584,6 +660,173 @@ class Complement(Region):
         if memo is None:
             memo = {}
 
-        clone = copy.deepcopy(self)
+        clone = copy(self)
         clone.node = self.node.clone(memo)
         return clone
+
+
+class CompiledRegion(object):
+    """Region flattened into a postfix program of half-spaces and operators.
+
+    Instances of this class are created with :meth:`Region.compile`. The
+    program is evaluated with a stack: each half-space pushes whether points
+    are on its side of a surface, and each operator replaces the entries on
+    top of the stack with their intersection, union, or complement. Each
+    surface is evaluated only once, even if it appears in several half-spaces.
+
+    Parameters
+    ----------
+    surfaces : list of openmc.Surface
+        Distinct surfaces referenced by the region
+    program : list of tuple
+        Instructions of the postfix program
+
+    Attributes
+    ----------
+    surfaces : list of openmc.Surface
+        Distinct surfaces referenced by the region
+    program : list of tuple
+        Instructions of the postfix program. The instructions ('+', i) and
+        ('-', i) push the positive or negative half-space of the i-th surface,
+        ('&', n) and ('|', n) replace the top n entries with their intersection
+        or union, and ('~', 1) replaces the top entry with its complement.
+
+    """
+
+    def __init__(self, surfaces, program):
+        self.surfaces = surfaces
+        self.program = program
+        self._function = None
+
+    def __getstate__(self):
+        # The translated function refers to the surfaces by their bound
+        # methods, so it is rebuilt rather than copied or pickled
+        state = self.__dict__.copy()
+        state['_function'] = None
+        return state
+
+    def __contains__(self, point):
+        """Check whether a point is contained in the region.
+
+        Parameters
+        ----------
+        point : 3-tuple of float
+            Cartesian coordinates, :math:`(x',y',z')`, of the point
+
+        Returns
+        -------
+        bool
+            Whether the point is in the region
+
+        """
+        # Surface equations are much cheaper to evaluate with Python floats
+        # than with NumPy scalars
+        point = tuple(float(x) for x in point)
+
+        if self._function is None:
+            self._function = self._build_function()
+        if self._function is not False:
+            return self._function(point)
+
+        values = [s.evaluate(point) for s in self.surfaces]
+        stack = []
+        for op, arg in self.program:
+            if op == '+':
+                stack.append(values[arg] >= 0.)
+            elif op == '-':
+                stack.append(values[arg] < 0.)
+            elif op == '~':
+                stack[-1] = not stack[-1]
+            else:
+                operands = stack[len(stack) - arg:]
+                del stack[len(stack) - arg:]
+                stack.append(all(operands) if op == '&' else any(operands))
+        return stack[0]
+
+    def _build_function(self):
+        """Translate the program into a Python function testing a single point.
+
+        Unlike the stack evaluation of the program, the function only
+        evaluates the surfaces needed to decide whether a point is in the
+        region, since the translated boolean operators short-circuit.
+
+        Returns
+        -------
+        function or False
+            Function of a point returning whether it is in the region, or False
+            if the region is too deeply nested to be translated
+
+        """
+        stack = []
+        for op, arg in self.program:
+            if op == '+':
+                stack.append('(e[{}](p) >= 0.)'.format(arg))
+            elif op == '-':
+                stack.append('(e[{}](p) < 0.)'.format(arg))
+            elif op == '~':
+                stack[-1] = '(not {})'.format(stack[-1])
+            else:
+                operands = stack[len(stack) - arg:]
+                del stack[len(stack) - arg:]
+                if not operands:
+                    stack.append('True' if op == '&' else 'False')
+                else:
+                    join = ' and ' if op == '&' else ' or '
+                    stack.append('(' + join.join(operands) + ')')
+
+        evaluators = [s.evaluate for s in self.surfaces]
+        try:
+            return eval('lambda p: bool({})'.format(stack[0]),
+                        {'e': evaluators})
+        except (SyntaxError, MemoryError, RuntimeError):
+            return False
+
+    def contains(self, points, values=None):
+        """Check which of many points are contained in the region.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+        values : dict, optional
+            Surface equations already evaluated at the points, keyed by the
+            Python identity of the surface. Surfaces evaluated by this method
+            are added to it, so that several regions can share evaluations.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the region
+
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if values is None:
+            values = {}
+
+        # The surface equations operate elementwise, so evaluating them on the
+        # transposed coordinates gives the values at all points at once
+        surface_values = []
+        for s in self.surfaces:
+            key = id(s)
+            if key not in values:
+                values[key] = s.evaluate(points.T)
+            surface_values.append(values[key])
+
+        stack = []
+        for op, arg in self.program:
+            if op == '+':
+                stack.append(surface_values[arg] >= 0.)
+            elif op == '-':
+                stack.append(surface_values[arg] < 0.)
+            elif op == '~':
+                stack[-1] = ~stack[-1]
+            else:
+                operands = stack[len(stack) - arg:]
+                del stack[len(stack) - arg:]
+                if not operands:
+                    stack.append(np.full(len(points), op == '&'))
+                elif op == '&':
+                    stack.append(np.logical_and.reduce(operands))
+                else:
+                    stack.append(np.logical_or.reduce(operands))
+        return stack[0]
@@ -1,15 +1,198 @@
+from collections import defaultdict
+import copy
+from numbers import Integral
 import re
 import os
 import warnings
 import glob
+from multiprocessing import Pool
+import weakref
 
+from six import string_types
 import numpy as np
 import h5py
 
 import openmc
 import openmc.checkvalue as cv
+from openmc.mixin import ChangeNotifierMixin, _Dependent
 
 _VERSION_STATEPOINT = 17
+_VERSION_TALLY_HISTORY = 1
+
+
+class _TallyDict(dict, ChangeNotifierMixin):
+    """Dictionary of the tallies in a statepoint which notifies the tally
+    index of the statepoint when tallies are added or removed"""
+
+    def __setitem__(self, key, value):
+        super(_TallyDict, self).__setitem__(key, value)
+        self._changed('content')
+
+    def __delitem__(self, key):
+        super(_TallyDict, self).__delitem__(key)
+        self._changed('content')
+
+    def clear(self):
+        super(_TallyDict, self).clear()
+        self._changed('content')
+
+    def pop(self, *args):
+        value = super(_TallyDict, self).pop(*args)
+        self._changed('content')
+        return value
+
+    def popitem(self):
+        item = super(_TallyDict, self).popitem()
+        self._changed('content')
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super(_TallyDict, self).setdefault(key, default)
+        self._changed('content')
+        return value
+
+    def update(self, *args, **kwargs):
+        super(_TallyDict, self).update(*args, **kwargs)
+        self._changed('content')
+
+
+def _filter_index_keys(tally_filter):
+    """Return the keys under which a filter is indexed for tally lookups.
+
+    A filter can only be a subset of another filter if all of its keys are
+    also keys of the other filter. This is a helper function for
+    :meth:`StatePoint.get_tally`.
+
+    Parameters
+    ----------
+    tally_filter : openmc.Filter
+        Filter to index
+
+    Returns
+    -------
+    list of tuple
+        Keys for the filter type and bins
+
+    """
+
+    filter_type = type(tally_filter)
+    if isinstance(tally_filter, openmc.EnergyFunctionFilter):
+        return [('filter', filter_type)]
+    elif isinstance(tally_filter, openmc.RealFilter):
+        return [('filter', filter_type, len(tally_filter.bins))]
+    elif isinstance(tally_filter, openmc.Filter):
+        keys = [('filter', filter_type)]
+        keys.extend(('filter bin', filter_type, b) for b in tally_filter.bins)
+        return keys
+    else:
+        return []
+
+
+def _tally_metadata(tallies_group, group):
+    """Return the filters, nuclides and scores of a tally in a statepoint file.
+
+    Parameters
+    ----------
+    tallies_group : h5py.Group
+        Group containing all tallies in the statepoint file
+    group : h5py.Group
+        Group of the tally
+
+    Returns
+    -------
+    tuple
+        Contents of the datasets describing the filters, nuclides and scores
+        of the tally, which are equal for tallies with the same bins
+
+    """
+
+    def contents(group):
+        return tuple((key, np.asarray(group[key].value).tobytes())
+                     for key in sorted(group)
+                     if isinstance(group[key], h5py.Dataset))
+
+    filters = []
+    if group['n_filters'].value > 0:
+        for filter_id in group['filters'].value:
+            filters.append(contents(
+                tallies_group['filters/filter {}'.format(filter_id)]))
+
+    return (tuple(filters),
+            np.asarray(group['nuclides'].value).tobytes(),
+            np.asarray(group['score_bins'].value).tobytes(),
+            np.asarray(group['moment_orders'].value).tobytes())
+
+
+def _accumulate_results(paths):
+    """Sum the tally results from several statepoint files.
+
+    This is a helper function for :meth:`StatePoint.aggregate` which is run in
+    each worker process. Only the results of one statepoint are held in memory
+    at a time in addition to the running sums.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths to the statepoint files
+
+    Returns
+    -------
+    results : dict
+        Dictionary whose keys are tally IDs and whose values are the summed
+        results arrays containing sum and sum_sq for each tally
+    n_realizations : dict
+        Dictionary whose keys are tally IDs and whose values are the total
+        number of realizations for each tally
+    metadata : dict
+        Dictionary whose keys are tally IDs and whose values describe the
+        filters, nuclides and scores of each tally
+
+    Raises
+    ------
+    ValueError
+        If the statepoints do not contain the same tallies.
+
+    """
+
+    results = {}
+    n_realizations = {}
+    metadata = None
+
+    for path in paths:
+        with h5py.File(path, 'r') as f:
+            tallies_group = f['tallies']
+            if tallies_group.attrs['n_tallies'] > 0:
+                tally_ids = tallies_group.attrs['ids']
+            else:
+                tally_ids = []
+
+            # Check that the tallies match those of the first statepoint
+            file_metadata = {
+                tally_id: _tally_metadata(
+                    tallies_group,
+                    tallies_group['tally {}'.format(tally_id)])
+                for tally_id in tally_ids}
+            if metadata is None:
+                metadata = file_metadata
+            elif file_metadata != metadata:
+                msg = 'Unable to aggregate the tallies in "{0}" since they ' \
+                      'do not match those of the other ' \
+                      'statepoints'.format(path)
+                raise ValueError(msg)
+
+            for tally_id in tally_ids:
+                group = tallies_group['tally {}'.format(tally_id)]
+                data = group['results'].value
+                n = group['n_realizations'].value
+
+                if tally_id not in results:
+                    results[tally_id] = data
+                    n_realizations[tally_id] = n
+                else:
+                    results[tally_id] += data
+                    n_realizations[tally_id] += n
+
+    return results, n_realizations, metadata
 
 
 class StatePoint(object):
@@ -95,7 +278,7 @@ class StatePoint(object):
     source_present : bool
         Indicate whether source sites are present
     sparse : bool
-        Whether or not the tallies uses SciPy's LIL sparse matrix format for
+        Whether or not the tallies uses SciPy's CSR sparse matrix format for
         compressed data storage
     tallies : dict
         Dictionary whose keys are tally IDs and whose values are Tally objects
@@ -115,7 +298,7 @@ class StatePoint(object):
         self._f = h5py.File(filename, 'r')
         self._meshes = {}
         self._filters = {}
-        self._tallies = {}
+        self._tallies = _TallyDict()
         self._derivs = {}
 
         # Check filetype and version
@@ -129,6 +312,8 @@ class StatePoint(object):
         self._global_tallies = None
         self._sparse = False
         self._derivs_read = False
+        self._tally_index = None
+        self._history = None
 
         # Automatically link in a summary file if one exists
         if autolink:
@@ -148,6 +333,8 @@ class StatePoint(object):
 
     def __exit__(self, *exc):
         self._f.close()
+        if self._history is not None:
+            self._history.close()
 
     @property
     def cmfd_on(self):
@@ -370,6 +557,7 @@ class StatePoint(object):
                     # Create Tally object and assign basic properties
                     tally = openmc.Tally(tally_id)
                     tally._sp_filename = self._f.filename
+                    tally._sp_ref = weakref.ref(self)
                     tally.name = group['name'].value.decode() if 'name' in group else ''
                     tally.estimator = group['estimator'].value.decode()
                     tally.num_realizations = n_realizations
@@ -379,16 +567,14 @@ class StatePoint(object):
                         deriv_id = group['derivative'].value
                         tally.derivative = self.tally_derivatives[deriv_id]
 
-                    # Read all filters
+                    # Read all filters. Each filter is only read from the
+                    # file once and each tally gets its own shallow copy
+                    # since filter strides are specific to a tally.
                     n_filters = group['n_filters'].value
                     if n_filters > 0:
                         filter_ids = group['filters'].value
-                        filters_group = self._f['tallies/filters']
                         for filter_id in filter_ids:
-                            filter_group = filters_group['filter {}'.format(
-                                filter_id)]
-                            new_filter = openmc.Filter.from_hdf5(
-                                filter_group, meshes=self.meshes)
+                            new_filter = copy.copy(self.filters[filter_id])
                             tally.filters.append(new_filter)
 
                     # Read nuclide bins
@@ -473,13 +659,14 @@ class StatePoint(object):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
-        matrices internally within each Tally object. All tally data access
-        properties and methods will return data as a dense NumPy array.
+        tally data processing. The tally data will be stored as SciPy CSR
+        matrices internally within each Tally object. See
+        :attr:`openmc.Tally.sparse` for which methods operate on the sparse
+        data directly.
 
         """
 
@@ -503,6 +690,215 @@ class StatePoint(object):
         if self.summary is not None:
             self.summary.add_volume_information(volume_calc)
 
+    @classmethod
+    def aggregate(cls, paths, workers=1):
+        """Combine the tallies from independent runs of the same model.
+
+        The sum and sum of squares of each tally are accumulated over all the
+        statepoints, e.g. from replicas of a simulation run with different
+        random number seeds. The statepoint files are split between a pool of
+        worker processes, each of which streams the results of its files into
+        running sums so that only one set of tally results per worker is held
+        in memory at a time.
+
+        Parameters
+        ----------
+        paths : Iterable of str
+            Paths to the statepoint files to combine. All statepoints must
+            contain the same tallies with the same filters, nuclides and
+            scores.
+        workers : Integral, optional
+            Number of worker processes to use. Defaults to 1, in which case
+            the statepoints are read in the current process.
+
+        Returns
+        -------
+        dict
+            Dictionary whose keys are tally IDs and whose values are Tally
+            objects with the combined results of all statepoints
+
+        Raises
+        ------
+        ValueError
+            If the statepoints do not contain the same tallies or their
+            filters, nuclides or scores differ.
+
+        """
+
+        paths = list(paths)
+        cv.check_iterable_type('statepoint paths', paths, string_types)
+        cv.check_type('workers', workers, Integral)
+        cv.check_greater_than('workers', workers, 0)
+        if len(paths) == 0:
+            raise ValueError('Unable to aggregate an empty list of statepoints')
+
+        # Split the statepoints as evenly as possible between the workers
+        workers = min(workers, len(paths))
+        chunks = [paths[i::workers] for i in range(workers)]
+
+        if workers == 1:
+            partials = [_accumulate_results(paths)]
+        else:
+            pool = Pool(workers)
+            partials = pool.imap_unordered(_accumulate_results, chunks)
+
+        results = None
+        try:
+            for partial_results, partial_n, partial_metadata in partials:
+                if results is None:
+                    results, n_realizations = partial_results, partial_n
+                    metadata = partial_metadata
+                    continue
+
+                if partial_metadata != metadata:
+                    msg = 'Unable to aggregate statepoints which do not ' \
+                          'contain the same tallies'
+                    raise ValueError(msg)
+
+                for tally_id, data in partial_results.items():
+                    results[tally_id] += data
+                    n_realizations[tally_id] += partial_n[tally_id]
+        finally:
+            if workers > 1:
+                pool.terminate()
+                pool.join()
+
+        # Assign the combined results to the tallies of the first statepoint
+        with cls(paths[0]) as sp:
+            tallies = sp.tallies
+
+            if set(tallies) != set(results):
+                msg = 'Unable to aggregate statepoints which do not contain ' \
+                      'the same tallies'
+                raise ValueError(msg)
+
+            for tally_id, tally in tallies.items():
+                tally.num_realizations = int(n_realizations[tally_id])
+                tally._read_results(results[tally_id])
+
+        return tallies
+
+    def load_results(self, tally_ids=None):
+        """Read the results of many tallies at once.
+
+        Results for each tally are normally read from the statepoint file the
+        first time they are accessed. This method instead reads the results of
+        all requested tallies in a single pass over the statepoint's open HDF5
+        file, which avoids the cost of accessing each tally separately when a
+        statepoint contains many tallies.
+
+        Parameters
+        ----------
+        tally_ids : Iterable of Integral, optional
+            IDs of the tallies whose results should be read. Defaults to all
+            tallies in the statepoint.
+
+        """
+
+        tallies = self.tallies
+        if tally_ids is None:
+            tally_ids = list(tallies.keys())
+        cv.check_iterable_type('tally IDs', tally_ids, Integral)
+
+        tallies_group = self._f['tallies']
+        for tally_id in tally_ids:
+            tally = tallies[tally_id]
+            if tally._results_read:
+                continue
+
+            group = tallies_group['tally {}'.format(tally_id)]
+            tally._read_results(group['results'].value)
+
+    def _build_tally_index(self):
+        """Build an inverted index of tallies for StatePoint.get_tally.
+
+        Each tally's position in the tallies dictionary is indexed by its ID,
+        estimator, scores, nuclides and filter types and bins. The index is
+        invalidated when tallies are added to or removed from the tallies
+        dictionary or any of these properties of a tally change.
+
+        """
+
+        tallies = self.tallies
+        self._tally_dependent = _Dependent(('content',))
+        tallies._add_dependent(self._tally_dependent)
+        self._tally_list = list(tallies.values())
+        self._tally_index = defaultdict(set)
+
+        for i, tally in enumerate(self._tally_list):
+            tally._add_dependent(self._tally_dependent)
+            self._tally_index['id', tally.id].add(i)
+            self._tally_index['estimator', tally.estimator].add(i)
+            for score in tally.scores:
+                self._tally_index['score', score].add(i)
+            for nuclide in tally.nuclides:
+                name = getattr(nuclide, 'name', nuclide)
+                self._tally_index['nuclide', name].add(i)
+            for tally_filter in tally.filters:
+                for key in _filter_index_keys(tally_filter):
+                    self._tally_index[key].add(i)
+
+    def _get_tally_candidates(self, scores, filters, nuclides, id, estimator):
+        """Return the tallies which may satisfy a query to get_tally.
+
+        Every tally which satisfies the query is included in the returned
+        list, which may also contain tallies that do not.
+
+        Parameters
+        ----------
+        scores : list
+            Score strings requested
+        filters : list
+            Filter objects requested
+        nuclides : list
+            Nuclide objects or names requested
+        id : Integral or None
+            Tally ID requested
+        estimator : str or None
+            Estimator requested
+
+        Returns
+        -------
+        list of openmc.Tally
+            Candidate tallies ordered as in the tallies dictionary
+
+        """
+
+        # Rebuild the index if tallies were added or removed or their
+        # filters, nuclides or scores were changed
+        if self._tally_index is None or not self._tally_dependent.valid:
+            self._build_tally_index()
+
+        keys = []
+        if id:
+            keys.append(('id', id))
+        if estimator:
+            keys.append(('estimator', estimator))
+        keys.extend(('score', score) for score in scores)
+        keys.extend(('nuclide', getattr(nuclide, 'name', nuclide))
+                    for nuclide in nuclides)
+        for query_filter in filters:
+            keys.extend(_filter_index_keys(query_filter))
+
+        try:
+            matches = [self._tally_index.get(key, set()) for key in keys]
+        except TypeError:
+            # Unhashable query parameters cannot be looked up in the index
+            return self._tally_list
+
+        if not matches:
+            return self._tally_list
+
+        # Intersect the tallies matching each key, starting with the smallest
+        matches.sort(key=len)
+        positions = set(matches[0])
+        for match in matches[1:]:
+            if not positions:
+                break
+            positions &= match
+
+        return [self._tally_list[i] for i in sorted(positions)]
+
     def get_tally(self, scores=[], filters=[], nuclides=[],
                   name=None, id=None, estimator=None, exact_filters=False,
                   exact_nuclides=False, exact_scores=False):
@@ -517,6 +913,12 @@ class StatePoint(object):
         parameter is True then number of scores, filters, or nuclides in the
         parameters must precisely match those of any matching Tally.
 
+        Tallies are searched through an index which is rebuilt whenever
+        tallies are added or removed or their filters, nuclides or scores are
+        changed. The bins of each filter are a snapshot taken when the index
+        is built, so a filter whose bins are modified in place should be
+        replaced in the tally's list of filters for the change to be seen.
+
         Parameters
         ----------
         scores : list, optional
@@ -559,8 +961,11 @@ class StatePoint(object):
 
         tally = None
 
-        # Iterate over all tallies to find the appropriate one
-        for test_tally in self.tallies.values():
+        # Iterate over all tallies which could match to find the appropriate
+        # one, in the same order as the tallies dictionary
+        candidates = self._get_tally_candidates(scores, filters, nuclides,
+                                                id, estimator)
+        for test_tally in candidates:
 
             # Determine if Tally has queried name
             if name and name != test_tally.name:
@@ -639,6 +1044,39 @@ class StatePoint(object):
 
         return tally
 
+    def _get_tally_history(self, tally_id):
+        """Return the recorded batch history of a tally.
+
+        The tally_history.h5 file in the same directory as the statepoint is
+        opened the first time the history of any tally is requested.
+
+        Parameters
+        ----------
+        tally_id : int
+            ID of the tally
+
+        Returns
+        -------
+        h5py.Dataset or None
+            Estimate of each recorded batch indexed by batch, filter bin,
+            nuclide and score, or None if the history of the tally was not
+            recorded
+
+        """
+
+        if self._history is None:
+            path = os.path.join(os.path.dirname(self._f.filename),
+                                'tally_history.h5')
+            if not os.path.exists(path):
+                return None
+
+            self._history = h5py.File(path, 'r')
+            cv.check_filetype_version(self._history, 'tally_history',
+                                      _VERSION_TALLY_HISTORY)
+
+        name = 'tallies/tally {}/history'.format(tally_id)
+        return self._history[name] if name in self._history else None
+
     def link_with_summary(self, summary):
         """Links Tallies and Filters with Summary model information.
 
@@ -672,15 +1110,13 @@ class StatePoint(object):
                   'is not a Summary object'.format(summary)
             raise ValueError(msg)
 
-        cells = summary.geometry.get_all_cells()
-
         for tally_id, tally in self.tallies.items():
             tally.with_summary = True
 
             for tally_filter in tally.filters:
                 if isinstance(tally_filter, (openmc.DistribcellFilter)):
                     cell_id = tally_filter.bins[0]
-                    cell = cells[cell_id]
+                    cell = summary.get_cell(cell_id)
                     if not cell._paths:
                         summary.geometry.determine_paths()
                     tally_filter.paths = cell.paths
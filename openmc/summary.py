@@ -1,4 +1,6 @@
 from collections import Iterable
+import os
+import pickle
 import re
 import warnings
 
@@ -12,9 +14,51 @@ from openmc.region import Region
 _VERSION_SUMMARY = 5
 
 
+class _ObjectCache(dict):
+    """Dictionary of model objects keyed by ID which creates each object the
+    first time it is looked up.
+
+    Parameters
+    ----------
+    create : callable
+        Function which creates the object with a given ID
+
+    """
+
+    def __init__(self, create):
+        super(_ObjectCache, self).__init__()
+        self._create = create
+
+    def __missing__(self, key):
+        value = self._create(key)
+        self[key] = value
+        return value
+
+
 class Summary(object):
     """Summary of geometry, materials, and tallies used in a simulation.
 
+    Model objects are only created from the summary file when they are first
+    needed. Individual surfaces, cells, universes, lattices and materials can
+    be retrieved by ID without reconstructing the rest of the model, and the
+    complete geometry is only built when :attr:`Summary.geometry` is accessed.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the summary file
+    cache : bool, optional
+        Whether to store the reconstructed model in a pickle file next to the
+        summary file, i.e. "summary.h5.pkl". The cache is keyed by the size and
+        modification time of the summary file and is used instead of the
+        summary file the next time it is opened, as long as the summary has
+        not changed. If no valid cache exists, the complete model is
+        reconstructed when the summary is opened. Defaults to False.
+
+        .. warning:: Loading a pickle file can execute arbitrary code. Only
+                     use the cache if the cache file, and the directory
+                     containing it, can be trusted.
+
     Attributes
     ----------
     date_and_time : str
@@ -31,7 +75,7 @@ class Summary(object):
 
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, cache=False):
         if not filename.endswith(('.h5', '.hdf5')):
             msg = 'Unable to open "{0}" which is not an HDF5 summary file'
             raise ValueError(msg)
@@ -39,21 +83,20 @@ class Summary(object):
         self._f = h5py.File(filename, 'r')
         cv.check_filetype_version(self._f, 'summary', _VERSION_SUMMARY)
 
-        self._geometry = openmc.Geometry()
-
-        self._fast_materials = {}
-        self._fast_surfaces = {}
-        self._fast_cells = {}
-        self._fast_universes  = {}
-        self._fast_lattices = {}
+        self._geometry = None
+        self._materials = None
+        self._nuclides = None
+        self._volume_calcs = []
 
-        self._materials = openmc.Materials()
-        self._nuclides = {}
+        self._fast_materials = _ObjectCache(self._read_material)
+        self._fast_surfaces = _ObjectCache(self._read_surface)
+        self._fast_cells = _ObjectCache(self._read_cell)
+        self._fast_universes = _ObjectCache(self._read_universe)
+        self._fast_lattices = _ObjectCache(self._read_lattice)
 
-        self._read_nuclides()
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", openmc.IDWarning)
-            self._read_geometry()
+        cv.check_type('cache', cache, bool)
+        if cache:
+            self._load_cache(filename + '.pkl')
 
     @property
     def date_and_time(self):
@@ -61,142 +104,276 @@ class Summary(object):
 
     @property
     def geometry(self):
+        if self._geometry is None:
+            self._read_geometry()
         return self._geometry
 
     @property
     def materials(self):
+        if self._materials is None:
+            self._materials = openmc.Materials(
+                [self._fast_materials[int(key.lstrip('material '))]
+                 for key in self._f['materials']])
         return self._materials
 
     @property
     def nuclides(self):
+        if self._nuclides is None:
+            self._read_nuclides()
         return self._nuclides
 
     @property
     def version(self):
         return tuple(self._f.attrs['openmc_version'])
 
-    def _read_nuclides(self):
-        names = self._f['nuclides/names'].value
-        awrs = self._f['nuclides/awrs'].value
-        for name, awr in zip(names, awrs):
-            self._nuclides[name.decode()] = awr
+    def get_material(self, material_id):
+        """Return a material from the summary file
 
-    def _read_geometry(self):
-        # Read in and initialize the Materials and Geometry
-        self._read_materials()
-        self._read_surfaces()
-        cell_fills = self._read_cells()
-        self._read_universes()
-        self._read_lattices()
-        self._finalize_geometry(cell_fills)
-
-    def _read_materials(self):
-        for group in self._f['materials'].values():
-            material = openmc.Material.from_hdf5(group)
+        Parameters
+        ----------
+        material_id : int
+            ID of the material
 
-            # Add the material to the Materials collection
-            self.materials.append(material)
+        Returns
+        -------
+        openmc.Material
+            Material with the given ID
 
-            # Store in the dictionary of materials for fast queries
-            self._fast_materials[material.id] = material
+        """
+        return self._fast_materials[material_id]
 
-    def _read_surfaces(self):
-        for group in self._f['geometry/surfaces'].values():
-            surface = openmc.Surface.from_hdf5(group)
-            self._fast_surfaces[surface.id] = surface
+    def get_surface(self, surface_id):
+        """Return a surface from the summary file
 
-    def _read_cells(self):
+        Parameters
+        ----------
+        surface_id : int
+            ID of the surface
 
-        # Initialize dictionary for each Cell's fill
-        cell_fills = {}
+        Returns
+        -------
+        openmc.Surface
+            Surface with the given ID
 
-        for key, group in self._f['geometry/cells'].items():
-            cell_id = int(key.lstrip('cell '))
-            name = group['name'].value.decode() if 'name' in group else ''
-            fill_type = group['fill_type'].value.decode()
+        """
+        return self._fast_surfaces[surface_id]
 
-            if fill_type == 'material':
-                fill = group['material'].value
-            elif fill_type == 'universe':
-                fill = group['fill'].value
-            else:
-                fill = group['lattice'].value
+    def get_cell(self, cell_id):
+        """Return a cell from the summary file
 
-            region = group['region'].value.decode() if 'region' in group else ''
+        The cell's region and fill, and any universes, lattices and materials
+        they refer to, are reconstructed as well.
 
-            # Create this Cell
-            cell = openmc.Cell(cell_id=cell_id, name=name)
+        Parameters
+        ----------
+        cell_id : int
+            ID of the cell
 
-            if fill_type == 'universe':
-                if 'translation' in group:
-                    translation = group['translation'][...]
-                    translation = np.asarray(translation, dtype=np.float64)
-                    cell.translation = translation
+        Returns
+        -------
+        openmc.Cell
+            Cell with the given ID
 
-                if 'rotation' in group:
-                    rotation = group['rotation'][...]
-                    rotation = np.asarray(rotation, dtype=np.int)
-                    cell._rotation = rotation
+        """
+        return self._fast_cells[cell_id]
 
-            elif fill_type == 'material':
-                cell.temperature = group['temperature'][...]
+    def get_universe(self, universe_id):
+        """Return a universe from the summary file
 
-            # Store Cell fill information for after Universe/Lattice creation
-            cell_fills[cell.id] = (fill_type, fill)
+        Parameters
+        ----------
+        universe_id : int
+            ID of the universe
 
-            # Generate Region object given infix expression
-            if region:
-                cell.region = Region.from_expression(region, self._fast_surfaces)
+        Returns
+        -------
+        openmc.Universe
+            Universe with the given ID
 
-            # Add the Cell to the global dictionary of all Cells
-            self._fast_cells[cell.id] = cell
+        """
+        return self._fast_universes[universe_id]
 
-        return cell_fills
+    def get_lattice(self, lattice_id):
+        """Return a lattice from the summary file
 
-    def _read_universes(self):
-        for group in self._f['geometry/universes'].values():
-            universe = openmc.Universe.from_hdf5(group, self._fast_cells)
-            self._fast_universes[universe.id] = universe
+        Parameters
+        ----------
+        lattice_id : int
+            ID of the lattice
 
-    def _read_lattices(self):
-        for group in self._f['geometry/lattices'].values():
-            lattice = openmc.Lattice.from_hdf5(group, self._fast_universes)
-            self._fast_lattices[lattice.id] = lattice
+        Returns
+        -------
+        openmc.Lattice
+            Lattice with the given ID
 
-    def _finalize_geometry(self, cell_fills):
+        """
+        return self._fast_lattices[lattice_id]
 
+    def _read_nuclides(self):
+        self._nuclides = {}
+        names = self._f['nuclides/names'].value
+        awrs = self._f['nuclides/awrs'].value
+        for name, awr in zip(names, awrs):
+            self._nuclides[name.decode()] = awr
+
+    def _read_geometry(self):
         # Keep track of universes that are used as fills. That way, we can
         # determine which universe is NOT used as a fill (and hence is the root
-        # universe)
+        # universe) without creating any objects.
         fill_univ_ids = set()
 
-        # Iterate over all Cells and add fill Materials, Universes and Lattices
-        for cell_id, (fill_type, fill_id) in cell_fills.items():
-            # Retrieve the object corresponding to the fill type and ID
-            if fill_type == 'material':
-                if isinstance(fill_id, Iterable):
-                    fill = [self._fast_materials[mat] if mat > 0 else None
-                            for mat in fill_id]
-                else:
-                    fill = self._fast_materials[fill_id] if fill_id > 0 else None
-            elif fill_type == 'universe':
-                fill = self._fast_universes[fill_id]
-                fill_univ_ids.add(fill_id)
+        for group in self._f['geometry/cells'].values():
+            if group['fill_type'].value.decode() == 'universe':
+                fill_univ_ids.add(group['fill'].value)
+
+        for group in self._f['geometry/lattices'].values():
+            universe_ids = group['universes'][...]
+            fill_univ_ids.update(universe_ids[universe_ids >= 0].tolist())
+            if group['outer'].value >= 0:
+                fill_univ_ids.add(group['outer'].value)
+
+        # Determine root universe for geometry and create it along with all
+        # the cells, universes and lattices it contains
+        univ_ids = [int(key.lstrip('universe '))
+                    for key in self._f['geometry/universes']]
+        non_fill = set(univ_ids) - fill_univ_ids
+
+        self._geometry = openmc.Geometry()
+        self._geometry.root_universe = self._fast_universes[non_fill.pop()]
+
+    def _read_material(self, material_id):
+        group = self._f['materials/material {}'.format(material_id)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            material = openmc.Material.from_hdf5(group)
+        self._add_volume_information(material, 'material')
+        return material
+
+    def _read_surface(self, surface_id):
+        group = self._f['geometry/surfaces/surface {}'.format(surface_id)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            return openmc.Surface.from_hdf5(group)
+
+    def _read_cell(self, cell_id):
+        group = self._f['geometry/cells/cell {}'.format(cell_id)]
+        name = group['name'].value.decode() if 'name' in group else ''
+        fill_type = group['fill_type'].value.decode()
+        region = group['region'].value.decode() if 'region' in group else ''
+
+        # Create this Cell
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            cell = openmc.Cell(cell_id=cell_id, name=name)
+
+        if fill_type == 'universe':
+            if 'translation' in group:
+                translation = group['translation'][...]
+                translation = np.asarray(translation, dtype=np.float64)
+                cell.translation = translation
+
+            if 'rotation' in group:
+                rotation = group['rotation'][...]
+                rotation = np.asarray(rotation, dtype=np.int)
+                cell._rotation = rotation
+
+        elif fill_type == 'material':
+            cell.temperature = group['temperature'][...]
+
+        # Generate Region object given infix expression
+        if region:
+            cell.region = Region.from_expression(region, self._fast_surfaces)
+
+        # Retrieve the object corresponding to the fill type and ID
+        if fill_type == 'material':
+            fill_id = group['material'].value
+            if isinstance(fill_id, Iterable):
+                fill = [self._fast_materials[mat] if mat > 0 else None
+                        for mat in fill_id]
             else:
-                fill = self._fast_lattices[fill_id]
-                for idx in fill._natural_indices:
-                    univ = fill.get_universe(idx)
-                    fill_univ_ids.add(univ.id)
-                if fill.outer is not None:
-                    fill_univ_ids.add(fill.outer.id)
+                fill = self._fast_materials[fill_id] if fill_id > 0 else None
+        elif fill_type == 'universe':
+            fill = self._fast_universes[group['fill'].value]
+        else:
+            fill = self._fast_lattices[group['lattice'].value]
 
-            # Set the fill for the Cell
-            self._fast_cells[cell_id].fill = fill
+        # Set the fill for the Cell
+        cell.fill = fill
 
-        # Determine root universe for geometry
-        non_fill = set(self._fast_universes.keys()) - fill_univ_ids
+        self._add_volume_information(cell, 'cell')
+        return cell
 
-        self.geometry.root_universe = self._fast_universes[non_fill.pop()]
+    def _read_universe(self, universe_id):
+        group = self._f['geometry/universes/universe {}'.format(universe_id)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            universe = openmc.Universe.from_hdf5(group, self._fast_cells)
+        self._add_volume_information(universe, 'universe')
+        return universe
+
+    def _read_lattice(self, lattice_id):
+        group = self._f['geometry/lattices/lattice {}'.format(lattice_id)]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", openmc.IDWarning)
+            return openmc.Lattice.from_hdf5(group, self._fast_universes)
+
+    def _load_cache(self, path):
+        """Load the model from a cache file, or reconstruct the complete model
+        and write it to the cache file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the cache file
+
+        """
+
+        # Identify the summary file by its size and modification time
+        stat = os.stat(self._f.filename)
+        key = (stat.st_size, stat.st_mtime)
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as fh:
+                    state = pickle.load(fh)
+            except Exception:
+                state = None
+
+            if state is not None and state.get('key') == key:
+                self._geometry = state['geometry']
+                self._materials = state['materials']
+                self._nuclides = state['nuclides']
+                self._fast_materials.update(state['materials_by_id'])
+                self._fast_surfaces.update(state['surfaces_by_id'])
+                self._fast_cells.update(state['cells_by_id'])
+                self._fast_universes.update(state['universes_by_id'])
+                self._fast_lattices.update(state['lattices_by_id'])
+                return
+
+        # Reconstruct the complete model
+        state = {'key': key,
+                 'geometry': self.geometry,
+                 'materials': self.materials,
+                 'nuclides': self.nuclides,
+                 'materials_by_id': dict(self._fast_materials),
+                 'surfaces_by_id': dict(self._fast_surfaces),
+                 'cells_by_id': dict(self._fast_cells),
+                 'universes_by_id': dict(self._fast_universes),
+                 'lattices_by_id': dict(self._fast_lattices)}
+
+        try:
+            with open(path, 'wb') as fh:
+                pickle.dump(state, fh, pickle.HIGHEST_PROTOCOL)
+        except (IOError, OSError) as e:
+            warnings.warn('Unable to write summary cache "{0}": {1}'
+                          .format(path, e))
+
+    def _add_volume_information(self, obj, domain_type):
+        # Apply volume calculation results to an object that was just created
+        for volume_calc in self._volume_calcs:
+            if volume_calc.domain_type == domain_type and \
+               obj.id in volume_calc.volumes:
+                obj.add_volume_information(volume_calc)
 
     def add_volume_information(self, volume_calc):
         """Add volume information to the geometry within the summary file
@@ -207,4 +384,13 @@ class Summary(object):
             Results from a stochastic volume calculation
 
         """
-        self.geometry.add_volume_information(volume_calc)
+
+        # Remember the results for objects which have not been created yet
+        self._volume_calcs.append(volume_calc)
+
+        objects = {'cell': self._fast_cells,
+                   'material': self._fast_materials,
+                   'universe': self._fast_universes}
+        for obj_id, obj in objects[volume_calc.domain_type].items():
+            if obj_id in volume_calc.volumes:
+                obj.add_volume_information(volume_calc)
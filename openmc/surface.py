@@ -1,7 +1,7 @@
 from __future__ import division
 from abc import ABCMeta
 from collections import Iterable, OrderedDict
-from copy import deepcopy
+from copy import copy, deepcopy
 from functools import partial
 from numbers import Real, Integral
 from xml.etree import ElementTree as ET
@@ -12,7 +12,7 @@ import numpy as np
 
 from openmc.checkvalue import check_type, check_value, check_greater_than
 from openmc.region import Region, Intersection, Union
-from openmc.mixin import IDManagerMixin
+from openmc.mixin import IDManagerMixin, ChangeNotifierMixin
 
 
 # A static variable for auto-generated Surface IDs
@@ -21,7 +21,34 @@ AUTO_SURFACE_ID = 10000
 _BOUNDARY_TYPES = ['transmission', 'vacuum', 'reflective', 'periodic']
 
 
-class Surface(IDManagerMixin):
+class _CoefficientDict(dict):
+    """Dictionary of the coefficients of a surface which notifies the surface
+    whenever a coefficient is changed"""
+
+    def __init__(self, surface):
+        super(_CoefficientDict, self).__init__()
+        self._surface = surface
+
+    def _notify(self):
+        # Items are restored before attributes when unpickling
+        surface = self.__dict__.get('_surface')
+        if surface is not None:
+            surface._changed('position')
+
+    def __setitem__(self, key, value):
+        super(_CoefficientDict, self).__setitem__(key, value)
+        self._notify()
+
+    def __delitem__(self, key):
+        super(_CoefficientDict, self).__delitem__(key)
+        self._notify()
+
+    def update(self, *args, **kwargs):
+        super(_CoefficientDict, self).update(*args, **kwargs)
+        self._notify()
+
+
+class Surface(IDManagerMixin, ChangeNotifierMixin):
     """An implicit surface with an associated boundary condition.
 
     An implicit surface is defined as the set of zeros of a function of the
@@ -71,7 +98,7 @@ class Surface(IDManagerMixin):
         # A dictionary of the quadratic surface coefficients
         # Key        - coefficeint name
         # Value    - coefficient value
-        self._coefficients = {}
+        self._coefficients = _CoefficientDict(self)
 
         # An ordered list of the coefficient names to export to XML in the
         # proper order
@@ -180,14 +207,14 @@ class Surface(IDManagerMixin):
             memo = {}
 
         # If no nemoize'd clone exists, instantiate one
-        if self not in memo:
+        if id(self) not in memo:
             clone = deepcopy(self)
             clone.id = None
 
             # Memoize the clone
-            memo[self] = clone
+            memo[id(self)] = clone
 
-        return memo[self]
+        return memo[id(self)]
 
     def to_xml_element(self):
         """Return XML representation of the surface
@@ -1874,6 +1901,13 @@ class Halfspace(Region):
         val = self.surface.evaluate(point)
         return val >= 0. if self.side == '+' else val < 0.
 
+    def _compile(self, surfaces, index, program):
+        key = id(self.surface)
+        if key not in index:
+            index[key] = len(surfaces)
+            surfaces.append(self.surface)
+        program.append((self.side, index[key]))
+
     @property
     def surface(self):
         return self._surface
@@ -1882,6 +1916,7 @@ class Halfspace(Region):
     def surface(self, surface):
         check_type('surface', surface, Surface)
         self._surface = surface
+        self._changed('region')
 
     @property
     def side(self):
@@ -1891,6 +1926,7 @@ class Halfspace(Region):
     def side(self, side):
         check_value('side', side, ('+', '-'))
         self._side = side
+        self._changed('region')
 
     @property
     def bounding_box(self):
@@ -1921,6 +1957,10 @@ class Halfspace(Region):
         surfaces[self.surface.id] = self.surface
         return surfaces
 
+    def _add_dependent_to_nodes(self, dependent):
+        self._add_dependent(dependent)
+        self.surface._add_dependent(dependent)
+
     def clone(self, memo=None):
         """Create a copy of this halfspace, with a cloned surface with a
         unique ID.
@@ -1939,9 +1979,9 @@ class Halfspace(Region):
         """
 
         if memo is None:
-            memo = dict
+            memo = {}
 
-        clone = deepcopy(self)
+        clone = copy(self)
         clone.surface = self.surface.clone(memo)
         return clone
 
@@ -1,6 +1,7 @@
 from __future__ import division
 
-from collections import Iterable, MutableSequence
+from collections import Iterable, MutableSequence, OrderedDict
+from contextlib import contextmanager
 import copy
 import re
 from functools import partial
@@ -18,7 +19,8 @@ import h5py
 import openmc
 import openmc.checkvalue as cv
 from openmc.clean_xml import clean_xml_indentation
-from .mixin import IDManagerMixin
+from openmc.filter import _repeat_tile
+from .mixin import IDManagerMixin, ChangeNotifierMixin
 
 
 # The tally arithmetic product types. The tensor product performs the full
@@ -38,8 +40,259 @@ _FILTER_CLASSES = (openmc.Filter, openmc.CrossFilter, openmc.AggregateFilter)
 # Valid types of estimators
 ESTIMATOR_TYPES = ['tracklength', 'collision', 'analog']
 
+# Approximate number of bytes of the results dataset which are read at a time
+# when reducing tally data which has not been loaded from the statepoint file
+_REDUCTION_BLOCK_SIZE = 64*1024**2
 
-class Tally(IDManagerMixin):
+
+def _std_dev(mean, sum_sq, n):
+    """Return the sample standard deviation of the mean for tally bins.
+
+    Parameters
+    ----------
+    mean : numpy.ndarray or scipy.sparse.csr_matrix
+        Sample mean of each tally bin
+    sum_sq : numpy.ndarray or scipy.sparse.csr_matrix
+        Sum of the squared realizations of each tally bin
+    n : Integral
+        Number of realizations
+
+    Returns
+    -------
+    numpy.ndarray or scipy.sparse.csr_matrix
+        Sample standard deviation of the mean of each tally bin. A sparse
+        matrix is returned if the mean is a sparse matrix.
+
+    """
+
+    if sps.issparse(mean):
+        mean = mean.tocoo()
+        nonzero = mean.data != 0
+        rows, cols = mean.row[nonzero], mean.col[nonzero]
+        mean_data = mean.data[nonzero]
+        sum_sq_data = _sparse_values(sum_sq, rows, cols)
+        std_dev = np.sqrt((sum_sq_data/n - mean_data**2)/(n - 1))
+        return sps.csr_matrix((std_dev, (rows, cols)), shape=mean.shape)
+
+    nonzero = np.abs(mean) > 0
+    std_dev = np.zeros_like(mean)
+    std_dev[nonzero] = np.sqrt((sum_sq[nonzero]/n - mean[nonzero]**2)/(n - 1))
+    return std_dev
+
+
+def _aggregation_matrix(dims, aggregate, indices=None):
+    """Return a sparse matrix which aggregates bins of flattened tally data.
+
+    Parameters
+    ----------
+    dims : Iterable of Integral
+        Number of bins along each axis of the data
+    aggregate : dict
+        Mapping of each axis to aggregate across to the indices of the bins
+        which are included in the aggregate
+    indices : numpy.ndarray, optional
+        Flattened indices of the bins for which to build the columns of the
+        matrix. Defaults to all bins.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Matrix mapping each of the bins to its aggregated bin, weighted by the
+        number of times it is included in the aggregate
+
+    """
+
+    if indices is None:
+        indices = np.arange(int(np.prod(dims)))
+    multi_index = list(np.unravel_index(indices, dims))
+    new_dims = list(dims)
+    weights = np.ones(indices.size)
+
+    for axis, bins in aggregate.items():
+        counts = np.bincount(bins, minlength=dims[axis])
+        weights *= counts[multi_index[axis]]
+        multi_index[axis] = np.zeros_like(indices)
+        new_dims[axis] = 1
+
+    new_indices = np.ravel_multi_index(multi_index, new_dims)
+    shape = (int(np.prod(new_dims)), indices.size)
+    return sps.csr_matrix((weights, (new_indices, np.arange(indices.size))),
+                          shape=shape)
+
+
+def _to_sparse(data):
+    """Convert tally data to a sparse matrix.
+
+    Sparse tally data is stored as a SciPy compressed sparse row (CSR) matrix
+    with one row per filter bin and one column per nuclide and score bin.
+
+    Parameters
+    ----------
+    data : numpy.ndarray or scipy.sparse.spmatrix
+        Tally data indexed by filter bin, nuclide and score
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Tally data as a sparse matrix
+
+    """
+
+    if sps.issparse(data):
+        return data.tocsr()
+
+    data = np.asarray(data)
+    return sps.csr_matrix(np.reshape(data, (data.shape[0], -1)))
+
+
+def _sparse_values(matrix, rows, cols):
+    """Return the entries of a sparse matrix at the given positions.
+
+    Parameters
+    ----------
+    matrix : scipy.sparse.spmatrix
+        Sparse matrix to extract values from
+    rows : numpy.ndarray
+        Row index of each entry
+    cols : numpy.ndarray
+        Column index of each entry
+
+    Returns
+    -------
+    numpy.ndarray
+        Values of the entries
+
+    """
+
+    if len(rows) == 0:
+        return np.zeros(0)
+    return np.asarray(matrix.tocsr()[rows, cols]).ravel()
+
+
+def _sparse_binary_op(binary_op, mean1, std_dev1, mean2, std_dev2):
+    """Apply a binary operation entrywise to the data of two sparse tallies.
+
+    This is a helper method for :meth:`Tally.hybrid_product` which propagates
+    the uncertainties in the same way as for dense tally data, without
+    converting the sparse matrices to dense arrays.
+
+    Parameters
+    ----------
+    binary_op : {'+', '-', '*', '/'}
+        The binary operation
+    mean1, std_dev1 : scipy.sparse.csr_matrix
+        Mean and standard deviation of the left hand side operand
+    mean2, std_dev2 : scipy.sparse.csr_matrix
+        Mean and standard deviation of the right hand side operand
+
+    Returns
+    -------
+    mean : scipy.sparse.csr_matrix
+        Mean of the result
+    std_dev : scipy.sparse.csr_matrix
+        Standard deviation of the result
+
+    """
+
+    if binary_op in ('+', '-'):
+        mean = mean1 + mean2 if binary_op == '+' else mean1 - mean2
+        std_dev = (std_dev1.power(2) + std_dev2.power(2)).sqrt()
+        return mean.tocsr(), std_dev.tocsr()
+
+    # Products and quotients are only nonzero where both operands are
+    pattern = abs(mean1).sign().multiply(abs(mean2).sign()).tocoo()
+    rows = pattern.row[pattern.data != 0]
+    cols = pattern.col[pattern.data != 0]
+    m1 = _sparse_values(mean1, rows, cols)
+    m2 = _sparse_values(mean2, rows, cols)
+    rel_err1 = _sparse_values(std_dev1, rows, cols) / m1
+    rel_err2 = _sparse_values(std_dev2, rows, cols) / m2
+
+    mean = m1 * m2 if binary_op == '*' else m1 / m2
+    std_dev = np.abs(mean) * np.sqrt(rel_err1**2 + rel_err2**2)
+
+    shape = mean1.shape
+    return sps.csr_matrix((mean, (rows, cols)), shape=shape), \
+        sps.csr_matrix((std_dev, (rows, cols)), shape=shape)
+
+
+class _TallyItems(cv.CheckedList):
+    """A type-checked list of the filters, nuclides or scores of a tally which
+    notifies the tally whenever it is modified
+
+    Parameters
+    ----------
+    tally : openmc.Tally
+        Tally which the list belongs to
+    expected_type : type or Iterable of type
+        Type(s) which each element should be
+    name : str
+        Name of data being checked
+    items : Iterable, optional
+        Items to initialize the list with
+
+    """
+
+    def __init__(self, tally, expected_type, name, items=[]):
+        self._tally = tally
+        super(_TallyItems, self).__init__(expected_type, name, items)
+
+    def __getstate__(self):
+        # Copies of the list do not belong to the tally
+        state = self.__dict__.copy()
+        state.pop('_tally', None)
+        return state
+
+    def _changed(self):
+        # Items are restored before attributes when unpickling
+        tally = self.__dict__.get('_tally')
+        if tally is not None:
+            tally._changed('content')
+
+    def __setitem__(self, key, value):
+        super(_TallyItems, self).__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super(_TallyItems, self).__delitem__(key)
+        self._changed()
+
+    def __imul__(self, n):
+        result = super(_TallyItems, self).__imul__(n)
+        self._changed()
+        return result
+
+    def append(self, item):
+        super(_TallyItems, self).append(item)
+        self._changed()
+
+    def extend(self, items):
+        super(_TallyItems, self).extend(items)
+        self._changed()
+
+    def insert(self, index, item):
+        super(_TallyItems, self).insert(index, item)
+        self._changed()
+
+    def pop(self, *args):
+        item = super(_TallyItems, self).pop(*args)
+        self._changed()
+        return item
+
+    def remove(self, item):
+        super(_TallyItems, self).remove(item)
+        self._changed()
+
+    def reverse(self):
+        super(_TallyItems, self).reverse()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super(_TallyItems, self).sort(*args, **kwargs)
+        self._changed()
+
+
+class Tally(IDManagerMixin, ChangeNotifierMixin):
     """A tally defined by a set of scores that are accumulated for a list of
     nuclides given a set of filters.
 
@@ -94,10 +347,21 @@ class Tally(IDManagerMixin):
     derived : bool
         Whether or not the tally is derived from one or more other tallies
     sparse : bool
-        Whether or not the tally uses SciPy's LIL sparse matrix format for
+        Whether or not the tally uses SciPy's CSR sparse matrix format for
         compressed data storage
     derivative : openmc.TallyDerivative
         A material perturbation derivative to apply to all scores in the tally.
+    record_history : bool
+        Whether the estimate of each active batch is written to the
+        tally_history.h5 file during the simulation
+    history : h5py.Dataset or None
+        The estimate of each recorded batch indexed by batch, filter bin,
+        nuclide and score. The data is read from the tally_history.h5 file
+        next to the statepoint only when the dataset is indexed. The
+        'first_batch' attribute of the dataset's parent group gives the batch
+        of the first entry, which is the first active batch unless the history
+        was created when restarting a run. None if the history of the tally
+        was not recorded.
 
     """
 
@@ -108,12 +372,13 @@ class Tally(IDManagerMixin):
         # Initialize Tally class attributes
         self.id = tally_id
         self.name = name
-        self._filters = cv.CheckedList(_FILTER_CLASSES, 'tally filters')
-        self._nuclides = cv.CheckedList(_NUCLIDE_CLASSES, 'tally nuclides')
-        self._scores = cv.CheckedList(_SCORE_CLASSES, 'tally scores')
+        self._filters = _TallyItems(self, _FILTER_CLASSES, 'tally filters')
+        self._nuclides = _TallyItems(self, _NUCLIDE_CLASSES, 'tally nuclides')
+        self._scores = _TallyItems(self, _SCORE_CLASSES, 'tally scores')
         self._estimator = None
         self._triggers = cv.CheckedList(openmc.Trigger, 'tally triggers')
         self._derivative = None
+        self._record_history = False
 
         self._num_realizations = 0
         self._with_summary = False
@@ -127,8 +392,22 @@ class Tally(IDManagerMixin):
         self._sparse = False
 
         self._sp_filename = None
+        self._sp_ref = None
         self._results_read = False
 
+    def __getstate__(self):
+        # The reference to the statepoint which created this tally can be
+        # neither pickled nor deep copied
+        state = super(Tally, self).__getstate__()
+        state['_sp_ref'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for items in (self._filters, self._nuclides, self._scores):
+            if isinstance(items, _TallyItems):
+                items._tally = self
+
     def __eq__(self, other):
         if not isinstance(other, Tally):
             return False
@@ -199,6 +478,15 @@ class Tally(IDManagerMixin):
 
         return string
 
+    @property
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, tally_id):
+        IDManagerMixin.id.fset(self, tally_id)
+        self._changed('content')
+
     @property
     def name(self):
         return self._name
@@ -265,100 +553,19 @@ class Tally(IDManagerMixin):
 
     @property
     def sum(self):
-        if not self._sp_filename or self.derived:
-            return None
-
-        if not self._results_read:
-            # Open the HDF5 statepoint file
-            f = h5py.File(self._sp_filename, 'r')
-
-            # Extract Tally data from the file
-            data = f['tallies/tally {0}/results'.format(
-                self.id)].value
-            sum = data[:,:,0]
-            sum_sq = data[:,:,1]
-
-            # Reshape the results arrays
-            sum = np.reshape(sum, self.shape)
-            sum_sq = np.reshape(sum_sq, self.shape)
-
-            # Set the data for this Tally
-            self._sum = sum
-            self._sum_sq = sum_sq
-
-            # Convert NumPy arrays to SciPy sparse LIL matrices
-            if self.sparse:
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
-
-            # Indicate that Tally results have been read
-            self._results_read = True
-
-            # Close the HDF5 statepoint file
-            f.close()
-
-        if self.sparse:
-            return np.reshape(self._sum.toarray(), self.shape)
-        else:
-            return self._sum
+        return self._get_dense(self._get_data('sum'))
 
     @property
     def sum_sq(self):
-        if not self._sp_filename:
-            return None
-
-        if not self._results_read:
-            # Force reading of sum and sum_sq
-            self.sum
-
-        if self.sparse:
-            return np.reshape(self._sum_sq.toarray(), self.shape)
-        else:
-            return self._sum_sq
+        return self._get_dense(self._get_data('sum_sq'))
 
     @property
     def mean(self):
-        if self._mean is None:
-            if not self._sp_filename:
-                return None
-
-            self._mean = self.sum / self.num_realizations
-
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
-
-        if self.sparse:
-            return np.reshape(self._mean.toarray(), self.shape)
-        else:
-            return self._mean
+        return self._get_dense(self._get_data('mean'))
 
     @property
     def std_dev(self):
-        if self._std_dev is None:
-            if not self._sp_filename:
-                return None
-
-            n = self.num_realizations
-            nonzero = np.abs(self.mean) > 0
-            self._std_dev = np.zeros_like(self.mean)
-            self._std_dev[nonzero] = np.sqrt((self.sum_sq[nonzero]/n -
-                                              self.mean[nonzero]**2)/(n - 1))
-
-            # Convert NumPy array to SciPy sparse LIL matrix
-            if self.sparse:
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
-
-            self.with_batch_statistics = True
-
-        if self.sparse:
-            return np.reshape(self._std_dev.toarray(), self.shape)
-        else:
-            return self._std_dev
+        return self._get_dense(self._get_data('std_dev'))
 
     @property
     def with_batch_statistics(self):
@@ -376,10 +583,22 @@ class Tally(IDManagerMixin):
     def sparse(self):
         return self._sparse
 
+    @property
+    def record_history(self):
+        return self._record_history
+
+    @property
+    def history(self):
+        sp = self._sp_ref() if self._sp_ref is not None else None
+        if sp is None or self.derived:
+            return None
+        return sp._get_tally_history(self.id)
+
     @estimator.setter
     def estimator(self, estimator):
         cv.check_value('estimator', estimator, ESTIMATOR_TYPES)
         self._estimator = estimator
+        self._changed('content')
 
     @triggers.setter
     def triggers(self, triggers):
@@ -421,6 +640,11 @@ class Tally(IDManagerMixin):
             cv.check_type('tally derivative', deriv, openmc.TallyDerivative)
         self._derivative = deriv
 
+    @record_history.setter
+    def record_history(self, record_history):
+        cv.check_type('record_history', record_history, bool)
+        self._record_history = record_history
+
     @filters.setter
     def filters(self, filters):
         cv.check_type('tally filters', filters, MutableSequence)
@@ -433,7 +657,9 @@ class Tally(IDManagerMixin):
                       'Python API'.format(f, self.id)
                 raise ValueError(msg)
 
-        self._filters = cv.CheckedList(_FILTER_CLASSES, 'tally filters', filters)
+        self._filters = _TallyItems(self, _FILTER_CLASSES, 'tally filters',
+                                    filters)
+        self._changed('content')
 
     @nuclides.setter
     def nuclides(self, nuclides):
@@ -447,8 +673,9 @@ class Tally(IDManagerMixin):
                       'Python API'.format(nuclide, self.id)
                 raise ValueError(msg)
 
-        self._nuclides = cv.CheckedList(_NUCLIDE_CLASSES, 'tally nuclides',
-                                        nuclides)
+        self._nuclides = _TallyItems(self, _NUCLIDE_CLASSES, 'tally nuclides',
+                                     nuclides)
+        self._changed('content')
 
     @scores.setter
     def scores(self, scores):
@@ -466,7 +693,9 @@ class Tally(IDManagerMixin):
             if isinstance(score, string_types):
                 scores[i] = score.strip()
 
-        self._scores = cv.CheckedList(_SCORE_CLASSES, 'tally scores', scores)
+        self._scores = _TallyItems(self, _SCORE_CLASSES, 'tally scores',
+                                   scores)
+        self._changed('content')
 
     def add_filter(self, new_filter):
         """Add a filter to the tally
@@ -570,46 +799,242 @@ class Tally(IDManagerMixin):
 
     @sparse.setter
     def sparse(self, sparse):
-        """Convert tally data from NumPy arrays to SciPy list of lists (LIL)
-        sparse matrices, and vice versa.
+        """Convert tally data from NumPy arrays to SciPy compressed sparse row
+        (CSR) matrices, and vice versa.
 
         This property may be used to reduce the amount of data in memory during
-        tally data processing. The tally data will be stored as SciPy LIL
-        matrices internally within the Tally object. All tally data access
-        properties and methods will return data as a dense NumPy array.
+        tally data processing. The tally data will be stored as SciPy CSR
+        matrices internally within the Tally object, which are used directly by
+        the data access, slicing, summation and arithmetic methods. Only the
+        data access properties (e.g., :attr:`Tally.mean`) and methods which
+        build complete arrays (e.g., :meth:`Tally.get_reshaped_data`) return
+        data as a dense NumPy array.
 
         """
 
         cv.check_type('sparse', sparse, bool)
 
-        # Convert NumPy arrays to SciPy sparse LIL matrices
-        if sparse and not self.sparse:
-            if self._sum is not None:
-                self._sum = \
-                    sps.lil_matrix(self._sum.flatten(), self._sum.shape)
-            if self._sum_sq is not None:
-                self._sum_sq = \
-                    sps.lil_matrix(self._sum_sq.flatten(), self._sum_sq.shape)
-            if self._mean is not None:
-                self._mean = \
-                    sps.lil_matrix(self._mean.flatten(), self._mean.shape)
-            if self._std_dev is not None:
-                self._std_dev = \
-                    sps.lil_matrix(self._std_dev.flatten(), self._std_dev.shape)
-
-            self._sparse = True
-
-        # Convert SciPy sparse LIL matrices to NumPy arrays
-        elif not sparse and self.sparse:
-            if self._sum is not None:
-                self._sum = np.reshape(self._sum.toarray(), self.shape)
-            if self._sum_sq is not None:
-                self._sum_sq = np.reshape(self._sum_sq.toarray(), self.shape)
-            if self._mean is not None:
-                self._mean = np.reshape(self._mean.toarray(), self.shape)
-            if self._std_dev is not None:
-                self._std_dev = np.reshape(self._std_dev.toarray(), self.shape)
-            self._sparse = False
+        for attr in ('_sum', '_sum_sq', '_mean', '_std_dev'):
+            data = getattr(self, attr)
+            if data is None:
+                continue
+
+            # Convert NumPy arrays to SciPy sparse CSR matrices
+            if sparse:
+                setattr(self, attr, _to_sparse(data))
+
+            # Convert SciPy sparse CSR matrices to NumPy arrays
+            elif sps.issparse(data):
+                setattr(self, attr, np.reshape(data.toarray(), self.shape))
+
+        self._sparse = sparse
+
+    def _get_data(self, value):
+        """Return tally data in the format in which it is stored.
+
+        Sparse tally data is returned as a SciPy CSR matrix with one row per
+        filter bin and one column per nuclide and score bin, so that it is not
+        converted to a dense array. The mean and standard deviation are
+        computed the first time they are requested.
+
+        Parameters
+        ----------
+        value : {'sum', 'sum_sq', 'mean', 'std_dev'}
+            The type of data to return
+
+        Returns
+        -------
+        numpy.ndarray or scipy.sparse.csr_matrix or None
+            The tally data, or None if the tally has no such data
+
+        """
+
+        if value == 'sum':
+            if not self._sp_filename or self.derived:
+                return None
+
+            if not self._results_read:
+                self._read_results()
+
+            return self._sum
+
+        elif value == 'sum_sq':
+            if not self._sp_filename:
+                return None
+
+            if not self._results_read and not self.derived:
+                self._read_results()
+
+            return self._sum_sq
+
+        elif value == 'mean':
+            if self._mean is None:
+                sum = self._get_data('sum')
+                if sum is None:
+                    return None
+
+                self._mean = sum / self.num_realizations
+
+            return self._mean
+
+        elif value == 'std_dev':
+            if self._std_dev is None:
+                mean = self._get_data('mean')
+                if mean is None or not self._sp_filename:
+                    return None
+
+                self._std_dev = _std_dev(mean, self._get_data('sum_sq'),
+                                         self.num_realizations)
+                self.with_batch_statistics = True
+
+            return self._std_dev
+
+    def _get_dense(self, data):
+        """Return tally data as a dense array indexed by filter bin, nuclide
+        and score.
+
+        Parameters
+        ----------
+        data : numpy.ndarray or scipy.sparse.spmatrix or None
+            Tally data in the format in which it is stored
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Dense tally data
+
+        """
+
+        if data is not None and sps.issparse(data):
+            return np.reshape(data.toarray(), self.shape)
+        else:
+            return data
+
+    @contextmanager
+    def _results_dataset(self):
+        """Open the results dataset of this tally in the statepoint file.
+
+        The HDF5 file handle of the statepoint which created this tally is
+        reused if the statepoint is still open. Otherwise the file is opened
+        and closed again when the context exits.
+
+        Yields
+        ------
+        h5py.Dataset
+            Results dataset for this tally
+
+        """
+
+        path = 'tallies/tally {0}/results'.format(self.id)
+        sp = self._sp_ref() if self._sp_ref is not None else None
+        if sp is not None and sp._f:
+            yield sp._f[path]
+        else:
+            with h5py.File(self._sp_filename, 'r') as f:
+                yield f[path]
+
+    def _read_results(self, data=None):
+        """Set the sum and sum_sq arrays from the tally's results.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, optional
+            Results array for this tally as stored in the statepoint file. If
+            not given, the results are read from the file of the statepoint
+            which created this tally, reusing its HDF5 file handle if the
+            statepoint is still open.
+
+        """
+
+        if data is None:
+            with self._results_dataset() as dataset:
+                data = dataset.value
+
+        # Reshape the results arrays
+        self._sum = np.reshape(data[:,:,0], self.shape)
+        self._sum_sq = np.reshape(data[:,:,1], self.shape)
+
+        # Convert NumPy arrays to SciPy sparse CSR matrices
+        if self.sparse:
+            self._sum = _to_sparse(self._sum)
+            self._sum_sq = _to_sparse(self._sum_sq)
+
+        # Indicate that Tally results have been read
+        self._results_read = True
+
+    @property
+    def _lazy_results(self):
+        # Results which have not been loaded yet may be read piecewise
+        # directly from the statepoint file
+        return bool(self._sp_filename) and not self.derived and \
+            not self._results_read and self._mean is None
+
+    def _read_results_slice(self, filter_indices, nuclide_indices,
+                            score_indices):
+        """Read a subset of the sum and sum_sq arrays from the statepoint.
+
+        Only the requested filter bins are read from the results dataset,
+        either with an HDF5 hyperslab selection or, if the dataset is stored
+        contiguously, through a memory-mapped view of the file. This makes it
+        possible to extract a few bins from tallies which are too large to be
+        loaded into memory.
+
+        Parameters
+        ----------
+        filter_indices : Iterable of Integral
+            Indices into the filter axis of the tally's data arrays
+        nuclide_indices : Iterable of Integral
+            Indices into the nuclide axis of the tally's data arrays
+        score_indices : Iterable of Integral
+            Indices into the score axis of the tally's data arrays
+
+        Returns
+        -------
+        sum : numpy.ndarray
+            Sum of the realizations for the requested bins indexed by filter
+            bin, nuclide and score
+        sum_sq : numpy.ndarray
+            Sum of the squared realizations for the requested bins indexed by
+            filter bin, nuclide and score
+
+        """
+
+        filter_indices = np.asarray(filter_indices, dtype=int)
+        nuclide_indices = np.asarray(nuclide_indices, dtype=int)
+        score_indices = np.asarray(score_indices, dtype=int)
+
+        # Indices into the combined nuclide/score axis of the dataset
+        columns = nuclide_indices[:, np.newaxis] * self.num_scores + \
+                  score_indices[np.newaxis, :]
+        columns = columns.ravel()
+
+        with self._results_dataset() as dataset:
+            offset = dataset.id.get_offset()
+
+            # Contiguous datasets can be indexed through a memory map
+            if dataset.chunks is None and offset is not None:
+                results = np.memmap(self._sp_filename, mode='r',
+                                    dtype=dataset.dtype, offset=offset,
+                                    shape=dataset.shape)
+                data = results[np.ix_(filter_indices, columns)]
+                del results
+
+            # Otherwise use a hyperslab selection of the unique filter bins
+            else:
+                unique, inverse = np.unique(filter_indices,
+                                            return_inverse=True)
+                if len(unique) == 0:
+                    data = np.zeros((0,) + dataset.shape[1:])
+                elif unique[-1] - unique[0] + 1 == len(unique):
+                    data = dataset[unique[0]:unique[-1] + 1, :, :]
+                else:
+                    data = dataset[unique, :, :]
+                data = data[np.ix_(inverse, columns)]
+
+        shape = (len(filter_indices), len(nuclide_indices), len(score_indices))
+        sum = np.reshape(data[..., 0], shape)
+        sum_sq = np.reshape(data[..., 1], shape)
+        return sum, sum_sq
 
     def remove_score(self, score):
         """Remove a score from the tally
@@ -1094,6 +1519,11 @@ class Tally(IDManagerMixin):
             subelement = ET.SubElement(element, "derivative")
             subelement.text = str(self.derivative.id)
 
+        # Optional batch history
+        if self.record_history:
+            subelement = ET.SubElement(element, "record_history")
+            subelement.text = 'true'
+
         return element
 
     def contains_filter(self, filter_type):
@@ -1277,14 +1707,15 @@ class Tally(IDManagerMixin):
         This is a helper method for the Tally.get_values(...) method to
         extract tally data. This method returns the indices into the filter
         axis of the tally's data array (axis=0) for particular combinations
-        of filters and their corresponding bins.
+        of filters and their corresponding bins. The bins of each filter are
+        resolved all at once, so large lists of bins may be requested.
 
         Parameters
         ----------
         filters : Iterable of openmc.FilterMeta
             An iterable of filter types
             (e.g., [MeshFilter, EnergyFilter]; default is [])
-        filter_bins : Iterable of tuple
+        filter_bins : Iterable of tuple or numpy.ndarray
             A list of tuples of filter bins corresponding to the filter_types
             parameter (e.g., [(1,), ((0., 0.625e-6),)]; default is []). Each
             tuple contains bins for the corresponding filter type in the filters
@@ -1295,7 +1726,9 @@ class Tally(IDManagerMixin):
             to the energy boundaries of the bin of interest. The bin is an
             (x,y,z) 3-tuple for MeshFilters corresponding to the mesh cell
             of interest. The order of the bins in the list must correspond to
-            the filter_types parameter.
+            the filter_types parameter. The bins for a filter may also be given
+            as a NumPy array (e.g., an N x 3 array of mesh cells), in which
+            case they are resolved with :meth:`Filter.get_bin_indices`.
 
         Returns
         -------
@@ -1305,66 +1738,55 @@ class Tally(IDManagerMixin):
         """
 
         cv.check_type('filters', filters, Iterable, openmc.FilterMeta)
-        cv.check_type('filter_bins', filter_bins, Iterable, tuple)
+        cv.check_type('filter_bins', filter_bins, Iterable,
+                      (tuple, np.ndarray))
 
         # Determine the score indices from any of the requested scores
         if filters:
-            # Initialize empty list of indices for each bin in each Filter
-            filter_indices = []
+            # Initialize the filter indices for an empty outer product
+            filter_indices = np.zeros(1, dtype=np.int)
 
             # Loop over all of the Tally's Filters
-            for i, self_filter in enumerate(self.filters):
+            for self_filter in self.filters:
                 user_filter = False
 
                 # If a user-requested Filter, get the user-requested bins
                 for j, test_filter in enumerate(filters):
                     if type(self_filter) is test_filter:
-                        bins = filter_bins[j]
+                        indices = self_filter.get_bin_indices(filter_bins[j])
                         user_filter = True
                         break
 
                 # If not a user-requested Filter, get all bins
                 if not user_filter:
-                    # Create list of 2- or 3-tuples tuples for mesh cell bins
+                    # Mesh cell bins are flattened in the order of the data
                     if isinstance(self_filter, openmc.MeshFilter):
-                        dimension = self_filter.mesh.dimension
-                        xyz = [range(1, x+1) for x in dimension]
-                        bins = list(itertools.product(*xyz))
+                        num_bins = np.prod(self_filter.mesh.dimension)
+                        indices = np.arange(num_bins)
 
-                    # Create list of 2-tuples for energy boundary bins
+                    # Energy boundary bins and distribcell instances are
+                    # consecutive indices
                     elif isinstance(self_filter, (openmc.EnergyFilter,
                         openmc.EnergyoutFilter, openmc.MuFilter,
-                        openmc.PolarFilter, openmc.AzimuthalFilter)):
-                        bins = []
-                        for k in range(self_filter.num_bins):
-                            bins.append((self_filter.bins[k], self_filter.bins[k+1]))
+                        openmc.PolarFilter, openmc.AzimuthalFilter,
+                        openmc.DistribcellFilter)):
+                        indices = np.arange(self_filter.num_bins)
 
-                    # Create list of cell instance IDs for distribcell Filters
-                    elif isinstance(self_filter, openmc.DistribcellFilter):
-                        bins = [b for b in range(self_filter.num_bins)]
-
-                    # EnergyFunctionFilters don't have bins so just add a None
+                    # EnergyFunctionFilters don't have bins so just add a zero
                     elif isinstance(self_filter, openmc.EnergyFunctionFilter):
-                        bins = [None]
-
-                    # Create list of IDs for bins for all other filter types
-                    else:
-                        bins = self_filter.bins
-
-                # Initialize a NumPy array for the Filter bin indices
-                filter_indices.append(np.zeros(len(bins), dtype=np.int))
+                        indices = np.zeros(1, dtype=np.int)
 
-                # Add indices for each bin in this Filter to the list
-                for j, bin in enumerate(bins):
-                    filter_index = self.get_filter_index(type(self_filter), bin)
-                    filter_indices[i][j] = filter_index
+                    # Look up the IDs of the bins for all other filter types
+                    elif isinstance(self_filter, openmc.Filter):
+                        indices = self_filter.get_bin_indices(self_filter.bins)
 
-                # Account for stride in each of the previous filters
-                for indices in filter_indices[:i]:
-                    indices *= self_filter.num_bins
+                    else:
+                        indices = np.array([self_filter.get_bin_index(bin)
+                                            for bin in self_filter.bins])
 
-            # Apply outer product sum between all filter bin indices
-            filter_indices = list(map(sum, itertools.product(*filter_indices)))
+                # Apply outer product sum accounting for the filter's stride
+                filter_indices = np.add.outer(
+                    filter_indices * self_filter.num_bins, indices).ravel()
 
         # If user did not specify any specific Filters, use them all
         else:
@@ -1452,7 +1874,9 @@ class Tally(IDManagerMixin):
 
         This method constructs a 3D NumPy array for the requested Tally data
         indexed by filter bin, nuclide bin, and score index. The method will
-        order the data in the array as specified in the parameter lists.
+        order the data in the array as specified in the parameter lists. If
+        the tally's results have not been loaded from the statepoint yet, only
+        the requested bins are read from the statepoint file.
 
         Parameters
         ----------
@@ -1473,7 +1897,8 @@ class Tally(IDManagerMixin):
             to the energy boundaries of the bin of interest. The bin is an
             (x,y,z) 3-tuple for 'mesh' filters corresponding to the mesh cell
             of interest. The order of the bins in the list must correspond to
-            the filter_types parameter.
+            the filter_types parameter. The bins for a filter may also be given
+            as a NumPy array.
         nuclides : list of str
             A list of nuclide name strings
             (e.g., ['U235', 'U238']; default is [])
@@ -1496,12 +1921,36 @@ class Tally(IDManagerMixin):
 
         """
 
+        # If the results have not been loaded, only read the requested bins
+        if self._lazy_results and \
+           value in ('mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'):
+            filter_indices = self.get_filter_indices(filters, filter_bins)
+            nuclide_indices = self.get_nuclide_indices(nuclides)
+            score_indices = self.get_score_indices(scores)
+            sum, sum_sq = self._read_results_slice(
+                filter_indices, nuclide_indices, score_indices)
+
+            if value == 'sum':
+                return sum
+            elif value == 'sum_sq':
+                return sum_sq
+
+            mean = sum / self.num_realizations
+            if value == 'mean':
+                return mean
+
+            std_dev = _std_dev(mean, sum_sq, self.num_realizations)
+            if value == 'std_dev':
+                return std_dev
+            else:
+                return std_dev / mean
+
         # Ensure that the tally has data
-        if (value == 'mean' and self.mean is None) or \
-           (value == 'std_dev' and self.std_dev is None) or \
-           (value == 'rel_err' and self.mean is None) or \
-           (value == 'sum' and self.sum is None) or \
-           (value == 'sum_sq' and self.sum_sq is None):
+        if (value == 'mean' and self._get_data('mean') is None) or \
+           (value == 'std_dev' and self._get_data('std_dev') is None) or \
+           (value == 'rel_err' and self._get_data('mean') is None) or \
+           (value == 'sum' and self._get_data('sum') is None) or \
+           (value == 'sum_sq' and self._get_data('sum_sq') is None):
             msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
             raise ValueError(msg)
 
@@ -1510,6 +1959,27 @@ class Tally(IDManagerMixin):
         nuclide_indices = self.get_nuclide_indices(nuclides)
         score_indices = self.get_score_indices(scores)
 
+        if value not in ('mean', 'std_dev', 'rel_err', 'sum', 'sum_sq'):
+            msg = 'Unable to return results from Tally ID="{0}" since the ' \
+                  'the requested value "{1}" is not \'mean\', \'std_dev\', ' \
+                  '\'rel_err\', \'sum\', or \'sum_sq\''.format(self.id, value)
+            raise LookupError(msg)
+
+        # Only densify the requested rows and columns of sparse data
+        if self.sparse:
+            shape = (len(filter_indices), len(nuclide_indices),
+                     len(score_indices))
+
+            def get_data(value):
+                data = self._get_sparse_values(filter_indices, nuclide_indices,
+                                               score_indices, value)
+                return np.reshape(data.toarray(), shape)
+
+            if value == 'rel_err':
+                return get_data('std_dev') / get_data('mean')
+            else:
+                return get_data(value)
+
         # Construct outer product of all three index types with each other
         indices = np.ix_(filter_indices, nuclide_indices, score_indices)
 
@@ -1522,22 +1992,48 @@ class Tally(IDManagerMixin):
             data = self.std_dev[indices] / self.mean[indices]
         elif value == 'sum':
             data = self.sum[indices]
-        elif value == 'sum_sq':
-            data = self.sum_sq[indices]
         else:
-            msg = 'Unable to return results from Tally ID="{0}" since the ' \
-                  'the requested value "{1}" is not \'mean\', \'std_dev\', ' \
-                  '\'rel_err\', \'sum\', or \'sum_sq\''.format(self.id, value)
-            raise LookupError(msg)
+            data = self.sum_sq[indices]
 
         return data
 
+    def _get_sparse_values(self, filter_indices, nuclide_indices,
+                           score_indices, value):
+        """Return a subset of sparse tally data without densifying it.
+
+        Parameters
+        ----------
+        filter_indices : Iterable of Integral
+            Indices of the filter bins to return
+        nuclide_indices : Iterable of Integral
+            Indices of the nuclides to return
+        score_indices : Iterable of Integral
+            Indices of the scores to return
+        value : {'sum', 'sum_sq', 'mean', 'std_dev'}
+            The type of data to return
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            The requested data with one row per filter bin and one column per
+            nuclide and score bin
+
+        """
+
+        columns = (np.reshape(nuclide_indices, (-1, 1)) * self.num_scores
+                   + np.reshape(score_indices, (1, -1))).ravel()
+        data = _to_sparse(self._get_data(value))[filter_indices]
+        return data[:, columns]
+
     def get_pandas_dataframe(self, filters=True, nuclides=True, scores=True,
-                             derivative=True, paths=True, float_format='{:.2e}'):
+                             derivative=True, paths=True, float_format='{:.2e}',
+                             multi_index=False):
         """Build a Pandas DataFrame for the Tally data.
 
         This method constructs a Pandas DataFrame object for the Tally data
         with columns annotated by filter, nuclide and score bin information.
+        Alternatively, the filter, nuclide and score bin information may be
+        stored compactly in a Multi-index of the DataFrame's rows.
 
         This capability has been tested for Pandas >=0.13.1. However, it is
         recommended to use v0.16 or newer versions of Pandas since this method
@@ -1561,13 +2057,21 @@ class Tally(IDManagerMixin):
         float_format : str
             All floats in the DataFrame will be formatted using the given
             format string before printing.
+        multi_index : bool
+            If True, the filter, nuclide and score bin information is stored in
+            a Pandas Multi-index of the rows with categorical levels instead of
+            in columns (default is False). Only the unique values of each level
+            and an integer code for each row are stored, which is much faster
+            to build and uses much less memory for large tallies.
 
         Returns
         -------
         pandas.DataFrame
             A Pandas DataFrame with each column annotated by filter, nuclide and
             score bin information (if these parameters are True), and the mean
-            and standard deviation of the Tally's data.
+            and standard deviation of the Tally's data. If multi_index is True,
+            the DataFrame only has columns for the mean and standard deviation
+            and is indexed by the filter, nuclide and score bin information.
 
         Raises
         ------
@@ -1583,6 +2087,11 @@ class Tally(IDManagerMixin):
             msg = 'The Tally ID="{0}" has no data to return'.format(self.id)
             raise KeyError(msg)
 
+        # Index the tally data by its bins if requested
+        if multi_index:
+            return self._get_multi_index_dataframe(
+                filters, nuclides, scores, derivative, paths, float_format)
+
         # Initialize a pandas dataframe for the tally data
         df = pd.DataFrame()
 
@@ -1600,37 +2109,15 @@ class Tally(IDManagerMixin):
 
         # Include DataFrame column for nuclides if user requested it
         if nuclides:
-            nuclides = []
-            column_name = 'nuclide'
-
-            for nuclide in self.nuclides:
-                if isinstance(nuclide, openmc.Nuclide):
-                    nuclides.append(nuclide.name)
-                elif isinstance(nuclide, openmc.AggregateNuclide):
-                    nuclides.append(nuclide.name)
-                    column_name = '{0}(nuclide)'.format(nuclide.aggregate_op)
-                else:
-                    nuclides.append(nuclide)
+            column_name, nuclides = self._get_nuclide_labels()
 
             # Tile the nuclide bins into a DataFrame column
-            nuclides = np.repeat(nuclides, len(self.scores))
-            tile_factor = data_size / len(nuclides)
-            df[column_name] = np.tile(nuclides, int(tile_factor))
+            df[column_name] = _repeat_tile(nuclides, self.num_scores, data_size)
 
         # Include column for scores if user requested it
         if scores:
-            scores = []
-            column_name = 'score'
-
-            for score in self.scores:
-                if isinstance(score, string_types + (openmc.CrossScore,)):
-                    scores.append(str(score))
-                elif isinstance(score, openmc.AggregateScore):
-                    scores.append(score.name)
-                    column_name = '{0}(score)'.format(score.aggregate_op)
-
-            tile_factor = data_size / len(self.scores)
-            df[column_name] = np.tile(scores, int(tile_factor))
+            column_name, scores = self._get_score_labels()
+            df[column_name] = _repeat_tile(scores, 1, data_size)
 
         # Include columns for derivatives if user requested it
         if derivative and (self.derivative is not None):
@@ -1673,6 +2160,148 @@ class Tally(IDManagerMixin):
 
         return df
 
+    def _get_nuclide_labels(self):
+        """Return the DataFrame column name and labels for the nuclide bins.
+
+        Returns
+        -------
+        column_name : str
+            Name of the nuclide column
+        labels : list
+            Label of each nuclide bin
+
+        """
+
+        labels = []
+        column_name = 'nuclide'
+
+        for nuclide in self.nuclides:
+            if isinstance(nuclide, openmc.Nuclide):
+                labels.append(nuclide.name)
+            elif isinstance(nuclide, openmc.AggregateNuclide):
+                labels.append(nuclide.name)
+                column_name = '{0}(nuclide)'.format(nuclide.aggregate_op)
+            else:
+                labels.append(nuclide)
+
+        return column_name, labels
+
+    def _get_score_labels(self):
+        """Return the DataFrame column name and labels for the score bins.
+
+        Returns
+        -------
+        column_name : str
+            Name of the score column
+        labels : list of str
+            Label of each score bin
+
+        """
+
+        labels = []
+        column_name = 'score'
+
+        for score in self.scores:
+            if isinstance(score, string_types + (openmc.CrossScore,)):
+                labels.append(str(score))
+            elif isinstance(score, openmc.AggregateScore):
+                labels.append(score.name)
+                column_name = '{0}(score)'.format(score.aggregate_op)
+
+        return column_name, labels
+
+    def _get_multi_index_dataframe(self, filters, nuclides, scores, derivative,
+                                   paths, float_format):
+        """Build a Pandas DataFrame for the Tally data indexed by its bins.
+
+        This is a helper method for :meth:`Tally.get_pandas_dataframe`. The
+        filter, nuclide and score bin information is built once for each bin
+        and stored as categorical levels of a Pandas Multi-index, so that the
+        labels are never repeated and tiled for every row of the DataFrame.
+
+        Parameters
+        ----------
+        filters : bool
+            Include levels with filter bin information
+        nuclides : bool
+            Include a level with nuclide bin information
+        scores : bool
+            Include a level with score bin information
+        derivative : bool
+            Include levels with differential tally info
+        paths : bool
+            Construct levels for distribcell tally filters
+        float_format : str
+            All floats in the DataFrame will be formatted using the given
+            format string before printing.
+
+        Returns
+        -------
+        pandas.DataFrame
+            A Pandas DataFrame with the mean and standard deviation of the
+            Tally's data indexed by filter, nuclide and score bin information
+
+        """
+
+        # Build a DataFrame with one row per bin for each filter, the
+        # nuclides, the scores and the derivative
+        factors = []
+        if filters:
+            for self_filter in self.filters:
+                # Use a copy with a unit stride rather than modifying the
+                # filter. The decomposed distribcell paths are computed first
+                # so that they are cached on the filter and shared by the copy.
+                if paths and isinstance(self_filter, openmc.DistribcellFilter):
+                    self_filter._get_path_levels()
+                bins_filter = copy.copy(self_filter)
+                bins_filter.stride = 1
+                factors.append(bins_filter.get_pandas_dataframe(
+                    self_filter.num_bins, paths=paths))
+
+        if nuclides:
+            column_name, labels = self._get_nuclide_labels()
+            factors.append(pd.DataFrame({column_name: labels}))
+
+        if scores:
+            column_name, labels = self._get_score_labels()
+            factors.append(pd.DataFrame({column_name: labels}))
+
+        if derivative and (self.derivative is not None):
+            columns = OrderedDict([('d_variable', [self.derivative.variable])])
+            if self.derivative.material is not None:
+                columns['d_material'] = [self.derivative.material]
+            if self.derivative.nuclide is not None:
+                columns['d_nuclide'] = [self.derivative.nuclide]
+            factors.append(pd.DataFrame(columns))
+
+        if factors:
+            # The tally data is ordered as the Cartesian product of the bins
+            # of the filters, nuclides and scores
+            product = pd.MultiIndex.from_product(
+                [np.arange(len(factor)) for factor in factors])
+
+            # Each column of a factor becomes a categorical level whose codes
+            # are looked up from the bin of that factor in each row
+            names = []
+            levels = []
+            for i, factor in enumerate(factors):
+                bins = product.get_level_values(i).values
+                for column in factor:
+                    codes, categories = pd.factorize(factor[column])
+                    levels.append(pd.Categorical.from_codes(codes[bins],
+                                                            categories))
+                    names.append(column)
+            index = pd.MultiIndex.from_arrays(levels, names=names)
+        else:
+            index = None
+
+        df = pd.DataFrame({'mean': self.mean.ravel(),
+                           'std. dev.': self.std_dev.ravel()},
+                          index=index, columns=['mean', 'std. dev.'])
+        df.to_string = partial(df.to_string, float_format=float_format.format)
+
+        return df
+
     def get_reshaped_data(self, value='mean'):
         """Returns an array of tally data with one dimension per filter.
 
@@ -1796,7 +2425,7 @@ class Tally(IDManagerMixin):
         cv.check_value('score product', score_product, _PRODUCT_TYPES)
 
         # Check that results have been read
-        if not other.derived and other.sum is None:
+        if not other.derived and other._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(other.id)
             raise ValueError(msg)
@@ -1816,97 +2445,104 @@ class Tally(IDManagerMixin):
 
         # Query the mean and std dev so the tally data is read in from file
         # if it has not already been read in.
-        self.mean, self.std_dev, other.mean, other.std_dev
-
-        # Create copies of self and other tallies to rearrange for tally
-        # arithmetic
-        self_copy = copy.deepcopy(self)
-        other_copy = copy.deepcopy(other)
+        for tally in (self, other):
+            tally._get_data('mean'), tally._get_data('std_dev')
+
+        # Operate directly on sparse data if the tallies are already aligned
+        if self.sparse and other.sparse and binary_op != '^' and \
+           filter_product == nuclide_product == score_product == 'entrywise' \
+           and self.filters == other.filters \
+           and self.nuclides == other.nuclides \
+           and self.scores == other.scores:
+            new_tally._mean, new_tally._std_dev = _sparse_binary_op(
+                binary_op, self._get_data('mean'), self._get_data('std_dev'),
+                other._get_data('mean'), other._get_data('std_dev'))
+            new_tally._sparse = True
+            filters = copy.deepcopy(self.filters)
+            nuclides = copy.deepcopy(self.nuclides)
+            scores = copy.deepcopy(self.scores)
 
-        self_copy.sparse = False
-        other_copy.sparse = False
-
-        # Align the tally data based on desired hybrid product
-        data = self_copy._align_tally_data(other_copy, filter_product,
-                                           nuclide_product, score_product)
-
-        # Perform tally arithmetic operation
-        if binary_op == '+':
-            new_tally._mean = data['self']['mean'] + data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '-':
-            new_tally._mean = data['self']['mean'] - data['other']['mean']
-            new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
-                                         data['other']['std. dev.']**2)
-        elif binary_op == '*':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] * data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '/':
-            self_rel_err = data['self']['std. dev.'] / data['self']['mean']
-            other_rel_err = data['other']['std. dev.'] / data['other']['mean']
-            new_tally._mean = data['self']['mean'] / data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(self_rel_err**2 + other_rel_err**2)
-        elif binary_op == '^':
-            mean_ratio = data['other']['mean'] / data['self']['mean']
-            first_term = mean_ratio * data['self']['std. dev.']
-            second_term = \
-                np.log(data['self']['mean']) * data['other']['std. dev.']
-            new_tally._mean = data['self']['mean'] ** data['other']['mean']
-            new_tally._std_dev = np.abs(new_tally.mean) * \
-                                 np.sqrt(first_term**2 + second_term**2)
-
-        # Convert any infs and nans to zero
-        new_tally._mean[np.isinf(new_tally._mean)] = 0
-        new_tally._mean = np.nan_to_num(new_tally._mean)
-        new_tally._std_dev[np.isinf(new_tally._std_dev)] = 0
-        new_tally._std_dev = np.nan_to_num(new_tally._std_dev)
+        else:
+            # Determine the filters, nuclides and scores of the new tally and
+            # views of each tally's data which broadcast against each other
+            data, filters, nuclides, scores = self._align_tally_data(
+                other, filter_product, nuclide_product, score_product)
+
+            # Perform tally arithmetic operation in a single broadcast pass
+            if binary_op == '+':
+                new_tally._mean = data['self']['mean'] + data['other']['mean']
+                new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
+                                             data['other']['std. dev.']**2)
+            elif binary_op == '-':
+                new_tally._mean = data['self']['mean'] - data['other']['mean']
+                new_tally._std_dev = np.sqrt(data['self']['std. dev.']**2 +
+                                             data['other']['std. dev.']**2)
+            elif binary_op == '*':
+                self_rel_err = data['self']['std. dev.'] / data['self']['mean']
+                other_rel_err = \
+                    data['other']['std. dev.'] / data['other']['mean']
+                new_tally._mean = data['self']['mean'] * data['other']['mean']
+                new_tally._std_dev = np.abs(new_tally.mean) * \
+                    np.sqrt(self_rel_err**2 + other_rel_err**2)
+            elif binary_op == '/':
+                self_rel_err = data['self']['std. dev.'] / data['self']['mean']
+                other_rel_err = \
+                    data['other']['std. dev.'] / data['other']['mean']
+                new_tally._mean = data['self']['mean'] / data['other']['mean']
+                new_tally._std_dev = np.abs(new_tally.mean) * \
+                    np.sqrt(self_rel_err**2 + other_rel_err**2)
+            elif binary_op == '^':
+                mean_ratio = data['other']['mean'] / data['self']['mean']
+                first_term = mean_ratio * data['self']['std. dev.']
+                second_term = \
+                    np.log(data['self']['mean']) * data['other']['std. dev.']
+                new_tally._mean = data['self']['mean'] ** data['other']['mean']
+                new_tally._std_dev = np.abs(new_tally.mean) * \
+                    np.sqrt(first_term**2 + second_term**2)
+
+            # Convert any infs and nans to zero
+            new_tally._mean[np.isinf(new_tally._mean)] = 0
+            new_tally._mean = np.nan_to_num(new_tally._mean)
+            new_tally._std_dev[np.isinf(new_tally._std_dev)] = 0
+            new_tally._std_dev = np.nan_to_num(new_tally._std_dev)
 
         # Set tally attributes
-        if self_copy.estimator == other_copy.estimator:
-            new_tally.estimator = self_copy.estimator
-        if self_copy.with_summary and other_copy.with_summary:
-            new_tally.with_summary = self_copy.with_summary
-        if self_copy.num_realizations == other_copy.num_realizations:
-            new_tally.num_realizations = self_copy.num_realizations
+        if self.estimator == other.estimator:
+            new_tally.estimator = self.estimator
+        if self.with_summary and other.with_summary:
+            new_tally.with_summary = self.with_summary
+        if self.num_realizations == other.num_realizations:
+            new_tally.num_realizations = self.num_realizations
 
         # Add filters to the new tally
-        if filter_product == 'entrywise':
-            for self_filter in self_copy.filters:
-                new_tally.filters.append(self_filter)
-        else:
-            all_filters = [self_copy.filters, other_copy.filters]
-            for self_filter, other_filter in itertools.product(*all_filters):
-                new_filter = openmc.CrossFilter(self_filter, other_filter,
-                                                binary_op)
-                new_tally.filters.append(new_filter)
+        for new_filter in filters:
+            new_tally.filters.append(new_filter)
 
         # Add nuclides to the new tally
         if nuclide_product == 'entrywise':
-            for self_nuclide in self_copy.nuclides:
-                new_tally.nuclides.append(self_nuclide)
+            for nuclide in nuclides:
+                new_tally.nuclides.append(nuclide)
         else:
-            all_nuclides = [self_copy.nuclides, other_copy.nuclides]
-            for self_nuclide, other_nuclide in itertools.product(*all_nuclides):
+            for self_nuclide, other_nuclide in nuclides:
                 new_nuclide = \
                     openmc.CrossNuclide(self_nuclide, other_nuclide, binary_op)
                 new_tally.nuclides.append(new_nuclide)
 
         # Add scores to the new tally
         if score_product == 'entrywise':
-            for self_score in self_copy.scores:
-                new_tally.scores.append(self_score)
+            for score in scores:
+                new_tally.scores.append(score)
         else:
-            all_scores = [self_copy.scores, other_copy.scores]
-            for self_score, other_score in itertools.product(*all_scores):
+            for self_score, other_score in scores:
                 new_score = openmc.CrossScore(self_score, other_score,
                                               binary_op)
                 new_tally.scores.append(new_score)
 
+        # Collapse the broadcast axes of the dense data arrays
+        if not new_tally.sparse:
+            new_tally._mean = np.reshape(new_tally._mean, new_tally.shape)
+            new_tally._std_dev = np.reshape(new_tally._std_dev, new_tally.shape)
+
         # Update the new tally's filter strides
         new_tally._update_filter_strides()
 
@@ -1929,11 +2565,13 @@ class Tally(IDManagerMixin):
         This is a helper method to construct a dict of dicts of the "aligned"
         data arrays from each tally for tally arithmetic. The method analyzes
         the filters, scores and nuclides in both tallies and determines how to
-        appropriately align the data for vectorized arithmetic. For example,
-        if the two tallies have different filters, this method will use NumPy
-        'tile' and 'repeat' operations to the new data arrays such that all
-        possible combinations of the data in each tally's bins will be made
-        when the arithmetic operation is applied to the arrays.
+        appropriately align the data for vectorized arithmetic. Each tally's
+        data is reshaped with one axis per filter, then transposed and expanded
+        with new axes (for filters only in the other tally and tensor products)
+        such that the arrays of the two tallies broadcast against each other.
+        All possible combinations of the data in each tally's bins are then
+        made when the arithmetic operation is applied to the arrays, without
+        first copying the data of either tally to the size of the result.
 
         Parameters
         ----------
@@ -1951,138 +2589,116 @@ class Tally(IDManagerMixin):
 
         Returns
         -------
-        dict
+        data : dict
             A dictionary of dictionaries to "aligned" 'mean' and 'std. dev'
-            NumPy arrays for each tally's data.
+            NumPy arrays for each tally's data. The arrays broadcast to an
+            array with one axis per filter of the result followed by the
+            nuclide and score axes.
+        filters : list of openmc.Filter
+            Copies of this tally's filters followed by copies of the filters
+            only in the other tally
+        nuclides : list
+            The nuclides of this tally followed by the nuclides only in the
+            other tally for the entrywise product, or each pair of nuclides from
+            the two tallies for the tensor product
+        scores : list
+            The scores of this tally followed by the scores only in the other
+            tally for the entrywise product, or each pair of scores from the
+            two tallies for the tensor product
 
         """
 
-        # Get the set of filters that each tally is missing
-        other_missing_filters = \
-            set(self.filters).difference(set(other.filters))
-        self_missing_filters = \
-            set(other.filters).difference(set(self.filters))
-
-        # Add filters present in self but not in other to other
-        for other_filter in other_missing_filters:
-            filter_copy = copy.deepcopy(other_filter)
-            other._mean = np.repeat(other.mean, filter_copy.num_bins, axis=0)
-            other._std_dev = np.repeat(other.std_dev, filter_copy.num_bins, axis=0)
-            other.filters.append(filter_copy)
-
-        # Add filters present in other but not in self to self
-        for self_filter in self_missing_filters:
-            filter_copy = copy.deepcopy(self_filter)
-            self._mean = np.repeat(self.mean, filter_copy.num_bins, axis=0)
-            self._std_dev = np.repeat(self.std_dev, filter_copy.num_bins, axis=0)
-            self.filters.append(filter_copy)
-
-        # Align other filters with self filters
-        for i, self_filter in enumerate(self.filters):
-            other_index = other.filters.index(self_filter)
-
-            # If necessary, swap other filter
-            if other_index != i:
-                other._swap_filters(self_filter, other.filters[i])
-
-        # Repeat and tile the data by nuclide in preparation for performing
-        # the tensor product across nuclides.
+        def find(items, item):
+            for i, test_item in enumerate(items):
+                if test_item == item:
+                    return i
+            return -1
+
+        # Add filters present in other but not in self to the end of the
+        # filters such that they vary fastest in the result
+        filters = list(self.filters)
+        for other_filter in other.filters:
+            if find(filters, other_filter) == -1:
+                filters.append(other_filter)
+        filters = copy.deepcopy(filters)
+
+        # Add nuclides and scores present in other but not in self for the
+        # entrywise product or combine them in all ways for the tensor product
         if nuclide_product == 'tensor':
-            self._mean = \
-                np.repeat(self.mean, other.num_nuclides, axis=1)
-            self._std_dev = \
-                np.repeat(self.std_dev, other.num_nuclides, axis=1)
-            other._mean = \
-                np.tile(other.mean, (1, self.num_nuclides, 1))
-            other._std_dev = \
-                np.tile(other.std_dev, (1, self.num_nuclides, 1))
-
-        # Add nuclides to each tally such that each tally contains the complete
-        # set of nuclides necessary to perform an entrywise product. New
-        # nuclides added to a tally will have all their scores set to zero.
+            nuclides = list(itertools.product(copy.deepcopy(self.nuclides),
+                                              copy.deepcopy(other.nuclides)))
         else:
+            nuclides = list(self.nuclides)
+            for nuclide in other.nuclides:
+                if find(nuclides, nuclide) == -1:
+                    nuclides.append(nuclide)
+            nuclides = copy.deepcopy(nuclides)
 
-            # Get the set of nuclides that each tally is missing
-            other_missing_nuclides = \
-                set(self.nuclides).difference(set(other.nuclides))
-            self_missing_nuclides = \
-                set(other.nuclides).difference(set(self.nuclides))
-
-            # Add nuclides present in self but not in other to other
-            for nuclide in other_missing_nuclides:
-                other._mean = \
-                    np.insert(other.mean, other.num_nuclides, 0, axis=1)
-                other._std_dev = \
-                    np.insert(other.std_dev, other.num_nuclides, 0, axis=1)
-                other.nuclides.append(nuclide)
-
-            # Add nuclides present in other but not in self to self
-            for nuclide in self_missing_nuclides:
-                self._mean = \
-                    np.insert(self.mean, self.num_nuclides, 0, axis=1)
-                self._std_dev = \
-                    np.insert(self.std_dev, self.num_nuclides, 0, axis=1)
-                self.nuclides.append(nuclide)
-
-            # Align other nuclides with self nuclides
-            for i, nuclide in enumerate(self.nuclides):
-                other_index = other.get_nuclide_index(nuclide)
-
-                # If necessary, swap other nuclide
-                if other_index != i:
-                    other._swap_nuclides(nuclide, other.nuclides[i])
-
-        # Repeat and tile the data by score in preparation for performing
-        # the tensor product across scores.
         if score_product == 'tensor':
-            self._mean = np.repeat(self.mean, other.num_scores, axis=2)
-            self._std_dev = np.repeat(self.std_dev, other.num_scores, axis=2)
-            other._mean = np.tile(other.mean, (1, 1, self.num_scores))
-            other._std_dev = np.tile(other.std_dev, (1, 1, self.num_scores))
-
-        # Add scores to each tally such that each tally contains the complete set
-        # of scores necessary to perform an entrywise product. New scores added
-        # to a tally will be set to zero.
+            scores = list(itertools.product(copy.deepcopy(self.scores),
+                                            copy.deepcopy(other.scores)))
         else:
-
-            # Get the set of scores that each tally is missing
-            other_missing_scores = \
-                set(self.scores).difference(set(other.scores))
-            self_missing_scores = \
-                set(other.scores).difference(set(self.scores))
-
-            # Add scores present in self but not in other to other
-            for score in other_missing_scores:
-                other._mean = np.insert(other.mean, other.num_scores, 0, axis=2)
-                other._std_dev = np.insert(other.std_dev, other.num_scores, 0, axis=2)
-                other.scores.append(score)
-
-            # Add scores present in other but not in self to self
-            for score in self_missing_scores:
-                self._mean = np.insert(self.mean, self.num_scores, 0, axis=2)
-                self._std_dev = np.insert(self.std_dev, self.num_scores, 0, axis=2)
-                self.scores.append(score)
-
-            # Align other scores with self scores
-            for i, score in enumerate(self.scores):
-                other_index = other.scores.index(score)
-
-                # If necessary, swap other score
-                if other_index != i:
-                    other._swap_scores(score, other.scores[i])
-
-        # Update the tallies' filter strides
-        other._update_filter_strides()
-        self._update_filter_strides()
+            scores = list(self.scores)
+            for score in other.scores:
+                if find(scores, score) == -1:
+                    scores.append(score)
+            scores = copy.deepcopy(scores)
+
+        def align(tally, tensor_index):
+            # Find this tally's axis for each of the result's filters
+            filter_axes = [find(tally.filters, f) for f in filters]
+            present_axes = [axis for axis in filter_axes if axis != -1]
+            shape = [tally.filters[axis].num_bins if axis != -1 else 1
+                     for axis in filter_axes]
+
+            # Add axes for the nuclides and scores of the other tally in a
+            # tensor product, with this tally's bins varying slowest
+            for product, size, union in (
+                    (nuclide_product, tally.num_nuclides, nuclides),
+                    (score_product, tally.num_scores, scores)):
+                if product == 'tensor':
+                    product_shape = [1, 1]
+                    product_shape[tensor_index] = size
+                    shape.extend(product_shape)
+                else:
+                    shape.append(len(union))
+
+            # Index the nuclides and scores in the order of the union of the
+            # nuclides and scores, padding missing bins with zeros
+            entrywise = []
+            if nuclide_product == 'entrywise':
+                entrywise.append(
+                    (1, [find(tally.nuclides, n) for n in nuclides]))
+            if score_product == 'entrywise':
+                entrywise.append((2, [find(tally.scores, s) for s in scores]))
+
+            aligned = {}
+            for key, value in (('mean', tally.mean),
+                               ('std. dev.', tally.std_dev)):
+                for axis, indices in entrywise:
+                    size = value.shape[axis]
+                    if indices != list(range(size)):
+                        zeros_shape = list(value.shape)
+                        zeros_shape[axis] = 1
+                        value = np.concatenate(
+                            (value, np.zeros(zeros_shape)), axis=axis)
+                        indices = [i if i != -1 else size for i in indices]
+                        value = np.take(value, indices, axis=axis)
+
+                # Reshape with one axis per filter in the order of the result
+                filter_shape = [f.num_bins for f in tally.filters]
+                value = np.reshape(value, filter_shape + list(value.shape[1:]))
+                num_filters = len(filter_shape)
+                value = np.transpose(value, present_axes +
+                    [num_filters, num_filters + 1])
+                aligned[key] = np.reshape(value, shape)
+
+            return aligned
 
         data = {}
-        data['self'] = {}
-        data['other'] = {}
-        data['self']['mean'] = self.mean
-        data['other']['mean'] = other.mean
-        data['self']['std. dev.'] = self.std_dev
-        data['other']['std. dev.'] = other.std_dev
-        return data
+        data['self'] = align(self, 0)
+        data['other'] = align(other, 1)
+        return data, filters, nuclides, scores
 
     def _swap_filters(self, filter1, filter2):
         """Reverse the ordering of two filters in this tally
@@ -2197,7 +2813,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2264,7 +2880,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2348,7 +2964,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2420,7 +3036,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2492,7 +3108,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2508,8 +3124,8 @@ class Tally(IDManagerMixin):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self.mean * other
-            new_tally._std_dev = self.std_dev * np.abs(other)
+            new_tally._mean = self._get_data('mean') * other
+            new_tally._std_dev = self._get_data('std_dev') * np.abs(other)
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2564,7 +3180,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2580,8 +3196,8 @@ class Tally(IDManagerMixin):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self.mean / other
-            new_tally._std_dev = self.std_dev * np.abs(1. / other)
+            new_tally._mean = self._get_data('mean') / other
+            new_tally._std_dev = self._get_data('std_dev') * np.abs(1. / other)
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2639,7 +3255,7 @@ class Tally(IDManagerMixin):
         """
 
         # Check that results have been read
-        if not self.derived and self.sum is None:
+        if not self.derived and self._get_data('sum') is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2655,9 +3271,25 @@ class Tally(IDManagerMixin):
             new_tally = Tally(name='derived')
             new_tally._derived = True
             new_tally.name = self.name
-            new_tally._mean = self._mean ** power
-            self_rel_err = self.std_dev / self.mean
-            new_tally._std_dev = np.abs(new_tally._mean * power * self_rel_err)
+            # Positive powers preserve the sparsity of sparse data
+            if self.sparse and power > 0:
+                mean = self._get_data('mean').tocoo()
+                nonzero = mean.data != 0
+                rows, cols = mean.row[nonzero], mean.col[nonzero]
+                self_mean = mean.data[nonzero]
+                self_rel_err = _sparse_values(
+                    self._get_data('std_dev'), rows, cols) / self_mean
+                new_mean = self_mean ** power
+                new_std_dev = np.abs(new_mean * power * self_rel_err)
+                new_tally._mean = sps.csr_matrix(
+                    (new_mean, (rows, cols)), shape=mean.shape)
+                new_tally._std_dev = sps.csr_matrix(
+                    (new_std_dev, (rows, cols)), shape=mean.shape)
+            else:
+                new_tally._mean = self.mean ** power
+                self_rel_err = self.std_dev / self.mean
+                new_tally._std_dev = \
+                    np.abs(new_tally._mean * power * self_rel_err)
             new_tally.estimator = self.estimator
             new_tally.with_summary = self.with_summary
             new_tally.num_realizations = self.num_realizations
@@ -2763,7 +3395,7 @@ class Tally(IDManagerMixin):
         """
 
         new_tally = copy.deepcopy(self)
-        new_tally._mean = np.abs(new_tally.mean)
+        new_tally._mean = abs(new_tally._get_data('mean'))
         return new_tally
 
     def __neg__(self):
@@ -2806,7 +3438,8 @@ class Tally(IDManagerMixin):
             corresponding to the energy boundaries of the bin of interest. The
             bin is an (x,y,z) 3-tuple for 'mesh' filters corresponding to the
             mesh cell of interest. The order of the bins in the list must
-            correspond to the filter_types parameter.
+            correspond to the filter_types parameter. The bins for a filter may
+            also be given as a NumPy array.
         nuclides : list of str
             A list of nuclide name strings
             (e.g., ['U235', 'U238']; default is [])
@@ -2825,7 +3458,7 @@ class Tally(IDManagerMixin):
         """
 
         # Ensure that the tally has data
-        if not self.derived and self.sum is None:
+        if not self.derived and not self._sp_filename and self._sum is None:
             msg = 'Unable to use tally arithmetic with Tally ID="{0}" ' \
                   'since it does not contain any results.'.format(self.id)
             raise ValueError(msg)
@@ -2837,24 +3470,53 @@ class Tally(IDManagerMixin):
         # Differentiate Tally with a new auto-generated Tally ID
         new_tally.id = None
 
-        new_tally.sparse = False
+        if not self.sparse:
+            new_tally.sparse = False
 
-        if not self.derived and self.sum is not None:
-            new_sum = self.get_values(scores, filters, filter_bins,
-                                      nuclides, 'sum')
+        # If the results have not been loaded, only read the sliced bins
+        if self._lazy_results:
+            filter_indices = self.get_filter_indices(filters, filter_bins)
+            nuclide_indices = self.get_nuclide_indices(nuclides)
+            score_indices = self.get_score_indices(scores)
+            new_sum, new_sum_sq = self._read_results_slice(
+                filter_indices, nuclide_indices, score_indices)
             new_tally.sum = new_sum
-        if not self.derived and self.sum_sq is not None:
-            new_sum_sq = self.get_values(scores, filters, filter_bins,
-                                         nuclides, 'sum_sq')
             new_tally.sum_sq = new_sum_sq
-        if self.mean is not None:
-            new_mean = self.get_values(scores, filters, filter_bins,
-                                       nuclides, 'mean')
-            new_tally._mean = new_mean
-        if self.std_dev is not None:
-            new_std_dev = self.get_values(scores, filters, filter_bins,
-                                          nuclides, 'std_dev')
-            new_tally._std_dev = new_std_dev
+            new_tally._mean = new_sum / self.num_realizations
+            new_tally._std_dev = _std_dev(new_tally._mean, new_sum_sq,
+                                          self.num_realizations)
+
+        # Slice sparse data without converting it to dense arrays
+        elif self.sparse:
+            filter_indices = self.get_filter_indices(filters, filter_bins)
+            nuclide_indices = self.get_nuclide_indices(nuclides)
+            score_indices = self.get_score_indices(scores)
+
+            for value in ('sum', 'sum_sq', 'mean', 'std_dev'):
+                if value in ('sum', 'sum_sq') and self.derived:
+                    continue
+                if self._get_data(value) is not None:
+                    data = self._get_sparse_values(
+                        filter_indices, nuclide_indices, score_indices, value)
+                    setattr(new_tally, '_' + value, data)
+
+        else:
+            if not self.derived and self.sum is not None:
+                new_sum = self.get_values(scores, filters, filter_bins,
+                                          nuclides, 'sum')
+                new_tally.sum = new_sum
+            if not self.derived and self.sum_sq is not None:
+                new_sum_sq = self.get_values(scores, filters, filter_bins,
+                                             nuclides, 'sum_sq')
+                new_tally.sum_sq = new_sum_sq
+            if self.mean is not None:
+                new_mean = self.get_values(scores, filters, filter_bins,
+                                           nuclides, 'mean')
+                new_tally._mean = new_mean
+            if self.std_dev is not None:
+                new_std_dev = self.get_values(scores, filters, filter_bins,
+                                              nuclides, 'std_dev')
+                new_tally._std_dev = new_std_dev
 
         # SCORES
         if scores:
@@ -2892,23 +3554,18 @@ class Tally(IDManagerMixin):
                 find_filter = new_tally.find_filter(filter_type)
 
                 # Remove and/or reorder filter bins to user specifications
-                bin_indices = []
-                num_bins = 0
+                num_bins = len(filter_bins[i])
 
-                for filter_bin in filter_bins[i]:
-                    bin_index = find_filter.get_bin_index(filter_bin)
+                if filter_type in [openmc.DistribcellFilter,
+                                   openmc.MeshFilter]:
+                    bin_indices = [0] if num_bins else []
+                    num_bins = find_filter.num_bins if num_bins else 0
+                else:
+                    bin_indices = find_filter.get_bin_indices(filter_bins[i])
                     if filter_type in [openmc.EnergyFilter,
                                        openmc.EnergyoutFilter]:
-                        bin_indices.extend([bin_index])
-                        bin_indices.extend([bin_index, bin_index+1])
-                        num_bins += 1
-                    elif filter_type in [openmc.DistribcellFilter,
-                                         openmc.MeshFilter]:
-                        bin_indices = [0]
-                        num_bins = find_filter.num_bins
-                    else:
-                        bin_indices.append(bin_index)
-                        num_bins += 1
+                        bin_indices = np.concatenate(
+                            (bin_indices, bin_indices + 1))
 
                 find_filter.bins = np.unique(find_filter.bins[bin_indices])
                 find_filter.num_bins = num_bins
@@ -2969,9 +3626,17 @@ class Tally(IDManagerMixin):
         tally_sum._sp_filename = self._sp_filename
         tally_sum._results_read = self._results_read
 
+        # Results which have not been loaded are reduced in blocks streamed
+        # from the statepoint file
+        chunked = self._lazy_results
+        dense = not (chunked or self.sparse)
+
         # Get tally data arrays reshaped with one dimension per filter
-        mean = self.get_reshaped_data(value='mean')
-        std_dev = self.get_reshaped_data(value='std_dev')
+        if dense:
+            mean = self.get_reshaped_data(value='mean')
+            std_dev = self.get_reshaped_data(value='std_dev')
+
+        bin_indices = nuclide_bins = score_bins = None
 
         # Sum across any filter bins specified by the user
         if isinstance(filter_type, openmc.FilterMeta):
@@ -2980,37 +3645,29 @@ class Tally(IDManagerMixin):
             # If user did not specify filter bins, sum across all bins
             if len(filter_bins) == 0:
                 bin_indices = np.arange(find_filter.num_bins)
-
-                if isinstance(find_filter, openmc.DistribcellFilter):
-                    filter_bins = np.arange(find_filter.num_bins)
-                elif isinstance(find_filter, openmc.EnergyFunctionFilter):
-                    filter_bins = [None]
-                else:
-                    num_bins = find_filter.num_bins
-                    filter_bins = \
-                        [(find_filter.get_bin(i)) for i in range(num_bins)]
+                filter_bins = self._get_all_filter_bins(find_filter)
 
             # Only sum across bins specified by the user
             else:
-                bin_indices = \
-                    [find_filter.get_bin_index(bin) for bin in filter_bins]
+                bin_indices = find_filter.get_bin_indices(filter_bins)
 
             # Sum across the bins in the user-specified filter
             for i, self_filter in enumerate(self.filters):
                 if isinstance(self_filter, filter_type):
-                    shape = mean.shape
-                    mean = np.take(mean, indices=bin_indices, axis=i)
-                    std_dev = np.take(std_dev, indices=bin_indices, axis=i)
+                    if dense:
+                        shape = mean.shape
+                        mean = np.take(mean, indices=bin_indices, axis=i)
+                        std_dev = np.take(std_dev, indices=bin_indices, axis=i)
 
-                    # NumPy take introduces a new dimension in output array
-                    # for some special cases that must be removed
-                    if len(mean.shape) > len(shape):
-                        mean = np.squeeze(mean, axis=i)
-                        std_dev = np.squeeze(std_dev, axis=i)
+                        # NumPy take introduces a new dimension in output array
+                        # for some special cases that must be removed
+                        if len(mean.shape) > len(shape):
+                            mean = np.squeeze(mean, axis=i)
+                            std_dev = np.squeeze(std_dev, axis=i)
 
-                    mean = np.sum(mean, axis=i, keepdims=True)
-                    std_dev = np.sum(std_dev**2, axis=i, keepdims=True)
-                    std_dev = np.sqrt(std_dev)
+                        mean = np.sum(mean, axis=i, keepdims=True)
+                        std_dev = np.sum(std_dev**2, axis=i, keepdims=True)
+                        std_dev = np.sqrt(std_dev)
 
                     # Add AggregateFilter to the tally sum
                     if not remove_filter:
@@ -3029,12 +3686,14 @@ class Tally(IDManagerMixin):
         # Sum across any nuclides specified by the user
         if len(nuclides) != 0:
             nuclide_bins = [self.get_nuclide_index(nuclide) for nuclide in nuclides]
-            axis_index = self.num_filters
-            mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=nuclide_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if dense:
+                axis_index = self.num_filters
+                mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=nuclide_bins,
+                                  axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateNuclide to the tally sum
             nuclide_sum = openmc.AggregateNuclide(nuclides, 'sum')
@@ -3047,12 +3706,13 @@ class Tally(IDManagerMixin):
         # Sum across any scores specified by the user
         if len(scores) != 0:
             score_bins = [self.get_score_index(score) for score in scores]
-            axis_index = self.num_filters + 1
-            mean = np.take(mean, indices=score_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
-            mean = np.sum(mean, axis=axis_index, keepdims=True)
-            std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev = np.sqrt(std_dev)
+            if dense:
+                axis_index = self.num_filters + 1
+                mean = np.take(mean, indices=score_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
+                mean = np.sum(mean, axis=axis_index, keepdims=True)
+                std_dev = np.sum(std_dev**2, axis=axis_index, keepdims=True)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateScore to the tally sum
             score_sum = openmc.AggregateScore(scores, 'sum')
@@ -3065,9 +3725,22 @@ class Tally(IDManagerMixin):
         # Update the tally sum's filter strides
         tally_sum._update_filter_strides()
 
+        # Aggregate blocks of the results read from the statepoint file
+        if chunked:
+            mean, std_dev = self._aggregate_chunked(
+                filter_type, bin_indices, nuclide_bins, score_bins, 'sum')
+            mean = np.reshape(mean, tally_sum.shape)
+            std_dev = np.reshape(std_dev, tally_sum.shape)
+
+        # Aggregate sparse data without converting it to dense arrays
+        elif self.sparse:
+            mean, std_dev = self._aggregate_sparse(
+                filter_type, bin_indices, nuclide_bins, score_bins, 'sum')
+
         # Reshape condensed data arrays with one dimension for all filters
-        mean = np.reshape(mean, tally_sum.shape)
-        std_dev = np.reshape(std_dev, tally_sum.shape)
+        else:
+            mean = np.reshape(mean, tally_sum.shape)
+            std_dev = np.reshape(std_dev, tally_sum.shape)
 
         # Assign tally sum's data with the new arrays
         tally_sum._mean = mean
@@ -3126,9 +3799,17 @@ class Tally(IDManagerMixin):
         tally_avg._sp_filename = self._sp_filename
         tally_avg._results_read = self._results_read
 
+        # Results which have not been loaded are reduced in blocks streamed
+        # from the statepoint file
+        chunked = self._lazy_results
+        dense = not (chunked or self.sparse)
+
         # Get tally data arrays reshaped with one dimension per filter
-        mean = self.get_reshaped_data(value='mean')
-        std_dev = self.get_reshaped_data(value='std_dev')
+        if dense:
+            mean = self.get_reshaped_data(value='mean')
+            std_dev = self.get_reshaped_data(value='std_dev')
+
+        bin_indices = nuclide_bins = score_bins = None
 
         # Average across any filter bins specified by the user
         if isinstance(filter_type, openmc.FilterMeta):
@@ -3137,38 +3818,30 @@ class Tally(IDManagerMixin):
             # If user did not specify filter bins, average across all bins
             if len(filter_bins) == 0:
                 bin_indices = np.arange(find_filter.num_bins)
-
-                if isinstance(find_filter, openmc.DistribcellFilter):
-                    filter_bins = np.arange(find_filter.num_bins)
-                elif isinstance(find_filter, openmc.EnergyFunctionFilter):
-                    filter_bins = [None]
-                else:
-                    num_bins = find_filter.num_bins
-                    filter_bins = \
-                        [(find_filter.get_bin(i)) for i in range(num_bins)]
+                filter_bins = self._get_all_filter_bins(find_filter)
 
             # Only average across bins specified by the user
             else:
-                bin_indices = \
-                    [find_filter.get_bin_index(bin) for bin in filter_bins]
+                bin_indices = find_filter.get_bin_indices(filter_bins)
 
             # Average across the bins in the user-specified filter
             for i, self_filter in enumerate(self.filters):
                 if isinstance(self_filter, filter_type):
-                    shape = mean.shape
-                    mean = np.take(mean, indices=bin_indices, axis=i)
-                    std_dev = np.take(std_dev, indices=bin_indices, axis=i)
-
-                    # NumPy take introduces a new dimension in output array
-                    # for some special cases that must be removed
-                    if len(mean.shape) > len(shape):
-                        mean = np.squeeze(mean, axis=i)
-                        std_dev = np.squeeze(std_dev, axis=i)
-
-                    mean = np.nanmean(mean, axis=i, keepdims=True)
-                    std_dev = np.nanmean(std_dev**2, axis=i, keepdims=True)
-                    std_dev /= len(bin_indices)
-                    std_dev = np.sqrt(std_dev)
+                    if dense:
+                        shape = mean.shape
+                        mean = np.take(mean, indices=bin_indices, axis=i)
+                        std_dev = np.take(std_dev, indices=bin_indices, axis=i)
+
+                        # NumPy take introduces a new dimension in output array
+                        # for some special cases that must be removed
+                        if len(mean.shape) > len(shape):
+                            mean = np.squeeze(mean, axis=i)
+                            std_dev = np.squeeze(std_dev, axis=i)
+
+                        mean = np.nanmean(mean, axis=i, keepdims=True)
+                        std_dev = np.nanmean(std_dev**2, axis=i, keepdims=True)
+                        std_dev /= len(bin_indices)
+                        std_dev = np.sqrt(std_dev)
 
                     # Add AggregateFilter to the tally avg
                     if not remove_filter:
@@ -3187,13 +3860,16 @@ class Tally(IDManagerMixin):
         # Sum across any nuclides specified by the user
         if len(nuclides) != 0:
             nuclide_bins = [self.get_nuclide_index(nuclide) for nuclide in nuclides]
-            axis_index = self.num_filters
-            mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=nuclide_bins, axis=axis_index)
-            mean = np.nanmean(mean, axis=axis_index, keepdims=True)
-            std_dev = np.nanmean(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev /= len(nuclide_bins)
-            std_dev = np.sqrt(std_dev)
+            if dense:
+                axis_index = self.num_filters
+                mean = np.take(mean, indices=nuclide_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=nuclide_bins,
+                                  axis=axis_index)
+                mean = np.nanmean(mean, axis=axis_index, keepdims=True)
+                std_dev = np.nanmean(std_dev**2, axis=axis_index,
+                                     keepdims=True)
+                std_dev /= len(nuclide_bins)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateNuclide to the tally avg
             nuclide_avg = openmc.AggregateNuclide(nuclides, 'avg')
@@ -3206,13 +3882,15 @@ class Tally(IDManagerMixin):
         # Sum across any scores specified by the user
         if len(scores) != 0:
             score_bins = [self.get_score_index(score) for score in scores]
-            axis_index = self.num_filters + 1
-            mean = np.take(mean, indices=score_bins, axis=axis_index)
-            std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
-            mean = np.nanmean(mean, axis=axis_index, keepdims=True)
-            std_dev = np.nanmean(std_dev**2, axis=axis_index, keepdims=True)
-            std_dev /= len(score_bins)
-            std_dev = np.sqrt(std_dev)
+            if dense:
+                axis_index = self.num_filters + 1
+                mean = np.take(mean, indices=score_bins, axis=axis_index)
+                std_dev = np.take(std_dev, indices=score_bins, axis=axis_index)
+                mean = np.nanmean(mean, axis=axis_index, keepdims=True)
+                std_dev = np.nanmean(std_dev**2, axis=axis_index,
+                                     keepdims=True)
+                std_dev /= len(score_bins)
+                std_dev = np.sqrt(std_dev)
 
             # Add AggregateScore to the tally avg
             score_sum = openmc.AggregateScore(scores, 'avg')
@@ -3225,9 +3903,22 @@ class Tally(IDManagerMixin):
         # Update the tally avg's filter strides
         tally_avg._update_filter_strides()
 
+        # Aggregate blocks of the results read from the statepoint file
+        if chunked:
+            mean, std_dev = self._aggregate_chunked(
+                filter_type, bin_indices, nuclide_bins, score_bins, 'avg')
+            mean = np.reshape(mean, tally_avg.shape)
+            std_dev = np.reshape(std_dev, tally_avg.shape)
+
+        # Aggregate sparse data without converting it to dense arrays
+        elif self.sparse:
+            mean, std_dev = self._aggregate_sparse(
+                filter_type, bin_indices, nuclide_bins, score_bins, 'avg')
+
         # Reshape condensed data arrays with one dimension for all filters
-        mean = np.reshape(mean, tally_avg.shape)
-        std_dev = np.reshape(std_dev, tally_avg.shape)
+        else:
+            mean = np.reshape(mean, tally_avg.shape)
+            std_dev = np.reshape(std_dev, tally_avg.shape)
 
         # Assign tally avg's data with the new arrays
         tally_avg._mean = mean
@@ -3237,6 +3928,213 @@ class Tally(IDManagerMixin):
         tally_avg.sparse = self.sparse
         return tally_avg
 
+    def _get_all_filter_bins(self, find_filter):
+        """Return the bins of a filter in the form accepted by
+        :meth:`Tally.summation` and :meth:`Tally.average`.
+
+        Parameters
+        ----------
+        find_filter : openmc.Filter
+            Filter of this tally
+
+        Returns
+        -------
+        Iterable
+            Each bin of the filter
+
+        """
+
+        if isinstance(find_filter, openmc.DistribcellFilter):
+            return np.arange(find_filter.num_bins)
+        elif isinstance(find_filter, openmc.EnergyFunctionFilter):
+            return [None]
+
+        # Construct the mesh cell indices of all bins at once
+        elif isinstance(find_filter, openmc.MeshFilter):
+            indices = np.unravel_index(np.arange(find_filter.num_bins),
+                                       tuple(find_filter.mesh.dimension))
+            return list(zip(*[(i + 1).tolist() for i in indices]))
+
+        else:
+            return [find_filter.get_bin(i) for i in range(find_filter.num_bins)]
+
+    def _get_aggregation(self, filter_type, bin_indices, nuclide_bins,
+                         score_bins):
+        """Determine how tally data bins are combined in an aggregate.
+
+        This is a helper method for :meth:`Tally.summation` and
+        :meth:`Tally.average`.
+
+        Parameters
+        ----------
+        filter_type : openmc.FilterMeta or None
+            Type of the filter(s) to aggregate across
+        bin_indices : Iterable of Integral or None
+            Indices of the filter bins to aggregate across
+        nuclide_bins : Iterable of Integral or None
+            Indices of the nuclides to aggregate across
+        score_bins : Iterable of Integral or None
+            Indices of the scores to aggregate across
+
+        Returns
+        -------
+        filter_dims : list of Integral
+            Number of bins of each filter
+        filter_aggregate : dict
+            Mapping of each filter axis to aggregate across to the indices of
+            its bins in the aggregate
+        columns : scipy.sparse.csr_matrix
+            Matrix aggregating the nuclide and score bins of the data
+        count : Integral
+            Number of bins combined into each aggregated bin
+
+        """
+
+        count = 1
+
+        # Aggregate filter bins across each filter of the requested type
+        filter_dims = [f.num_bins for f in self.filters] or [1]
+        filter_aggregate = {}
+        if bin_indices is not None:
+            for i, self_filter in enumerate(self.filters):
+                if isinstance(self_filter, filter_type):
+                    filter_aggregate[i] = np.asarray(bin_indices, dtype=int)
+                    count *= len(bin_indices)
+
+        # Aggregate nuclide and score bins
+        aggregate = {}
+        if nuclide_bins is not None:
+            aggregate[0] = np.asarray(nuclide_bins, dtype=int)
+            count *= len(nuclide_bins)
+        if score_bins is not None:
+            aggregate[1] = np.asarray(score_bins, dtype=int)
+            count *= len(score_bins)
+        columns = _aggregation_matrix(
+            [self.num_nuclides, self.num_scores], aggregate).T.tocsr()
+
+        return filter_dims, filter_aggregate, columns, count
+
+    def _aggregate_sparse(self, filter_type, bin_indices, nuclide_bins,
+                          score_bins, operation):
+        """Sum or average sparse tally data across filter, nuclide and score
+        bins.
+
+        This is a helper method for :meth:`Tally.summation` and
+        :meth:`Tally.average`. The aggregation is expressed as a product of
+        sparse matrices, one acting on the filter bins (rows) and one on the
+        nuclide and score bins (columns), so that the data is never converted
+        to dense arrays.
+
+        Parameters
+        ----------
+        filter_type : openmc.FilterMeta or None
+            Type of the filter(s) to aggregate across
+        bin_indices : Iterable of Integral or None
+            Indices of the filter bins to aggregate across
+        nuclide_bins : Iterable of Integral or None
+            Indices of the nuclides to aggregate across
+        score_bins : Iterable of Integral or None
+            Indices of the scores to aggregate across
+        operation : {'sum', 'avg'}
+            Whether to sum or average the data
+
+        Returns
+        -------
+        mean : scipy.sparse.csr_matrix
+            Aggregated mean
+        std_dev : scipy.sparse.csr_matrix
+            Aggregated standard deviation
+
+        """
+
+        filter_dims, filter_aggregate, columns, count = self._get_aggregation(
+            filter_type, bin_indices, nuclide_bins, score_bins)
+        rows = _aggregation_matrix(filter_dims, filter_aggregate)
+
+        mean = _to_sparse(self._get_data('mean'))
+        std_dev = _to_sparse(self._get_data('std_dev'))
+        mean = rows * mean * columns
+        variance = rows * std_dev.power(2) * columns
+
+        if operation == 'avg':
+            mean /= count
+            variance /= count**2
+
+        return mean.tocsr(), variance.sqrt().tocsr()
+
+    def _aggregate_chunked(self, filter_type, bin_indices, nuclide_bins,
+                           score_bins, operation):
+        """Sum or average tally data across filter, nuclide and score bins by
+        streaming the results from the statepoint file.
+
+        This is a helper method for :meth:`Tally.summation` and
+        :meth:`Tally.average` for tallies whose results have not been loaded.
+        The results dataset is read in blocks of filter bins. The mean and
+        standard deviation of each block are computed from its sum and sum_sq
+        and accumulated into the aggregated bins, such that only the
+        aggregated data and a single block are held in memory at a time.
+
+        Parameters
+        ----------
+        filter_type : openmc.FilterMeta or None
+            Type of the filter(s) to aggregate across
+        bin_indices : Iterable of Integral or None
+            Indices of the filter bins to aggregate across
+        nuclide_bins : Iterable of Integral or None
+            Indices of the nuclides to aggregate across
+        score_bins : Iterable of Integral or None
+            Indices of the scores to aggregate across
+        operation : {'sum', 'avg'}
+            Whether to sum or average the data
+
+        Returns
+        -------
+        mean : numpy.ndarray
+            Aggregated mean indexed by aggregated filter bin and aggregated
+            nuclide/score bin
+        std_dev : numpy.ndarray
+            Aggregated standard deviation indexed by aggregated filter bin and
+            aggregated nuclide/score bin
+
+        """
+
+        filter_dims, filter_aggregate, columns, count = self._get_aggregation(
+            filter_type, bin_indices, nuclide_bins, score_bins)
+        num_filter_bins = int(np.prod(filter_dims))
+        new_dims = [1 if i in filter_aggregate else dim
+                    for i, dim in enumerate(filter_dims)]
+
+        mean = np.zeros((int(np.prod(new_dims)), columns.shape[1]))
+        variance = np.zeros_like(mean)
+
+        with self._results_dataset() as dataset:
+            row_size = dataset.dtype.itemsize * int(np.prod(dataset.shape[1:]))
+            block_size = max(1, _REDUCTION_BLOCK_SIZE // row_size)
+
+            for start in range(0, num_filter_bins, block_size):
+                stop = min(start + block_size, num_filter_bins)
+
+                # Skip blocks of filter bins which are not in the aggregate
+                rows = _aggregation_matrix(filter_dims, filter_aggregate,
+                                           np.arange(start, stop))
+                if not rows.data.any():
+                    continue
+
+                # Compute the mean and standard deviation of the block
+                data = dataset[start:stop, :, :]
+                block_mean = data[..., 0] / self.num_realizations
+                block_std_dev = _std_dev(block_mean, data[..., 1],
+                                         self.num_realizations)
+
+                mean += rows * (block_mean * columns)
+                variance += rows * (block_std_dev**2 * columns)
+
+        if operation == 'avg':
+            mean /= count
+            variance /= count**2
+
+        return mean, np.sqrt(variance)
+
     def diagonalize_filter(self, new_filter):
         """Diagonalize the tally data array along a new axis of filter bins.
 
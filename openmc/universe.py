@@ -1,7 +1,9 @@
 from __future__ import division
+from bisect import bisect_left
 from collections import OrderedDict, Iterable
-from copy import copy, deepcopy
+from copy import copy
 from numbers import Integral, Real
+import multiprocessing
 import random
 import sys
 
@@ -11,10 +13,180 @@ import numpy as np
 import openmc
 import openmc.checkvalue as cv
 from openmc.plots import _SVG_COLORS
-from openmc.mixin import IDManagerMixin
+from openmc.mixin import IDManagerMixin, ChangeNotifierMixin, _Dependent
 
 
-class Universe(IDManagerMixin):
+# Number of pixels located at once when plotting a universe
+_PLOT_TILE_SIZE = 128*128
+
+# Geometry used to locate pixels in plotting worker processes
+_plot_geometry = None
+
+
+def _init_plot_worker(universe):
+    global _plot_geometry
+    _plot_geometry = openmc.Geometry(universe)
+
+
+def _find_tile(points):
+    return _plot_geometry.find_many(points)[:2]
+
+
+# Minimum number of cells in a universe for point location to use a grid
+_CELL_GRID_MIN_CELLS = 32
+
+
+def _subset_path(path, mask):
+    # Restrict lattice element positions on a path to a subset of the points
+    return [(obj, element[mask]) if isinstance(element, np.ndarray)
+            else (obj, element) for obj, element in path]
+
+
+class _CellGrid(object):
+    """Uniform grid over the bounding boxes of the cells in a universe, used to
+    find the cells which may contain a point.
+
+    Each grid bin lists the cells whose bounding boxes overlap it, in the
+    order the cells appear in the universe. Points outside of the grid are
+    assigned to the nearest bin, which is always a superset of the cells that
+    can contain them since only cells unbounded in that direction extend past
+    the grid.
+
+    Parameters
+    ----------
+    cells : list of openmc.Cell
+        Cells of the universe
+
+    Attributes
+    ----------
+    cells : list of openmc.Cell
+        Cells of the universe
+    everywhere : list of int
+        Positions of the cells which overlap every bin of the grid
+    dependent : openmc.mixin._Dependent
+        Flag cleared when the region of any of the cells or a coefficient of
+        their surfaces changes
+
+    """
+
+    def __init__(self, cells):
+        self.cells = cells
+        self.dependent = _Dependent(('region', 'position'))
+        for cell in cells:
+            cell._add_dependent(self.dependent)
+            if cell.region is not None:
+                cell.region._add_dependent_to_nodes(self.dependent)
+
+        n = len(cells)
+        lower = np.empty((n, 3))
+        upper = np.empty((n, 3))
+        for i, cell in enumerate(cells):
+            if cell.region is None:
+                lower[i] = -np.inf
+                upper[i] = np.inf
+            else:
+                lower[i], upper[i] = cell.region.bounding_box
+
+        # Only directions in which some bounding box is finite are divided
+        # into bins. The number of bins is chosen to be about the number of
+        # cells.
+        self._lower_left = np.zeros(3)
+        self._width = np.ones(3)
+        self._shape = np.ones(3, dtype=int)
+        bounds = np.vstack((lower, upper))
+        finite = [bounds[np.isfinite(bounds[:, d]), d] for d in range(3)]
+        dims = [d for d in range(3)
+                if finite[d].size > 0 and finite[d].max() > finite[d].min()]
+        if dims:
+            n_bins = max(1, int(np.ceil(n**(1./len(dims)))))
+            for d in dims:
+                self._lower_left[d] = finite[d].min()
+                self._width[d] = (finite[d].max() - finite[d].min())/n_bins
+                self._shape[d] = n_bins
+
+        # Determine the range of bins overlapped by each cell
+        first = self._bin_indices(lower)
+        last = self._bin_indices(upper)
+
+        self._everywhere = []
+        local = {}
+        for i in range(n):
+            if np.all(first[i] == 0) and np.all(last[i] == self._shape - 1):
+                self._everywhere.append(i)
+                continue
+            for ix in range(first[i, 0], last[i, 0] + 1):
+                for iy in range(first[i, 1], last[i, 1] + 1):
+                    for iz in range(first[i, 2], last[i, 2] + 1):
+                        b = (ix*self._shape[1] + iy)*self._shape[2] + iz
+                        local.setdefault(b, []).append(i)
+
+        self._local = local
+
+        # Merge the cells overlapping each bin with those overlapping all bins
+        self._candidates = {b: sorted(cells_b + self._everywhere)
+                            for b, cells_b in local.items()}
+
+    def _bin_indices(self, points):
+        idx = np.floor((points - self._lower_left)/self._width)
+        idx = np.nan_to_num(np.clip(idx, 0, self._shape - 1))
+        return idx.astype(int)
+
+    def bins(self, points):
+        """Return the grid bins containing points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Index of the bin containing each point
+
+        """
+        idx = self._bin_indices(points)
+        return (idx[:, 0]*self._shape[1] + idx[:, 1])*self._shape[2] + idx[:, 2]
+
+    @property
+    def everywhere(self):
+        return self._everywhere
+
+    def local(self, b):
+        """Return the positions of the cells which overlap a bin but not the
+        whole grid
+
+        Parameters
+        ----------
+        b : int
+            Index of the bin
+
+        Returns
+        -------
+        list of int
+            Positions of the cells in the universe, in increasing order
+
+        """
+        return self._local.get(b, [])
+
+    def candidates(self, b):
+        """Return the positions of the cells which may contain points in a bin
+
+        Parameters
+        ----------
+        b : int
+            Index of the bin
+
+        Returns
+        -------
+        list of int
+            Positions of the cells in the universe, in increasing order
+
+        """
+        return self._candidates.get(b, self._everywhere)
+
+
+class Universe(IDManagerMixin, ChangeNotifierMixin):
     """A collection of cells that can be repeated.
 
     Parameters
@@ -60,6 +232,12 @@ class Universe(IDManagerMixin):
         # Values - Cells
         self._cells = OrderedDict()
 
+        # Cells and materials found at each pixel of the last plot
+        self._plot_raster = None
+
+        # Grid of candidate cells for locating points
+        self._cell_grid = None
+
         if cells is not None:
             self.add_cells(cells)
 
@@ -118,6 +296,7 @@ class Universe(IDManagerMixin):
             self._name = name
         else:
             self._name = ''
+        self._changed('name')
 
     @volume.setter
     def volume(self, volume):
@@ -188,7 +367,7 @@ class Universe(IDManagerMixin):
 
         """
         p = np.asarray(point)
-        for cell in self._cells.values():
+        for cell in self._candidate_cells(p):
             if p in cell:
                 if cell.fill_type in ('material', 'distribmat', 'void'):
                     return [self, cell]
@@ -202,9 +381,186 @@ class Universe(IDManagerMixin):
                     return [self, cell] + cell.fill.find(p)
         return []
 
+    def _find_many(self, points, indices, path, found):
+        """Find the cells which contain many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+        indices : numpy.ndarray
+            Positions of the points in the array originally passed to
+            :meth:`Geometry.find_many`
+        path : list of tuple
+            Levels traversed to reach this universe. Each level is given as a
+            (universe, cell) pair or as a (lattice, element) pair where element
+            is an array with the position of each point's lattice element in
+            the order lattice elements are visited when determining paths.
+        found : list of tuple
+            Groups of points located as far as possible, given as (cell,
+            indices, path) tuples. New groups are appended to it.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point was found in a cell
+
+        """
+        cells = list(self._cells.values())
+        owner = self._find_cells(points)
+
+        # Group the points by the cell containing them
+        order = np.argsort(owner, kind='mergesort')
+        groups = np.split(order, np.flatnonzero(np.diff(owner[order])) + 1)
+        for group in groups:
+            if len(group) == 0 or owner[group[0]] < 0:
+                continue
+            cell = cells[owner[group[0]]]
+            cell_path = _subset_path(path, group) + [(self, cell)]
+
+            if cell.fill_type in ('material', 'distribmat', 'void'):
+                found.append((cell, indices[group], cell_path))
+                continue
+            elif cell.fill_type == 'universe':
+                p = points[group]
+                if cell.translation is not None:
+                    p = p - cell.translation
+                if cell.rotation is not None:
+                    p = p.dot(cell.rotation_matrix.T)
+                located = cell.fill._find_many(p, indices[group], cell_path,
+                                               found)
+            else:
+                located = cell.fill._find_many(points[group], indices[group],
+                                               cell_path, found)
+
+            # As with Universe.find, points not found within the fill are
+            # only located as far as this cell
+            if not located.all():
+                found.append((cell, indices[group][~located],
+                              _subset_path(cell_path, ~located)))
+
+        return owner >= 0
+
+    def _find_cells(self, points):
+        """Find which cell of the universe contains each of many points
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Position of the first cell containing each point among the cells
+            of the universe, or -1 if no cell contains the point
+
+        """
+        cells = list(self._cells.values())
+        owner = np.full(len(points), -1, dtype=int)
+
+        grid = self._get_cell_grid()
+        if grid is None:
+            # Surface equations evaluated at the points, shared between cells
+            values = {}
+
+            remaining = np.ones(len(points), dtype=bool)
+            for i, cell in enumerate(cells):
+                if not remaining.any():
+                    break
+                hit = remaining & cell._contains_many(points, values)
+                owner[hit] = i
+                remaining &= ~hit
+            return owner
+
+        # Group the points by grid bin
+        bins = grid.bins(points)
+        order = np.argsort(bins, kind='mergesort')
+        groups = [(group, grid.local(bins[group[0]])) for group in
+                  np.split(order, np.flatnonzero(np.diff(bins[order])) + 1)
+                  if len(group) > 0]
+
+        remaining = np.ones(len(points), dtype=bool)
+        start = 0
+        for stop in grid.everywhere + [len(cells)]:
+            # Test the points in each bin against the cells preceding the next
+            # cell which overlaps every bin and whose bounding boxes overlap
+            # the bin
+            for group, local in groups:
+                candidates = local[bisect_left(local, start):
+                                   bisect_left(local, stop)]
+                if not candidates:
+                    continue
+                group = group[remaining[group]]
+                p = points[group]
+                values = {}
+                for i in candidates:
+                    if len(group) == 0:
+                        break
+                    hit = cells[i]._contains_many(p, values)
+                    owner[group[hit]] = i
+                    remaining[group[hit]] = False
+                    group = group[~hit]
+                    p = p[~hit]
+                    values = {key: v[~hit] for key, v in values.items()}
+
+            # Test all remaining points at once against a cell which overlaps
+            # every bin
+            if stop < len(cells):
+                group = np.flatnonzero(remaining)
+                hit = cells[stop]._contains_many(points[group], {})
+                owner[group[hit]] = stop
+                remaining[group[hit]] = False
+            start = stop + 1
+
+        return owner
+
+    def _candidate_cells(self, point):
+        """Return the cells which may contain a point, in order
+
+        Parameters
+        ----------
+        point : numpy.ndarray
+            Cartesian coordinates of the point
+
+        Returns
+        -------
+        Iterable of openmc.Cell
+            Cells of the universe whose bounding boxes contain the point
+
+        """
+        grid = self._get_cell_grid()
+        if grid is None:
+            return self._cells.values()
+        else:
+            b = grid.bins(np.asarray(point, dtype=float).reshape(1, 3))[0]
+            return [grid.cells[i] for i in grid.candidates(b)]
+
+    def _get_cell_grid(self):
+        """Return the grid of candidate cells, building it if necessary
+
+        The grid is only used for universes with many cells. It is rebuilt
+        after cells are added to or removed from the universe, or after the
+        region of any of its cells or a coefficient of their surfaces is
+        changed.
+
+        Returns
+        -------
+        _CellGrid or None
+            Grid over the cells of the universe, or None if the cells should
+            simply be tested in turn
+
+        """
+        if len(self._cells) < _CELL_GRID_MIN_CELLS:
+            return None
+        grid = self._cell_grid
+        if grid is None or not grid.dependent.valid:
+            self._cell_grid = _CellGrid(list(self._cells.values()))
+        return self._cell_grid
+
     def plot(self, origin=(0., 0., 0.), width=(1., 1.), pixels=(200, 200),
              basis='xy', color_by='cell', colors=None, filename=None, seed=None,
-             **kwargs):
+             processes=1, cache=False, **kwargs):
         """Display a slice plot of the universe.
 
         Parameters
@@ -238,6 +594,14 @@ class Universe(IDManagerMixin):
             Hashable object which is used to seed the random number generator
             used to select colors. If None, the generator is seeded from the
             current time.
+        processes : int or None
+            Number of processes used to locate cells in tiles of the image. If
+            None, the number of CPUs is used. Defaults to 1.
+        cache : bool
+            Whether to reuse the cells and materials found at each pixel by the
+            last plot of the universe if it had the same origin, width, pixels,
+            and basis, e.g. to change `color_by` or `colors`. The geometry is
+            not checked for changes since the last plot. Defaults to False.
         **kwargs
             All keyword arguments are passed to
             :func:`matplotlib.pyplot.imshow`.
@@ -290,33 +654,51 @@ class Universe(IDManagerMixin):
         y_coords = np.linspace(y_max, y_min, pixels[1], endpoint=False) - \
                    0.5*(y_max - y_min)/pixels[1]
 
-        # Initialize output image in RGBA format.  Flip the pixels from
+        # Determine the cells and materials at each pixel, reusing the raster
+        # from the last plot of the same slice if requested
+        key = (tuple(origin), tuple(width), tuple(pixels), basis)
+        if (not cache or self._plot_raster is None or
+                self._plot_raster[0] != key):
+            if basis == 'xy':
+                x, y = np.meshgrid(x_coords, y_coords)
+                z = np.full(x.shape, origin[2])
+            elif basis == 'yz':
+                y, z = np.meshgrid(x_coords, y_coords)
+                x = np.full(y.shape, origin[0])
+            elif basis == 'xz':
+                x, z = np.meshgrid(x_coords, y_coords)
+                y = np.full(x.shape, origin[1])
+            points = np.column_stack((x.ravel(), y.ravel(), z.ravel()))
+            cell_ids, material_ids = self._rasterize(points, processes)
+            self._plot_raster = (key, cell_ids.reshape(pixels[1], pixels[0]),
+                                 material_ids.reshape(pixels[1], pixels[0]))
+
+        if color_by == 'cell':
+            raster = self._plot_raster[1]
+            objects = self.get_all_cells()
+        elif color_by == 'material':
+            raster = self._plot_raster[2]
+            objects = self.get_all_materials()
+
+        # Assign colors in the order in which objects are first encountered
+        # scanning the image column by column so that seeded colors do not
+        # depend on how the pixels were located
+        ids, first, inverse = np.unique(raster.T.ravel(), return_index=True,
+                                        return_inverse=True)
+        lookup = np.zeros((len(ids), 4))
+        for k in np.argsort(first):
+            if ids[k] < 0:
+                continue
+            obj = objects[ids[k]]
+            if obj not in colors:
+                colors[obj] = (random.random(), random.random(),
+                               random.random(), 1.0)
+            lookup[k] = colors[obj]
+
+        # Create output image in RGBA format.  Flip the pixels from
         # traditional (x, y) to (y, x) used in graphics.
-        img = np.zeros((pixels[1], pixels[0], 4))
-        for i, x in enumerate(x_coords):
-            for j, y in enumerate(y_coords):
-                if basis == 'xy':
-                    path = self.find((x, y, origin[2]))
-                elif basis == 'yz':
-                    path = self.find((origin[0], x, y))
-                elif basis == 'xz':
-                    path = self.find((x, origin[1], y))
-
-                if len(path) > 0:
-                    try:
-                        if color_by == 'cell':
-                            obj = path[-1]
-                        elif color_by == 'material':
-                            if path[-1].fill_type == 'material':
-                                obj = path[-1].fill
-                            else:
-                                continue
-                    except AttributeError:
-                        continue
-                    if obj not in colors:
-                        colors[obj] = (random.random(), random.random(),
-                                       random.random(), 1.0)
-                    img[j, i, :] = colors[obj]
+        img = lookup[inverse].reshape(pixels[0], pixels[1], 4)
+        img = img.transpose(1, 0, 2)
 
         # Display image
         plt.imshow(img, extent=(x_min, x_max, y_min, y_max),
@@ -328,6 +710,45 @@ class Universe(IDManagerMixin):
         else:
             plt.savefig(filename)
 
+    def _rasterize(self, points, processes=1):
+        """Find the cells and materials at many points, in tiles which are
+        optionally processed in parallel
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of the points with shape (N, 3)
+        processes : int or None
+            Number of processes to use. If None, the number of CPUs is used.
+
+        Returns
+        -------
+        cell_ids : numpy.ndarray
+            IDs of the cells containing each point, or -1 if no cell was found
+        material_ids : numpy.ndarray
+            IDs of the materials at each point, or -1 if there is no material
+
+        """
+        tiles = [points[i:i + _PLOT_TILE_SIZE]
+                 for i in range(0, len(points), _PLOT_TILE_SIZE)]
+
+        if processes == 1 or len(tiles) <= 1:
+            geometry = openmc.Geometry(self)
+            results = [geometry.find_many(tile)[:2] for tile in tiles]
+        else:
+            pool = multiprocessing.Pool(processes, _init_plot_worker, (self,))
+            try:
+                results = pool.map(_find_tile, tiles)
+            finally:
+                pool.close()
+                pool.join()
+
+        if not results:
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        cell_ids = np.concatenate([r[0] for r in results])
+        material_ids = np.concatenate([r[1] for r in results])
+        return cell_ids, material_ids
+
     def add_cell(self, cell):
         """Add a cell to the universe.
 
@@ -347,6 +768,9 @@ class Universe(IDManagerMixin):
 
         if cell_id not in self._cells:
             self._cells[cell_id] = cell
+            self._plot_raster = None
+            self._cell_grid = None
+            self._changed('content')
 
     def add_cells(self, cells):
         """Add multiple cells to the universe.
@@ -384,11 +808,17 @@ class Universe(IDManagerMixin):
         # If the Cell is in the Universe's list of Cells, delete it
         if cell.id in self._cells:
             del self._cells[cell.id]
+            self._plot_raster = None
+            self._cell_grid = None
+            self._changed('content')
 
     def clear_cells(self):
         """Remove all cells from the universe."""
 
         self._cells.clear()
+        self._plot_raster = None
+        self._cell_grid = None
+        self._changed('content')
 
     def get_nuclides(self):
         """Returns all nuclides in the universe
@@ -496,12 +926,70 @@ class Universe(IDManagerMixin):
 
         return universes
 
-    def clone(self, memo=None):
+    def _add_dependent_to_tree(self, dependent, visited=None):
+        """Subscribe a dependent to the changes of this universe and of every
+        cell, material, universe, and lattice contained within it
+
+        Parameters
+        ----------
+        dependent : openmc.mixin._Dependent
+            Token invalidated by the first change of a kind it depends on
+        visited : set of int or None
+            Identities of the objects already subscribed. This parameter is
+            used internally and should not be specified by the user.
+
+        """
+        if visited is None:
+            visited = set()
+        if id(self) in visited:
+            return
+        visited.add(id(self))
+        self._add_dependent(dependent)
+
+        for cell in self._cells.values():
+            if id(cell) in visited:
+                continue
+            visited.add(id(cell))
+            cell._add_dependent(dependent)
+
+            fill_type = cell.fill_type
+            if fill_type == 'universe':
+                cell._fill._add_dependent_to_tree(dependent, visited)
+            elif fill_type == 'lattice':
+                lattice = cell._fill
+                if id(lattice) in visited:
+                    continue
+                visited.add(id(lattice))
+                lattice._add_dependent(dependent)
+                universes = list(lattice.get_unique_universes().values())
+                if lattice.outer is not None:
+                    universes.append(lattice.outer)
+                for u in universes:
+                    u._add_dependent_to_tree(dependent, visited)
+            elif fill_type in ('material', 'distribmat'):
+                if fill_type == 'material':
+                    materials = [cell._fill]
+                else:
+                    materials = cell._fill
+                for mat in materials:
+                    if mat is not None and id(mat) not in visited:
+                        visited.add(id(mat))
+                        mat._add_dependent(dependent)
+
+    def clone(self, clone_materials=True, clone_regions=True, memo=None):
         """Create a copy of this universe with a new unique ID, and clones
         all cells within this universe.
 
         Parameters
         ----------
+        clone_materials : bool
+            Whether to create separate copies of the materials filling cells
+            contained in this universe. If False, the clone shares the
+            materials of this universe.
+        clone_regions : bool
+            Whether to create separate copies of the regions bounding cells
+            contained in this universe. If False, the clone shares the regions
+            and their surfaces with this universe.
         memo : dict or None
             A nested dictionary of previously cloned objects. This parameter
             is used internally and should not be specified by the user.
@@ -517,19 +1005,23 @@ class Universe(IDManagerMixin):
             memo = {}
 
         # If no nemoize'd clone exists, instantiate one
-        if self not in memo:
-            clone = deepcopy(self)
+        if id(self) not in memo:
+            clone = copy(self)
             clone.id = None
+            clone._atoms = copy(self._atoms)
+            clone._plot_raster = None
+            clone._cell_grid = None
 
             # Clone all cells for the universe clone
             clone._cells = OrderedDict()
             for cell in self._cells.values():
-                clone.add_cell(cell.clone(memo))
+                clone.add_cell(cell.clone(clone_materials, clone_regions,
+                                          memo))
 
             # Memoize the clone
-            memo[self] = clone
+            memo[id(self)] = clone
 
-        return memo[self]
+        return memo[id(self)]
 
     def create_xml_subelement(self, xml_element):
         # Iterate over all Cells
@@ -544,45 +1036,3 @@ class Universe(IDManagerMixin):
                 # Append the Universe ID to the subelement and add to Element
                 cell_element.set("universe", str(self._id))
                 xml_element.append(cell_element)
-
-    def _determine_paths(self, path='', instances_only=False):
-        """Count the number of instances for each cell in the universe, and
-        record the count in the :attr:`Cell.num_instances` properties."""
-
-        univ_path = path + 'u{}'.format(self.id)
-
-        for cell in self.cells.values():
-            cell_path = '{}->c{}'.format(univ_path, cell.id)
-
-            # If universe-filled, recursively count cells in filling universe
-            if cell.fill_type == 'universe':
-                cell.fill._determine_paths(cell_path + '->', instances_only)
-
-            # If lattice-filled, recursively call for all universes in lattice
-            elif cell.fill_type == 'lattice':
-                latt = cell.fill
-
-                # Count instances in each universe in the lattice
-                for index in latt._natural_indices:
-                    latt_path = '{}->l{}({})->'.format(
-                        cell_path, latt.id, ",".join(str(x) for x in index))
-                    univ = latt.get_universe(index)
-                    univ._determine_paths(latt_path, instances_only)
-
-            else:
-                if cell.fill_type == 'material':
-                    mat = cell.fill
-                elif cell.fill_type == 'distribmat':
-                    mat = cell.fill[cell._num_instances]
-                else:
-                    mat = None
-
-                if mat is not None:
-                    mat._num_instances += 1
-                    if not instances_only:
-                        mat._paths.append('{}->m{}'.format(cell_path, mat.id))
-
-            # Append current path
-            cell._num_instances += 1
-            if not instances_only:
-                cell._paths.append(cell_path)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import itertools
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+
+
+def check_bin_indices(filter_, filter_bins):
+    """Make sure a filter resolves many bins like it resolves single bins."""
+    expected = [filter_.get_bin_index(b) for b in filter_bins]
+    assert np.array_equal(filter_.get_bin_indices(filter_bins), expected)
+    assert np.array_equal(filter_.get_bin_indices(np.array(filter_bins)),
+                          expected)
+
+
+def filter_indices(tally, filters, filter_bins):
+    """Return the filter indices of a tally computed one bin at a time."""
+    indices = []
+    for f in tally.filters:
+        if type(f) in filters:
+            bins = filter_bins[filters.index(type(f))]
+            indices.append([f.get_bin_index(b) for b in bins])
+        else:
+            indices.append(range(f.num_bins))
+
+    strides = [int(np.prod([f.num_bins for f in tally.filters[i + 1:]]))
+               for i in range(len(tally.filters))]
+    return [sum(i*s for i, s in zip(idx, strides))
+            for idx in itertools.product(*indices)]
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # Filter.get_bin_indices() and Tally.get_filter_indices() find the same
+    # indices as Filter.get_bin_index() for each requested bin.
+
+    mesh = openmc.Mesh()
+    mesh.dimension = [3, 4, 2]
+    mesh.lower_left = [0., 0., 0.]
+    mesh.upper_right = [3., 4., 2.]
+    mesh_filter = openmc.MeshFilter(mesh)
+    mesh_filter.num_bins = 24
+    energy_filter = openmc.EnergyFilter([0., 0.625, 1.e3, 20.e6])
+    cell_filter = openmc.CellFilter([30, 10, 20])
+    distribcell_filter = openmc.DistribcellFilter(10)
+    distribcell_filter.num_bins = 5
+
+    # Mesh bins are converted back and forth between indices and (x,y,z)
+    # cells
+    mesh_bins = [mesh_filter.get_bin(i) for i in range(mesh_filter.num_bins)]
+    assert [mesh_filter.get_bin_index(b) for b in mesh_bins] == \
+        list(range(mesh_filter.num_bins))
+
+    rng = np.random.RandomState(1)
+    mesh_bins = [mesh_bins[i] for i in rng.permutation(len(mesh_bins))]
+    check_bin_indices(mesh_filter, mesh_bins)
+
+    # Energy bins are found within a relative tolerance
+    energy_bins = [(1.e3, 20.e6), (0., 0.625*(1. + 1.e-6)), (0.625, 1.e3)]
+    check_bin_indices(energy_filter, energy_bins)
+    check_bin_indices(cell_filter, [20, 30, 10, 20])
+    check_bin_indices(distribcell_filter, [4, 0, 2])
+
+    try:
+        cell_filter.get_bin_indices([10, 40])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Missing cell filter bin was not rejected')
+    try:
+        mesh_filter.get_bin_indices([(1, 1, 1), (4, 1, 1)])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Mesh cell outside of mesh was not rejected')
+
+    # Tally filter indices combine the bins of all filters
+    tally = openmc.Tally()
+    tally.filters = [cell_filter, mesh_filter, energy_filter,
+                     distribcell_filter]
+    requests = [
+        ([], []),
+        ([openmc.MeshFilter], [tuple(mesh_bins[:5])]),
+        ([openmc.EnergyFilter, openmc.CellFilter],
+         [tuple(energy_bins), (20, 10)]),
+        ([openmc.DistribcellFilter, openmc.MeshFilter],
+         [(3, 1), tuple(mesh_bins[::3])]),
+        ([openmc.CellFilter, openmc.MeshFilter, openmc.EnergyFilter,
+          openmc.DistribcellFilter],
+         [(10,), tuple(mesh_bins[7:9]), ((0.625, 1.e3),), (2,)])]
+    for filters, filter_bins in requests:
+        indices = tally.get_filter_indices(filters, filter_bins)
+        if filters:
+            expected = filter_indices(tally, filters, filter_bins)
+        else:
+            expected = list(range(tally.num_filter_bins))
+        assert np.array_equal(indices, expected)
+
+    # Bins may also be given as arrays
+    indices = tally.get_filter_indices([openmc.MeshFilter],
+                                       [np.array(mesh_bins[:5])])
+    assert np.array_equal(indices, filter_indices(
+        tally, [openmc.MeshFilter], [tuple(mesh_bins[:5])]))
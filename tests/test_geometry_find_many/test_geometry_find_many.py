@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.examples
+
+
+def find_one(geometry, point):
+    """Find the cell, material and instance at a point with Geometry.find()."""
+    path = geometry.find(point)
+    if not path:
+        return -1, -1, -1
+
+    # Build the path string for the cell reached and look up its instance
+    tokens = []
+    in_outer = False
+    for obj in path:
+        if isinstance(obj, openmc.Universe):
+            tokens.append('u{}'.format(obj.id))
+        elif isinstance(obj, openmc.Cell):
+            tokens.append('c{}'.format(obj.id))
+        else:
+            lattice, idx = obj
+            in_outer |= not lattice.is_valid_index(idx)
+            # Paths through 2-D hexagonal lattices only give (x,alpha)
+            if isinstance(lattice, openmc.HexLattice) and \
+                    lattice.num_axial is None:
+                idx = idx[:2]
+            tokens.append('l{}({})'.format(
+                lattice.id, ','.join(str(int(x)) for x in idx)))
+    cell = [obj for obj in path if isinstance(obj, openmc.Cell)][-1]
+    instance = -1 if in_outer else geometry.get_instances('->'.join(tokens))
+
+    if cell.fill_type == 'material':
+        material = cell.fill.id
+    elif cell.fill_type == 'distribmat':
+        fill = cell.fill[instance]
+        material = -1 if fill is None else fill.id
+    else:
+        material = -1
+    return cell.id, material, instance
+
+
+def check_find_many(geometry, points):
+    """Make sure Geometry.find_many() agrees with Geometry.find()."""
+    cells, materials, instances = geometry.find_many(points)
+    expected = np.array([find_one(geometry, p) for p in points])
+    assert np.array_equal(cells, expected[:, 0])
+    assert np.array_equal(materials, expected[:, 1])
+    assert np.array_equal(instances, expected[:, 2])
+
+
+def hex_geometry():
+    """Return a hexagonal lattice of pins with distributed fuel materials and
+    an outer universe"""
+    fuel = openmc.Material(name='fuel')
+    fuel.add_nuclide('U235', 1.)
+    water = openmc.Material(name='water')
+    water.add_nuclide('H1', 2.)
+    water.add_nuclide('O16', 1.)
+
+    pin_surface = openmc.ZCylinder(R=0.4)
+    fuel_cell = openmc.Cell(region=-pin_surface)
+    water_cell = openmc.Cell(fill=water, region=+pin_surface)
+    pin = openmc.Universe(cells=[fuel_cell, water_cell])
+    outer_cell = openmc.Cell(fill=water)
+    outer = openmc.Universe(cells=[outer_cell])
+
+    lattice = openmc.HexLattice()
+    lattice.center = (0., 0.)
+    lattice.pitch = (1.,)
+    lattice.universes = [[pin]*6, [pin]]
+    lattice.outer = outer
+
+    fuel_cell.fill = [fuel.clone() for _ in range(7)]
+    fuel_cell.fill[3] = None
+
+    boundary = openmc.ZCylinder(R=2.5, boundary_type='vacuum')
+    root_cell = openmc.Cell(fill=lattice, region=-boundary)
+    return openmc.Geometry(openmc.Universe(cells=[root_cell]))
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # Geometry.find_many() finds the same cells, materials and cell instances
+    # as Geometry.find() and Geometry.get_instances() for each point.
+
+    rng = np.random.RandomState(1)
+
+    geometry = openmc.examples.pwr_pin_cell().geometry
+    points = rng.uniform(-0.7, 0.7, (200, 3))
+    points[:, 2] = 0.
+    check_find_many(geometry, points)
+
+    # Points outside of the geometry are given -1
+    cells, materials, instances = geometry.find_many([(5., 5., 0.)])
+    assert cells[0] == materials[0] == instances[0] == -1
+
+    geometry = openmc.examples.pwr_assembly().geometry
+    points = rng.uniform(-11., 11., (500, 3))
+    check_find_many(geometry, points)
+
+    geometry = openmc.examples.pwr_core().geometry
+    points = rng.uniform(-200., 200., (300, 3))
+    check_find_many(geometry, points)
+
+    # Points in the outer universe of the lattice have no instance, and
+    # distributed materials are found by instance
+    geometry = hex_geometry()
+    points = rng.uniform(-2.5, 2.5, (300, 3))
+    check_find_many(geometry, points)
+    _, _, instances = geometry.find_many(points)
+    assert np.any(instances == -1) and np.any(instances > 0)
+
+    # A single point gives arrays of length one
+    cells, _, _ = geometry.find_many((0., 0., 0.))
+    assert cells.shape == (1,)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+import os
+import re
+import sys
+import itertools
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.examples
+
+
+def name_matches(query, name, case_sensitive, matching, regex):
+    """Determine whether a name matches a query by checking it directly."""
+    if regex:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        if matching:
+            return re.fullmatch(query, name, flags) is not None
+        return re.search(query, name, flags) is not None
+    if not case_sensitive:
+        query, name = query.lower(), name.lower()
+    return query == name if matching else query in name
+
+
+def check_query(geometry, query, case_sensitive, matching, regex):
+    """Make sure every search by name finds the objects matching directly."""
+    args = (query, case_sensitive, matching, regex)
+
+    def expected(objects, names=lambda x: [x.name]):
+        return sorted((x for x in objects
+                       if any(name_matches(query, n, case_sensitive,
+                                           matching, regex)
+                              for n in names(x))), key=lambda x: x.id)
+
+    def fill_names(cell):
+        if cell.fill_type in ('material', 'universe', 'lattice'):
+            return [cell.fill.name]
+        elif cell.fill_type == 'distribmat':
+            return [m.name for m in cell.fill if m is not None]
+        return []
+
+    cells = geometry.get_all_cells().values()
+    assert geometry.get_materials_by_name(*args) == \
+        expected(geometry.get_all_materials().values())
+    assert geometry.get_cells_by_name(*args) == expected(cells)
+    assert geometry.get_cells_by_fill_name(*args) == \
+        expected(cells, fill_names)
+    assert geometry.get_universes_by_name(*args) == \
+        expected(geometry.get_all_universes().values())
+    assert geometry.get_lattices_by_name(*args) == \
+        expected(geometry.get_all_lattices().values())
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # searching a geometry by name finds the same objects as matching each
+    # name directly, including for regular expressions whose literal prefix
+    # is used to narrow the search.
+
+    geometry = openmc.examples.pwr_assembly().geometry
+    queries = ['Fuel', 'fuel', 'Water', 'clad', 'Fuel Pin', 'pin', '', 'zzz']
+    regex_queries = [
+        '^Fuel', '^fuel', '^Fu?el', '^Fuel.*Pin$', 'Fuel|Water', '^F|^W',
+        '^(Fuel|Guide)', '^[FG]', '^Fuel\\s', '^Fu+el', '^Fuelx*', '^Fuel{1}',
+        '^Fuel Pin$', 'e.', '^.*$', '^$', '^zzz', '[Cc]lad', 'Pin\\b',
+        '^Guide Tube']
+    options = list(itertools.product([False, True], repeat=2))
+    for case_sensitive, matching in options:
+        for query in queries:
+            check_query(geometry, query, case_sensitive, matching, False)
+        for query in regex_queries:
+            check_query(geometry, query, case_sensitive, matching, True)
+
+    # The index follows changes to names
+    material = geometry.get_materials_by_name('Fuel')[0]
+    material.name = 'Renamed fuel'
+    assert material in geometry.get_materials_by_name('^Renamed', regex=True)
+    assert material not in geometry.get_materials_by_name('^Fuel', regex=True)
+    for case_sensitive, matching in options:
+        for query in regex_queries + ['^Renamed', '^renamed fuel$']:
+            check_query(geometry, query, case_sensitive, matching, True)
+
+    # The index also follows changes to the CSG tree
+    cell = openmc.Cell(name='Fuel plenum')
+    cell.fill = [material, None]
+    geometry.root_universe.add_cell(cell)
+    assert cell in geometry.get_cells_by_fill_name('^renamed', regex=True)
+    assert cell in geometry.get_cells_by_name('^Fuel p', regex=True)
+    for case_sensitive, matching in options:
+        for query in regex_queries + ['^Renamed', 'plenum$']:
+            check_query(geometry, query, case_sensitive, matching, True)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.examples
+
+
+def reference_paths(universe, path, cell_paths, material_paths):
+    """Record the path to every cell and material instance by traversing the
+    entire CSG tree."""
+    univ_path = path + 'u{}'.format(universe.id)
+    for cell in universe.cells.values():
+        cell_path = '{}->c{}'.format(univ_path, cell.id)
+        if cell.fill_type == 'universe':
+            reference_paths(cell.fill, cell_path + '->', cell_paths,
+                            material_paths)
+        elif cell.fill_type == 'lattice':
+            latt = cell.fill
+            for index in latt._natural_indices:
+                latt_path = '{}->l{}({})->'.format(
+                    cell_path, latt.id, ','.join(str(x) for x in index))
+                reference_paths(latt.get_universe(index), latt_path,
+                                cell_paths, material_paths)
+        else:
+            if cell.fill_type == 'material':
+                mat = cell.fill
+            elif cell.fill_type == 'distribmat':
+                mat = cell.fill[len(cell_paths.get(cell.id, []))]
+            else:
+                mat = None
+            if mat is not None:
+                material_paths.setdefault(mat.id, []).append(
+                    '{}->m{}'.format(cell_path, mat.id))
+        cell_paths.setdefault(cell.id, []).append(cell_path)
+
+
+def check_paths(geometry):
+    """Make sure the generated paths and instance numbers match those found by
+    traversing the CSG tree."""
+    cell_paths = {}
+    material_paths = {}
+    reference_paths(geometry.root_universe, '', cell_paths, material_paths)
+
+    geometry.determine_paths()
+    objects = list(geometry.get_all_cells().values()) + \
+        list(geometry.get_all_materials().values())
+    rng = np.random.RandomState(1)
+    for obj in objects:
+        if isinstance(obj, openmc.Cell):
+            expected = cell_paths.get(obj.id, [])
+        else:
+            expected = material_paths.get(obj.id, [])
+        paths = obj.paths
+        assert obj.num_instances == len(paths) == len(expected)
+        assert list(paths) == expected
+        assert paths == expected
+        if not expected:
+            continue
+
+        # Paths are generated individually and mapped back to instances
+        sample = rng.randint(len(expected), size=min(len(expected), 20))
+        assert [paths[i] for i in sample] == [expected[i] for i in sample]
+        assert paths[-1] == expected[-1]
+        assert paths[1::3] == expected[1::3]
+        assert [paths.index(expected[i]) for i in sample] == list(sample)
+        assert geometry.get_instances([expected[i] for i in sample]) == \
+            list(sample)
+        assert expected[0] in paths
+
+    # Paths which do not exist in the geometry are not found
+    root = geometry.root_universe
+    bad_paths = ['u{}->c{}'.format(root.id, max(cell_paths) + 1),
+                 'u{}'.format(root.id + 1), '']
+    assert geometry.get_instances(bad_paths) == [None]*len(bad_paths)
+    assert bad_paths[0] not in objects[0].paths
+
+
+def hex_geometry():
+    """Return a hexagonal lattice of pins with distributed fuel materials and
+    an outer universe"""
+    fuel = openmc.Material(name='fuel')
+    fuel.add_nuclide('U235', 1.)
+    water = openmc.Material(name='water')
+    water.add_nuclide('H1', 2.)
+    water.add_nuclide('O16', 1.)
+
+    pin_surface = openmc.ZCylinder(R=0.4)
+    fuel_cell = openmc.Cell(region=-pin_surface)
+    water_cell = openmc.Cell(fill=water, region=+pin_surface)
+    pin = openmc.Universe(cells=[fuel_cell, water_cell])
+    water_pin = openmc.Universe(cells=[openmc.Cell(fill=water)])
+
+    lattice = openmc.HexLattice()
+    lattice.center = (0., 0., 0.)
+    lattice.pitch = (1., 1.)
+    lattice.universes = [[[pin, water_pin]*3, [pin]],
+                         [[water_pin, pin]*3, [water_pin]]]
+    lattice.outer = water_pin
+
+    # The fuel cell appears in the lattice and outside of it and is filled
+    # with one material per instance, one of which is void
+    fuel_cell.fill = [fuel] + [fuel.clone() for _ in range(6)] + [None]
+
+    boundary = openmc.ZCylinder(R=2.5, boundary_type='vacuum')
+    lattice_cell = openmc.Cell(fill=lattice, region=-boundary)
+    pin_cell = openmc.Cell(fill=pin, region=+boundary)
+    return openmc.Geometry(openmc.Universe(cells=[lattice_cell, pin_cell]))
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure the
+    # paths from Geometry.determine_paths() and instance numbers from
+    # Geometry.get_instances() match those found by visiting every instance.
+
+    check_paths(openmc.examples.pwr_pin_cell().geometry)
+    check_paths(openmc.examples.pwr_assembly().geometry)
+    geometry = hex_geometry()
+    check_paths(geometry)
+
+    # Paths are only counted when only instances are requested
+    geometry.determine_paths(instances_only=True)
+    cell = geometry.root_universe.cells[min(geometry.root_universe.cells)]
+    assert cell.num_instances == 1
+    assert len(cell.paths) == 0
+
+    # Paths can no longer be used once the CSG tree changes
+    geometry.determine_paths()
+    paths = cell.paths
+    assert len(paths) == 1
+    cell.fill.outer = openmc.Universe(cells=[openmc.Cell()])
+    try:
+        paths[0]
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Paths of a modified geometry were used')
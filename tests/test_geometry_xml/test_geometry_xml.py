@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+import os
+import sys
+from io import BytesIO
+from xml.etree import ElementTree as ET
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.examples
+from openmc.clean_xml import sort_xml_elements, clean_xml_indentation
+
+
+def tree_xml(geometry):
+    """Return the geometry XML file built as a whole XML tree."""
+    root_element = ET.Element("geometry")
+    geometry.root_universe.create_xml_subelement(root_element)
+    sort_xml_elements(root_element)
+    clean_xml_indentation(root_element)
+    stream = BytesIO()
+    ET.ElementTree(root_element).write(stream, xml_declaration=True,
+                                       encoding='utf-8', method="xml")
+    return stream.getvalue()
+
+
+def check_xml(geometry):
+    """Make sure the streamed geometry XML file is identical to the one built
+    as a whole XML tree."""
+    geometry.export_to_xml()
+    with open('geometry.xml', 'rb') as fh:
+        streamed = fh.read()
+    os.remove('geometry.xml')
+    assert streamed == tree_xml(geometry)
+
+
+def hex_geometry():
+    """Return a 3-D hexagonal lattice with an outer universe, nested in a
+    translated and rotated universe"""
+    fuel = openmc.Material(name='fuel')
+    fuel.add_nuclide('U235', 1.)
+    water = openmc.Material(name='water')
+    water.add_nuclide('H1', 2.)
+    water.add_nuclide('O16', 1.)
+
+    pin_surface = openmc.ZCylinder(R=0.4)
+    fuel_cell = openmc.Cell(fill=[fuel, fuel.clone(), None],
+                            region=-pin_surface)
+    water_cell = openmc.Cell(fill=water, region=+pin_surface)
+    pin = openmc.Universe(cells=[fuel_cell, water_cell])
+    water_pin = openmc.Universe(cells=[openmc.Cell(fill=water)])
+
+    lattice = openmc.HexLattice()
+    lattice.center = (0., 0., 0.)
+    lattice.pitch = (1., 1.)
+    lattice.universes = [[[pin, water_pin]*3, [pin]],
+                         [[water_pin, pin]*3, [water_pin]]]
+    lattice.outer = water_pin
+
+    boundary = openmc.ZCylinder(R=2.5)
+    lattice_cell = openmc.Cell(fill=lattice, region=-boundary)
+    assembly = openmc.Universe(cells=[lattice_cell])
+
+    x0 = openmc.XPlane(x0=-3., boundary_type='reflective')
+    x1 = openmc.XPlane(x0=3., boundary_type='vacuum')
+    root_cell = openmc.Cell(fill=assembly, region=+x0 & -x1)
+    root_cell.translation = (0.5, 0., 0.)
+    root_cell.rotation = (0., 0., 30.)
+    outside = openmc.Cell(fill=water, region=~(+x0 & -x1) | ~+pin_surface)
+    return openmc.Geometry(openmc.Universe(cells=[root_cell, outside]))
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # Geometry.export_to_xml(), which writes one element at a time, gives the
+    # same bytes as building the whole XML tree.
+
+    check_xml(openmc.examples.pwr_pin_cell().geometry)
+    check_xml(openmc.examples.pwr_assembly().geometry)
+    check_xml(openmc.examples.pwr_core().geometry)
+    check_xml(openmc.examples.slab_mg().geometry)
+    check_xml(hex_geometry())
+
+    # Only the first of several cells sharing an ID is written
+    geometry = hex_geometry()
+    duplicate = openmc.Cell(geometry.root_universe.cells[
+        min(geometry.root_universe.cells)].id)
+    universe = openmc.Universe(cells=[duplicate])
+    geometry.root_universe.add_cell(openmc.Cell(fill=universe))
+    check_xml(geometry)
+
+    # A root universe without cells gives an empty geometry element
+    check_xml(openmc.Geometry(openmc.Universe()))
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+
+
+def check_find_elements(lattice, points):
+    """Make sure the vectorized lookup agrees with the lookup of single
+    points."""
+    idx, local = lattice.find_elements(points)
+    assert idx.shape == (len(points), 3)
+    assert local.shape == (len(points), 3)
+    for point, i, p in zip(points, idx, local):
+        i_single, p_single = lattice.find_element(point)
+        assert tuple(i) == tuple(i_single)
+        assert np.allclose(p, p_single)
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # Lattice.find_elements() matches Lattice.find_element() for 2-D and 3-D
+    # rectangular and hexagonal lattices.
+
+    u = openmc.Universe(cells=[openmc.Cell()])
+    points = np.random.RandomState(1).uniform(-3., 3., (200, 3))
+
+    rect = openmc.RectLattice()
+    rect.lower_left = (-3., -3., -3.)
+    rect.pitch = (1.5, 2., 3.)
+    rect.universes = [[[u]*4]*3]*2
+    check_find_elements(rect, points)
+
+    rect = openmc.RectLattice()
+    rect.lower_left = (-3., -3.)
+    rect.pitch = (1.5, 2.)
+    rect.universes = [[u]*4]*3
+    idx, local = rect.find_elements(points)
+    assert idx.shape == (len(points), 2)
+    for point, i, p in zip(points, idx, local):
+        i_single, p_single = rect.find_element(point)
+        assert tuple(i) == tuple(i_single)
+        assert np.allclose(p, p_single)
+
+    rings = [[u]*12, [u]*6, [u]]
+
+    hexagonal = openmc.HexLattice()
+    hexagonal.center = (0., 0.)
+    hexagonal.pitch = (1.25,)
+    hexagonal.universes = rings
+    check_find_elements(hexagonal, points)
+
+    hexagonal = openmc.HexLattice()
+    hexagonal.center = (0., 0., 0.)
+    hexagonal.pitch = (1.25, 2.)
+    hexagonal.universes = [rings]*3
+    check_find_elements(hexagonal, points)
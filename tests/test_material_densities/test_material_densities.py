@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.data
+
+
+def densities(material):
+    """Return the atom density of each nuclide in a material."""
+    return [(nuc.name, density) for nuc, density
+            in material.get_nuclide_atom_densities().values()]
+
+
+def check_densities(material):
+    """Make sure the atom densities of a material are the same as those of a
+    new material with the same composition."""
+    fresh = openmc.Material()
+    if material.density_units == 'sum':
+        fresh.set_density('sum')
+    else:
+        fresh.set_density(material.density_units, material.density)
+    for nuclide, percent, percent_type in material.nuclides:
+        fresh.add_nuclide(nuclide.name, percent, percent_type)
+    for element, percent, percent_type, enrichment in material.elements:
+        fresh.add_element(element.name, percent, percent_type, enrichment)
+
+    result = densities(material)
+    expected = densities(fresh)
+    assert [n for n, _ in result] == [n for n, _ in expected]
+    assert np.allclose([d for _, d in result], [d for _, d in expected],
+                       rtol=1e-14, atol=0.)
+
+
+def write_library(path, nuclides):
+    """Write a cross_sections.xml file listing the given nuclides."""
+    with open(path, 'w') as fh:
+        fh.write('<?xml version="1.0"?>\n<cross_sections>\n')
+        for nuclide in nuclides:
+            fh.write('  <library materials="{0}" path="{0}.h5" '
+                     'type="neutron" />\n'.format(nuclide))
+        fh.write('</cross_sections>\n')
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure the
+    # atom densities of a material, which are kept between calls, follow every
+    # change to its composition and density.
+
+    library = os.environ.pop('OPENMC_CROSS_SECTIONS', None)
+
+    # Atom densities of water from its molar mass
+    water = openmc.Material()
+    water.set_density('g/cm3', 1.)
+    water.add_nuclide('H1', 2.)
+    water.add_nuclide('O16', 1.)
+    masses = [openmc.data.atomic_mass(n) for n in ('H1', 'O16')]
+    molecules = 1.e-24*openmc.data.AVOGADRO/(2.*masses[0] + masses[1])
+    result = densities(water)
+    assert [n for n, _ in result] == ['H1', 'O16']
+    assert np.allclose([d for _, d in result], [2.*molecules, molecules])
+
+    fuel = openmc.Material()
+    fuel.set_density('g/cm3', 10.4)
+    fuel.add_element('U', 1., enrichment=4.5)
+    fuel.add_element('O', 2.)
+    check_densities(fuel)
+
+    # Each change is followed after the densities have been computed
+    fuel.add_nuclide('Gd157', 0.01, 'wo')
+    check_densities(fuel)
+    fuel.set_density('atom/cm3', 7.e22)
+    check_densities(fuel)
+    fuel.set_density('atom/b-cm', 0.07)
+    check_densities(fuel)
+    fuel.remove_element('O')
+    check_densities(fuel)
+    fuel.add_element('O', 2., 'ao')
+    fuel.remove_nuclide('Gd157')
+    check_densities(fuel)
+    fuel.set_density('sum')
+    check_densities(fuel)
+    assert np.isclose(sum(d for _, d in densities(fuel)), 3.)
+
+    fuel.make_isotropic_in_lab()
+    assert all(nuc.scattering == 'iso-in-lab'
+               for nuc, _ in fuel.get_nuclide_atom_densities().values())
+
+    # A clone keeps its own densities
+    clone = fuel.clone()
+    assert densities(clone) == densities(fuel)
+    clone.set_density('atom/b-cm', 0.1)
+    check_densities(clone)
+    check_densities(fuel)
+    assert np.isclose(sum(d for _, d in densities(fuel)), 3.)
+
+    # Elements are expanded again when the cross section library changes
+    path = os.path.abspath('cross_sections.xml')
+    try:
+        write_library(path, ['O16'])
+        os.environ['OPENMC_CROSS_SECTIONS'] = path
+        oxygen = openmc.Material()
+        oxygen.set_density('atom/b-cm', 1.)
+        oxygen.add_element('O', 1.)
+        assert [n for n, _ in densities(oxygen)] == ['O16']
+
+        write_library(path, ['O16', 'O17'])
+        mtime = os.path.getmtime(path) + 10.
+        os.utime(path, (mtime, mtime))
+        oxygen.add_element('O', 1.)
+        result = densities(oxygen)
+        assert [n for n, _ in result] == ['O16', 'O17']
+        assert np.isclose(result[1][1], openmc.data.NATURAL_ABUNDANCE['O17'])
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+        if library is None:
+            os.environ.pop('OPENMC_CROSS_SECTIONS', None)
+        else:
+            os.environ['OPENMC_CROSS_SECTIONS'] = library
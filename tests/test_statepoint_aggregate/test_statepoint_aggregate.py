@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+
+import os
+import sys
+import glob
+import shutil
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPITestHarness
+import openmc
+from openmc.examples import slab_mg
+
+
+class StatePointAggregateTestHarness(PyAPITestHarness):
+    def __init__(self, *args, **kwargs):
+        super(StatePointAggregateTestHarness, self).__init__(*args, **kwargs)
+        self._seeds = [1, 2, 3]
+
+        mesh = openmc.Mesh()
+        mesh.type = 'regular'
+        mesh.dimension = [1, 1, 10]
+        mesh.lower_left = [0.0, 0.0, 0.0]
+        mesh.upper_right = [10, 10, 5]
+
+        mesh_tally = openmc.Tally()
+        mesh_tally.filters = [openmc.MeshFilter(mesh)]
+        mesh_tally.scores = ['flux', 'total', 'absorption']
+
+        material_tally = openmc.Tally()
+        material_tally.filters = [
+            openmc.MaterialFilter(self._model.materials),
+            openmc.EnergyFilter([0.0, 0.625, 20.0e6])]
+        material_tally.scores = ['flux', 'fission']
+
+        self._model.tallies = [mesh_tally, material_tally]
+
+    def _run_openmc(self):
+        # Run replicas of the model with different seeds, keeping a copy of
+        # the statepoint of each run
+        for seed in self._seeds:
+            self._model.settings.seed = seed
+            self._model.settings.export_to_xml()
+            super(StatePointAggregateTestHarness, self)._run_openmc()
+            shutil.copyfile(self._sp_name,
+                            'statepoint.seed{}.h5'.format(seed))
+
+        # Run a model with different tallies which cannot be aggregated
+        tallies = self._model.tallies
+        self._model.tallies = tallies[:1]
+        self._model.tallies.export_to_xml()
+        super(StatePointAggregateTestHarness, self)._run_openmc()
+        shutil.copyfile(self._sp_name, 'statepoint.other.h5')
+        self._model.tallies = tallies
+        self._model.tallies.export_to_xml()
+
+    def _get_results(self):
+        """Compare the aggregated tallies with the sums of the tallies of
+        each replica."""
+        paths = ['statepoint.seed{}.h5'.format(seed) for seed in self._seeds]
+
+        sums = {}
+        sums_sq = {}
+        n_realizations = {}
+        for path in paths:
+            with openmc.StatePoint(path) as sp:
+                for tally_id, tally in sp.tallies.items():
+                    sums[tally_id] = sums.get(tally_id, 0.) + tally.sum
+                    sums_sq[tally_id] = \
+                        sums_sq.get(tally_id, 0.) + tally.sum_sq
+                    n_realizations[tally_id] = \
+                        n_realizations.get(tally_id, 0) + \
+                        tally.num_realizations
+
+        tallies = openmc.StatePoint.aggregate(paths)
+        parallel_tallies = openmc.StatePoint.aggregate(paths, workers=2)
+
+        outstr = ''
+        for tally_id in sorted(tallies):
+            tally = tallies[tally_id]
+            parallel_tally = parallel_tallies[tally_id]
+            n = n_realizations[tally_id]
+            outstr += 'tally {}:\n'.format(tally_id)
+            outstr += 'realizations: {}\n'.format(tally.num_realizations)
+            outstr += 'sum: {}\n'.format(
+                np.allclose(tally.sum, sums[tally_id]))
+            outstr += 'sum_sq: {}\n'.format(
+                np.allclose(tally.sum_sq, sums_sq[tally_id]))
+            outstr += 'mean: {}\n'.format(
+                np.allclose(tally.mean, sums[tally_id]/n))
+            outstr += 'workers: {}\n'.format(
+                parallel_tally.num_realizations == n and
+                np.allclose(parallel_tally.sum, tally.sum) and
+                np.allclose(parallel_tally.sum_sq, tally.sum_sq))
+
+        # Statepoints with different tallies must be rejected
+        try:
+            openmc.StatePoint.aggregate(paths + ['statepoint.other.h5'])
+        except ValueError:
+            outstr += 'different tallies rejected\n'
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = StatePointAggregateTestHarness('statepoint.10.h5', slab_mg())
+    harness.main()
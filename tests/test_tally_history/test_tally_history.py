@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+
+import glob
+import os
+import sys
+sys.path.insert(0, os.pardir)
+from testing_harness import TestHarness
+import numpy as np
+import openmc
+
+
+class TallyHistoryTestHarness(TestHarness):
+    def __init__(self, final_sp, restart_sp, second_restart_sp):
+        super(TallyHistoryTestHarness, self).__init__(final_sp)
+        self._restart_sp = restart_sp
+        self._second_restart_sp = second_restart_sp
+
+    def execute_test(self):
+        """Run OpenMC, then restart it from an intermediate statepoint, and
+        check the tally history after each run. Finally, start a new history
+        with a restart and restart again from a later statepoint."""
+        try:
+            self._run_openmc()
+            self._test_output_created()
+            results = self._get_results()
+            with openmc.StatePoint(glob.glob(self._sp_name)[0]) as sp:
+                full_history = sp.tallies[1].history[...]
+
+            self._run_openmc_restart(self._restart_sp)
+            self._test_output_created()
+            results += self._get_results()
+
+            os.remove('tally_history.h5')
+            self._run_openmc_restart(self._restart_sp)
+            self._run_openmc_restart(self._second_restart_sp)
+            self._test_output_created()
+            results += self._get_restarted_history_results(full_history)
+
+            self._write_results(results)
+            self._compare_results()
+        finally:
+            self._cleanup()
+
+    def _run_openmc_restart(self, restart_sp):
+        statepoint = glob.glob(os.path.join(os.getcwd(), restart_sp))
+        assert len(statepoint) == 1
+        statepoint = statepoint[0]
+
+        if self._opts.mpi_exec is not None:
+            mpi_args = [self._opts.mpi_exec, '-n', self._opts.mpi_np]
+            returncode = openmc.run(restart_file=statepoint,
+                                    openmc_exec=self._opts.exe,
+                                    mpi_args=mpi_args)
+        else:
+            returncode = openmc.run(openmc_exec=self._opts.exe,
+                                    restart_file=statepoint)
+
+        assert returncode == 0, 'OpenMC did not exit successfully.'
+
+    def _test_output_created(self):
+        """Make sure the tally history file has been created."""
+        TestHarness._test_output_created(self)
+        assert os.path.exists('tally_history.h5'), \
+            'Tally history file does not exist.'
+
+    def _get_results(self):
+        """Check that the history of each batch adds up to the results
+        accumulated in the statepoint."""
+        statepoint = glob.glob(self._sp_name)[0]
+        with openmc.StatePoint(statepoint) as sp:
+            tally = sp.tallies[1]
+            history = tally.history[...]
+            first_batch = tally.history.parent.attrs['first_batch']
+
+            outstr = 'history shape: {}\n'.format(history.shape)
+            outstr += 'first batch: {}\n'.format(first_batch)
+            outstr += 'realizations: {}\n'.format(tally.num_realizations)
+            outstr += 'sum: {}\n'.format(
+                np.allclose(history.sum(axis=0), tally.sum))
+            outstr += 'sum_sq: {}\n'.format(
+                np.allclose((history**2).sum(axis=0), tally.sum_sq))
+            outstr += 'not recorded: {}\n'.format(sp.tallies[2].history)
+
+        return outstr
+
+    def _get_restarted_history_results(self, full_history):
+        """Check that a history started by a restart only holds the batches
+        run after that restart, each one only once."""
+        statepoint = glob.glob(self._sp_name)[0]
+        with openmc.StatePoint(statepoint) as sp:
+            tally = sp.tallies[1]
+            history = tally.history[...]
+            first_batch = tally.history.parent.attrs['first_batch']
+            skipped = first_batch - sp.n_inactive - 1
+
+            outstr = 'history shape: {}\n'.format(history.shape)
+            outstr += 'first batch: {}\n'.format(first_batch)
+            expected = full_history[skipped:]
+            outstr += 'batches: {}\n'.format(
+                history.shape == expected.shape and
+                np.allclose(history, expected))
+
+        return outstr
+
+    def _cleanup(self):
+        TestHarness._cleanup(self)
+        if os.path.exists('tally_history.h5'):
+            os.remove('tally_history.h5')
+
+
+if __name__ == '__main__':
+    harness = TallyHistoryTestHarness('statepoint.10.h5', 'statepoint.07.h5',
+                                      'statepoint.09.h5')
+    harness.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+from __future__ import division
+
+import os
+import sys
+import glob
+
+import numpy as np
+import scipy.sparse as sps
+
+sys.path.insert(0, os.pardir)
+from testing_harness import PyAPITestHarness
+import openmc
+from openmc.examples import slab_mg
+
+
+class TallySparseTestHarness(PyAPITestHarness):
+    def __init__(self, *args, **kwargs):
+        super(TallySparseTestHarness, self).__init__(*args, **kwargs)
+
+        mesh = openmc.Mesh()
+        mesh.type = 'regular'
+        mesh.dimension = [1, 1, 10]
+        mesh.lower_left = [0.0, 0.0, 0.0]
+        mesh.upper_right = [10, 10, 5]
+
+        mesh_tally = openmc.Tally(name='mesh tally')
+        mesh_tally.filters = [openmc.MeshFilter(mesh)]
+        mesh_tally.scores = ['flux', 'total', 'absorption']
+
+        # The fission rate is zero in the materials without fuel
+        material_tally = openmc.Tally(name='material tally')
+        material_tally.filters = [
+            openmc.MaterialFilter(self._model.materials),
+            openmc.EnergyFilter([0.0, 0.625, 20.0e6])]
+        material_tally.scores = ['flux', 'fission']
+
+        self._model.tallies = [mesh_tally, material_tally]
+
+    def _compare(self, name, sparse, dense, empty_zeros=False):
+        """Return whether a tally derived from sparse data is still sparse and
+        agrees with the same tally derived from dense data. If empty_zeros is
+        True, bins with a zero mean are left empty in the sparse data, while
+        their standard deviation is NaN in the dense data."""
+        stored = sparse._mean is not None and sps.isspmatrix_csr(sparse._mean)
+        agree = True
+        for value in ('mean', 'std_dev'):
+            sparse_value = getattr(sparse, value)
+            dense_value = getattr(dense, value)
+            if empty_zeros:
+                zero = dense.mean == 0.
+                agree &= np.all(sparse_value[zero] == 0.)
+                sparse_value = sparse_value[~zero]
+                dense_value = dense_value[~zero]
+            agree &= np.allclose(sparse_value, dense_value, equal_nan=True)
+        return '{}: sparse {}, agree {}\n'.format(
+            name, sparse.sparse and stored, agree)
+
+    def _get_results(self):
+        """Check operations on sparse tallies against dense tallies."""
+        statepoint = glob.glob(self._sp_name)[0]
+        outstr = ''
+        with openmc.StatePoint(statepoint) as sp_dense, \
+                openmc.StatePoint(statepoint) as sp_sparse:
+            sp_sparse.sparse = True
+
+            for name in ('mesh tally', 'material tally'):
+                dense = sp_dense.get_tally(name=name)
+                sparse = sp_sparse.get_tally(name=name)
+                outstr += '{}:\n'.format(name)
+
+                # Results read from the statepoint are stored as CSR matrices
+                stored = all(sps.isspmatrix_csr(sparse._get_data(value))
+                             for value in ('sum', 'sum_sq', 'mean', 'std_dev'))
+                agree = all(np.allclose(getattr(sparse, value),
+                                        getattr(dense, value))
+                            for value in ('sum', 'sum_sq', 'mean', 'std_dev'))
+                outstr += 'results: sparse {}, agree {}\n'.format(
+                    stored, agree)
+
+                filter_type = type(sparse.filters[0])
+                bins = tuple(sparse.filters[0].get_bin(i) for i in (0, 2))
+                for value in ('mean', 'std_dev', 'sum'):
+                    outstr += 'get_values {}: {}\n'.format(value, np.allclose(
+                        sparse.get_values(scores=['flux'],
+                                          filters=[filter_type],
+                                          filter_bins=[bins], value=value),
+                        dense.get_values(scores=['flux'],
+                                         filters=[filter_type],
+                                         filter_bins=[bins], value=value)))
+
+                # Slicing keeps all bins of a mesh filter, so the material
+                # tally is only sliced by energy
+                kwargs = {'scores': ['flux']}
+                if name == 'material tally':
+                    kwargs['filters'] = [openmc.EnergyFilter]
+                    kwargs['filter_bins'] = [((0.0, 0.625),)]
+                outstr += self._compare('get_slice',
+                                        sparse.get_slice(**kwargs),
+                                        dense.get_slice(**kwargs))
+
+                kwargs = {'filter_type': filter_type, 'remove_filter': True}
+                outstr += self._compare('summation',
+                                        sparse.summation(**kwargs),
+                                        dense.summation(**kwargs))
+                outstr += self._compare('average', sparse.average(**kwargs),
+                                        dense.average(**kwargs))
+
+                outstr += self._compare('scalar *', sparse * 2., dense * 2.)
+                outstr += self._compare('scalar /', sparse / 4., dense / 4.)
+                outstr += self._compare('power', sparse**2, dense**2,
+                                        empty_zeros=True)
+                outstr += self._compare('abs', abs(sparse), abs(dense))
+                outstr += self._compare('tally +', sparse + sparse,
+                                        dense + dense)
+                outstr += self._compare('tally -', sparse - sparse,
+                                        dense - dense)
+                outstr += self._compare('tally *', sparse * sparse,
+                                        dense * dense)
+                outstr += self._compare('tally /', sparse / sparse,
+                                        dense / dense)
+
+        return outstr
+
+
+if __name__ == '__main__':
+    harness = TallySparseTestHarness('statepoint.10.h5', slab_mg())
+    harness.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.model
+
+
+def check_centers(centers, expected):
+    """Make sure the centers packed in each container are identical."""
+    assert len(centers) == len(expected)
+    for c, e in zip(centers, expected):
+        assert np.array_equal(c, e)
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure
+    # openmc.model.pack_trisos_many() gives the same configuration in each
+    # container as openmc.model.pack_trisos() with the same seed, whether the
+    # containers are packed in one or several processes, and that the centers
+    # written to a file are read back unchanged.
+
+    radius = 0.0425
+    domains = [
+        {'domain_shape': 'cube', 'domain_length': 0.8},
+        {'domain_shape': 'cylinder', 'domain_length': 0.8,
+         'domain_radius': 0.3, 'domain_center': (1., 2., 3.)},
+        {'domain_shape': 'sphere', 'domain_radius': 0.3},
+        {'domain_shape': 'cube', 'domain_length': 0.8,
+         'packing_fraction': 0.1},
+        {'domain_shape': 'cube', 'domain_length': 0.8, 'method': 'fast'}
+    ]
+    seeds = [1, 2, 3, 1, 4]
+    kwargs = {'radius': radius, 'packing_fraction': 0.35}
+
+    # Reference configurations packed one container at a time
+    fill = openmc.Universe()
+    expected = []
+    for domain, seed in zip(domains, seeds):
+        args = dict(kwargs)
+        args.update(domain)
+        trisos = openmc.model.pack_trisos(fill=fill, seed=seed, **args)
+        expected.append(np.array([t.center for t in trisos]))
+
+    check_centers(openmc.model.pack_trisos_many(domains, seeds, processes=1,
+                                                **kwargs), expected)
+    check_centers(openmc.model.pack_trisos_many(domains, seeds, processes=3,
+                                                **kwargs), expected)
+
+    # Centers written to a file are read back in order or by container
+    path = 'trisos.h5'
+    try:
+        assert openmc.model.pack_trisos_many(domains, seeds, processes=2,
+                                             path=path, **kwargs) is None
+        check_centers(openmc.model.read_triso_centers(path), expected)
+        assert np.array_equal(openmc.model.read_triso_centers(path, 2),
+                              expected[2])
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    # A seed is needed for every container
+    try:
+        openmc.model.pack_trisos_many(domains, seeds[:-1], **kwargs)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('Missing seed was not rejected')
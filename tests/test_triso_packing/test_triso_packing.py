@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.pardir)
+sys.path.insert(0, os.path.join(os.pardir, os.pardir))
+import openmc
+import openmc.model
+
+
+def pack(method, seed, radius, length):
+    """Pack a cube with TRISO particles and return the distance between the
+    center of each particle and its nearest neighbor."""
+    trisos = openmc.model.pack_trisos(
+        radius=radius, fill=openmc.Universe(), domain_shape='cube',
+        domain_length=length, domain_center=(0., 0., 0.),
+        packing_fraction=0.4, seed=seed, method=method)
+    centers = np.array([t.center for t in trisos])
+    assert abs(len(centers)*4./3.*np.pi*radius**3/length**3 - 0.4) < 0.01
+
+    # Particles must not extend outside of the cube
+    assert np.all(np.abs(centers) <= 0.5*length - radius + 1e-10), \
+        'Particles outside of domain with {} method'.format(method)
+
+    d = np.linalg.norm(centers[:, None] - centers[None, :], axis=-1)
+    d[np.diag_indices_from(d)] = np.inf
+    return d.min(axis=1)
+
+
+if __name__ == '__main__':
+    # This test doesn't require an OpenMC run.  We just need to make sure the
+    # fast close random packing gives particle configurations with the same
+    # nearest neighbor distances as the standard Jodrey-Tory algorithm.
+
+    radius = 0.0425
+    length = 0.8
+    distances = {}
+    for method in ('standard', 'fast'):
+        distances[method] = np.concatenate(
+            [pack(method, seed, radius, length) for seed in (1, 2)])
+
+        # Particles must not overlap
+        assert distances[method].min() >= 2*radius*(1 - 1e-10), \
+            'Overlapping particles packed with {} method'.format(method)
+
+    # The distributions of the nearest neighbor distances vary by about 1%
+    # between packings with different seeds
+    standard = distances['standard']
+    fast = distances['fast']
+    assert len(standard) == len(fast)
+    assert np.isclose(fast.mean(), standard.mean(), rtol=0.01), \
+        'Mean nearest neighbor distances differ: {} and {}'.format(
+            standard.mean(), fast.mean())
+    for q in (10, 50, 90):
+        assert np.isclose(np.percentile(fast, q), np.percentile(standard, q),
+                          rtol=0.02), \
+            '{}th percentiles of nearest neighbor distances differ'.format(q)